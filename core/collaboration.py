@@ -8,11 +8,13 @@ import json
 import uuid
 import sqlite3
 from typing import Dict, List, Optional, Tuple, Any
+from collections import Counter
 from datetime import datetime
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 import hashlib
 import threading
+import time
 import logging
 
 logger = logging.getLogger(__name__)
@@ -107,10 +109,14 @@ class TaskAssignment:
 class CollaborationManager:
     """Manages team collaboration features"""
     
+    # Seconds a team member looked up by email is served from memory
+    MEMBER_CACHE_TTL = 60
+    
     def __init__(self, db_path: str = "collaboration.db"):
         self.db_path = db_path
         self.connection = None
         self.lock = threading.Lock()
+        self._member_cache: Dict[str, Tuple[float, TeamMember]] = {}
         self._init_database()
         
     def _init_database(self):
@@ -232,10 +238,40 @@ class CollaborationManager:
                     json.dumps(member.permissions)
                 ))
                 conn.commit()
+            self._member_cache[member.email] = (time.monotonic(), member)
                 
         self._log_activity(member.id, "user_created", "team_member", member.id)
         return member
     
+    def get_team_member_by_email(self, email: str) -> Optional[TeamMember]:
+        """Get a team member by email, cached for MEMBER_CACHE_TTL seconds"""
+        cached = self._member_cache.get(email)
+        if cached and time.monotonic() - cached[0] < self.MEMBER_CACHE_TTL:
+            return cached[1]
+            
+        with sqlite3.connect(self.db_path) as conn:
+            row = conn.execute("""
+                SELECT id, username, email, role, created_at, last_active, permissions
+                FROM team_members
+                WHERE email = ?
+            """, (email,)).fetchone()
+            
+        if not row:
+            self._member_cache.pop(email, None)
+            return None
+            
+        member = TeamMember(
+            id=row[0],
+            username=row[1],
+            email=row[2],
+            role=row[3],
+            created_at=datetime.fromisoformat(row[4]),
+            last_active=datetime.fromisoformat(row[5]),
+            permissions=json.loads(row[6])
+        )
+        self._member_cache[email] = (time.monotonic(), member)
+        return member
+    
     def create_project(self, name: str, description: str, target: str, 
                       scope: List[str], created_by: str, 
                       bounty_program: Optional[str] = None) -> Project:
@@ -468,8 +504,8 @@ class CollaborationManager:
                 
         return tasks
     
-    def get_activity_log(self, limit: int = 50) -> List[Dict]:
-        """Get recent activity log"""
+    def get_activity_log(self, limit: int = 50, offset: int = 0) -> List[Dict]:
+        """Get recent activity log, newest first, skipping the first `offset` entries"""
         activities = []
         with sqlite3.connect(self.db_path) as conn:
             cursor = conn.execute("""
@@ -478,12 +514,12 @@ class CollaborationManager:
                 FROM activity_log al
                 JOIN team_members tm ON al.user_id = tm.id
                 ORDER BY al.id DESC
-                LIMIT ?
-            """, (limit,))
+                LIMIT ? OFFSET ?
+            """, (limit, offset))
             
             for row in cursor:
                 activity = {
-                    "timestamp": row[0],
+                    "timestamp": datetime.fromisoformat(row[0]),
                     "user_id": row[1],
                     "username": row[2],
                     "action": row[3],
@@ -518,6 +554,10 @@ class CollaborationManager:
             )
             tasks = cursor.fetchall()
             
+            # Tally severities in one pass rather than rescanning per level
+            severity_counts = Counter(f.severity for f in findings)
+            completed_tasks = sum(1 for t in tasks if t[8] == "completed")
+            
             # Build report
             report = {
                 "project": {
@@ -532,13 +572,13 @@ class CollaborationManager:
                 "findings": [f.to_dict() for f in findings],
                 "statistics": {
                     "total_findings": len(findings),
-                    "critical": len([f for f in findings if f.severity == "critical"]),
-                    "high": len([f for f in findings if f.severity == "high"]),
-                    "medium": len([f for f in findings if f.severity == "medium"]),
-                    "low": len([f for f in findings if f.severity == "low"]),
-                    "info": len([f for f in findings if f.severity == "info"]),
+                    "critical": severity_counts["critical"],
+                    "high": severity_counts["high"],
+                    "medium": severity_counts["medium"],
+                    "low": severity_counts["low"],
+                    "info": severity_counts["info"],
                     "total_tasks": len(tasks),
-                    "completed_tasks": len([t for t in tasks if t[8] == "completed"])
+                    "completed_tasks": completed_tasks
                 },
                 "exported_at": datetime.now().isoformat()
             }
@@ -12,9 +12,14 @@ from dataclasses import dataclass, field, asdict
 from pathlib import Path
 import hashlib
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
+# Seconds a user's pending-notice list is reused before re-reading the database,
+# so acknowledgments written by other trackers or processes show up
+UNACK_CACHE_TTL = 5.0
+
 
 @dataclass
 class ComplianceRule:
@@ -94,6 +99,9 @@ class ComplianceTracker:
     
     def __init__(self, db_path: str = "compliance.db"):
         self.db_path = db_path
+        # user_id -> (loaded at, {notice_id: notice} still awaiting that user's
+        # acknowledgment); kept current by this tracker's writes, reloaded after UNACK_CACHE_TTL
+        self._unack_by_user: Dict[str, Tuple[float, Dict[str, LegalNotice]]] = {}
         self._init_database()
         self._load_default_rules()
         
@@ -475,6 +483,10 @@ class ComplianceTracker:
             ))
             conn.commit()
             
+        if notice.requires_acknowledgment:
+            for _, pending in self._unack_by_user.values():
+                pending[notice.id] = notice
+            
         return notice
     
     def acknowledge_notice(self, notice_id: str, user_id: str,
@@ -492,9 +504,18 @@ class ComplianceTracker:
                 ip_address
             ))
             conn.commit()
+            
+        cached = self._unack_by_user.get(user_id)
+        if cached is not None:
+            cached[1].pop(notice_id, None)
     
     def get_unacknowledged_notices(self, user_id: str) -> List[LegalNotice]:
         """Get legal notices that user hasn't acknowledged"""
+        now = time.monotonic()
+        cached = self._unack_by_user.get(user_id)
+        if cached is not None and now - cached[0] <= UNACK_CACHE_TTL:
+            return list(cached[1].values())
+            
         notices = []
         
         with sqlite3.connect(self.db_path) as conn:
@@ -518,6 +539,7 @@ class ComplianceTracker:
                 )
                 notices.append(notice)
                 
+        self._unack_by_user[user_id] = (now, {n.id: n for n in notices})
         return notices
     
     def generate_compliance_report(self, project_id: str) -> Dict[str, Any]:
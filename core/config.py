@@ -82,6 +82,7 @@ class Config:
             "show_ascii_art": True,
             "show_status_bar": True,
             "color_theme": "default",
+            "simulate_progress": False,
             
             # Logging-Einstellungen
             "debug_level": 1,
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ChromSploit Framework v2.0
+Shared JSON serialization, using orjson when it is installed
+
+Both backends produce the same documents: non-string keys are allowed,
+datetimes are written in ISO format and other values JSON does not know
+(Path, enums, ...) are written via str().
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _default(obj: Any) -> str:
+    """Fallback for values JSON cannot encode; ISO format for dates like orjson"""
+    isoformat = getattr(obj, 'isoformat', None)
+    return isoformat() if callable(isoformat) else str(obj)
+
+
+# Encoders for the json fallback; iterencode() lets dump() stream to disk
+_COMPACT_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False, default=_default)
+_INDENT_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=False, default=_default)
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, compact unless indent is set"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=_default, option=option)
+    encoder = _INDENT_ENCODER if indent else _COMPACT_ENCODER
+    return encoder.encode(obj).encode('utf-8')
+
+
+def dump(obj: Any, path: str, indent: bool = False) -> None:
+    """Write obj as JSON to path without holding a second encoded copy in memory"""
+    if ORJSON_AVAILABLE:
+        with open(path, 'wb') as f:
+            f.write(dumps(obj, indent))
+        return
+    encoder = _INDENT_ENCODER if indent else _COMPACT_ENCODER
+    with open(path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        for chunk in encoder.iterencode(obj):
+            f.write(chunk)
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON bytes or text"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
@@ -18,6 +18,9 @@ from core.enhanced_logger import get_logger
 from core.error_handler import handle_errors, ErrorContext
 from core.colors import Colors
 
+# Seconds start_auto_sync() waits for a previous sync worker to wind down
+SYNC_STOP_TIMEOUT = 2.0
+
 @dataclass
 class NgrokTunnel:
     """Represents an active ngrok tunnel"""
@@ -54,6 +57,7 @@ class NgrokManager:
         self.active_tunnels: Dict[str, NgrokTunnel] = {}
         self.auto_sync_enabled = False
         self.sync_thread = None
+        self._sync_stop = threading.Event()
         self.external_target_mode = False
         self.registered_cve_handlers = {}
         
@@ -273,37 +277,54 @@ class NgrokManager:
         except Exception as e:
             self.logger.error(f"Failed to update simulation engine: {str(e)}")
     
-    def start_auto_sync(self, interval: int = 10):
+    def start_auto_sync(self, interval: int = 10) -> bool:
         """
         Start automatic tunnel synchronization
         
         Args:
             interval: Sync interval in seconds
+            
+        Returns:
+            False if a previous sync worker is still stopping and no new
+            worker was started, True otherwise
         """
         if self.auto_sync_enabled:
-            return
+            return True
+        
+        # A previous worker may still be inside a sync pass; give it a short
+        # grace period rather than blocking the caller until it finishes
+        if self.sync_thread and self.sync_thread.is_alive():
+            self._sync_stop.set()
+            self.sync_thread.join(timeout=SYNC_STOP_TIMEOUT)
+            if self.sync_thread.is_alive():
+                self.logger.warning("Previous auto-sync worker is still stopping; not starting a new one")
+                return False
         
         self.auto_sync_enabled = True
+        # Each worker gets its own stop event so a restarted sync never
+        # shares the loop condition with a worker that is still winding down
+        stop = self._sync_stop = threading.Event()
         
         def sync_worker():
-            while self.auto_sync_enabled:
+            while not stop.is_set():
                 try:
                     tunnels = self.get_active_tunnels()
                     if self.external_target_mode:
                         for tunnel in tunnels:
                             self._sync_tunnel_to_cve_configs(tunnel)
-                    time.sleep(interval)
                 except Exception as e:
                     self.logger.error(f"Error in auto-sync: {str(e)}")
-                    time.sleep(interval)
+                stop.wait(interval)
         
         self.sync_thread = threading.Thread(target=sync_worker, daemon=True)
         self.sync_thread.start()
         self.logger.info(f"Started auto-sync every {interval} seconds")
+        return True
     
     def stop_auto_sync(self):
         """Stop automatic tunnel synchronization"""
         self.auto_sync_enabled = False
+        self._sync_stop.set()
         if self.sync_thread:
             self.sync_thread.join(timeout=1)
         self.logger.info("Stopped auto-sync")
@@ -7,7 +7,7 @@ Automated combination of all 4 browser CVEs for comprehensive exploitation
 
 import time
 import threading
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime
 import logging
 
@@ -204,6 +204,10 @@ class BrowserExploitChain:
  self.active_chains: Dict[str, Any] = {}
  self.results: Dict[str, Any] = {}
  
+ # Per-chain progress listeners (see subscribe())
+ self._subscribers: Dict[str, List[Callable]] = {}
+ self._subscribers_lock = threading.Lock()
+ 
  # Initialize obfuscation and ngrok if available
  self.payload_obfuscator = PayloadObfuscator() if OBFUSCATION_AVAILABLE else None
  self.ngrok_manager = NgrokManager() if NGROK_AVAILABLE else None
@@ -387,6 +391,7 @@ class BrowserExploitChain:
  
  chain = self.active_chains[chain_id]['chain']
  chain.stop()
+ self._notify(chain_id)
  
  try:
  logger.warning(f"{Colors.YELLOW}[Browser Chain]{Colors.END} Stopped chain: {chain_id[:8]}...")
@@ -395,6 +400,30 @@ class BrowserExploitChain:
  
  return True
  
+ def subscribe(self, chain_id: str, callback: Callable):
+ """Register a callback invoked with the chain ID whenever its progress changes"""
+ with self._subscribers_lock:
+ self._subscribers.setdefault(chain_id, []).append(callback)
+ 
+ def unsubscribe(self, chain_id: str, callback: Callable):
+ """Remove a previously registered progress callback"""
+ with self._subscribers_lock:
+ callbacks = self._subscribers.get(chain_id, [])
+ if callback in callbacks:
+ callbacks.remove(callback)
+ if not callbacks:
+ self._subscribers.pop(chain_id, None)
+ 
+ def _notify(self, chain_id: str):
+ """Wake up everyone watching a chain"""
+ with self._subscribers_lock:
+ callbacks = list(self._subscribers.get(chain_id, []))
+ for callback in callbacks:
+ try:
+ callback(chain_id)
+ except Exception as e:
+ logger.error(f"Error in chain subscriber: {e}")
+ 
  def get_all_chains(self) -> List[Dict[str, Any]]:
  """Get information about all browser chains"""
  
@@ -429,6 +458,7 @@ class BrowserExploitChain:
  logger.info(f"{Colors.BLUE}[Browser Chain]{Colors.END} Step completed in {execution_time:.2f}s")
  except:
  logger.info(f"Step completed in {execution_time:.2f}s")
+ self._notify(chain.id)
  
  def _on_step_success(self, chain: ExploitChain, step):
  """Callback on step success"""
@@ -597,6 +627,7 @@ class BrowserExploitChain:
  except Exception as e:
  failed_cves.append(cve_id)
  logger.error(f"Simulated failure of {cve_id}: {e}")
+ self._notify(chain_id)
  
  chain_info['status'] = 'completed' if len(successful_cves) > 0 else 'failed'
  
@@ -616,6 +647,7 @@ class BrowserExploitChain:
  }
  
  self.results[chain_id] = result
+ self._notify(chain_id)
  return result
  
  except Exception as e:
@@ -676,6 +708,7 @@ class BrowserExploitChain:
  return False
  
  self.active_chains[chain_id]['status'] = 'stopped'
+ self._notify(chain_id)
  return True
 
 # Quick access functions
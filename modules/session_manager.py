@@ -10,7 +10,7 @@ import json
 import time
 import threading
 import subprocess
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Iterator
 from datetime import datetime
 from abc import ABC, abstractmethod
 
@@ -292,6 +292,10 @@ class SessionManager:
         self.sessions: Dict[str, Session] = {}
         self.update_thread = None
         self.running = False
+        # Bumped by the monitor thread whenever a previously unknown session
+        # appears; waiters compare it against a snapshot (see wait_for_new_session)
+        self._session_generation = 0
+        self._new_session = threading.Condition()
         
         # Initialize available frameworks
         self._initialize_frameworks()
@@ -328,6 +332,8 @@ class SessionManager:
     def stop_monitoring(self):
         """Stop monitoring sessions"""
         self.running = False
+        with self._new_session:
+            self._new_session.notify_all()
         if self.update_thread:
             self.update_thread.join(timeout=5)
         self.logger.info("Session monitoring stopped")
@@ -348,7 +354,12 @@ class SessionManager:
                         self.logger.error(f"Error getting sessions from {name}: {e}")
                 
                 # Update session list
+                has_new = bool(all_sessions.keys() - self.sessions.keys())
                 self.sessions = all_sessions
+                if has_new:
+                    with self._new_session:
+                        self._session_generation += 1
+                        self._new_session.notify_all()
                 
                 # Mark inactive sessions
                 for session_key, session in self.sessions.items():
@@ -366,6 +377,41 @@ class SessionManager:
         """Get all active sessions"""
         return [s for s in self.sessions.values() if s.active]
     
+    def iter_sessions(self) -> Iterator[Session]:
+        """Iterate over active sessions without building a list"""
+        sessions = self.sessions
+        return (s for s in sessions.values() if s.active)
+    
+    def active_count(self) -> int:
+        """Get the number of active sessions"""
+        return sum(1 for s in self.sessions.values() if s.active)
+    
+    def session_generation(self) -> int:
+        """Snapshot for wait_for_new_session(); changes whenever a new session appears"""
+        return self._session_generation
+    
+    def wait_for_new_session(self, timeout: float, since: int) -> bool:
+        """
+        Wait until a session newer than a session_generation() snapshot appears
+        
+        Returns at once if one already has, or if monitoring is not running
+        (nothing would report a new session).
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            since: Value of session_generation() taken before the wait was needed
+            
+        Returns:
+            True if a new session appeared since the snapshot
+        """
+        with self._new_session:
+            if self.running:
+                self._new_session.wait_for(
+                    lambda: self._session_generation != since or not self.running,
+                    timeout
+                )
+            return self._session_generation != since
+    
     def get_session(self, session_key: str) -> Optional[Session]:
         """Get a specific session"""
         return self.sessions.get(session_key)
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ChromSploit Framework v2.0
+Tests for browser chain progress subscriptions
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from tests.test_base import TestBase
+
+import modules.browser_exploit_chain as browser_exploit_chain
+from modules.browser_exploit_chain import BrowserExploitChain
+
+class TestChainSubscriptions(TestBase):
+    """Test subscribe/unsubscribe and progress notification"""
+
+    @pytest.fixture
+    def chain(self):
+        """Browser chain built without the chain manager, obfuscator or ngrok"""
+        with patch.object(browser_exploit_chain, 'CHAIN_AVAILABLE', False), \
+             patch.object(browser_exploit_chain, 'OBFUSCATION_AVAILABLE', False), \
+             patch.object(browser_exploit_chain, 'NGROK_AVAILABLE', False):
+            return BrowserExploitChain()
+
+    def test_notify_delivers_chain_id(self, chain):
+        """Test every subscriber of a chain is called with its ID"""
+        first, second = Mock(), Mock()
+        chain.subscribe("chain-1", first)
+        chain.subscribe("chain-1", second)
+
+        chain._notify("chain-1")
+
+        first.assert_called_once_with("chain-1")
+        second.assert_called_once_with("chain-1")
+
+    def test_notify_only_reaches_that_chain(self, chain):
+        """Test subscribers of other chains are not called"""
+        other = Mock()
+        chain.subscribe("chain-2", other)
+
+        chain._notify("chain-1")
+
+        other.assert_not_called()
+
+    def test_unsubscribe_stops_delivery(self, chain):
+        """Test an unsubscribed callback is no longer called"""
+        callback = Mock()
+        chain.subscribe("chain-1", callback)
+        chain.unsubscribe("chain-1", callback)
+
+        chain._notify("chain-1")
+
+        callback.assert_not_called()
+
+    def test_unsubscribe_keeps_other_callbacks(self, chain):
+        """Test unsubscribing one callback leaves the rest registered"""
+        kept, removed = Mock(), Mock()
+        chain.subscribe("chain-1", kept)
+        chain.subscribe("chain-1", removed)
+        chain.unsubscribe("chain-1", removed)
+
+        chain._notify("chain-1")
+
+        kept.assert_called_once_with("chain-1")
+        removed.assert_not_called()
+
+    def test_unsubscribe_unknown_callback(self, chain):
+        """Test unsubscribing something never registered is a no-op"""
+        callback = Mock()
+        chain.subscribe("chain-1", callback)
+        chain.unsubscribe("chain-1", Mock())
+        chain.unsubscribe("chain-2", Mock())
+
+        chain._notify("chain-1")
+
+        callback.assert_called_once_with("chain-1")
+
+    def test_failing_subscriber_does_not_block_others(self, chain):
+        """Test an exception in one subscriber still notifies the rest"""
+        failing = Mock(side_effect=RuntimeError("boom"))
+        callback = Mock()
+        chain.subscribe("chain-1", failing)
+        chain.subscribe("chain-1", callback)
+
+        chain._notify("chain-1")
+
+        callback.assert_called_once_with("chain-1")
+
+    def test_subscriber_may_unsubscribe_during_notify(self, chain):
+        """Test a callback can unsubscribe itself while being notified"""
+        calls = []
+
+        def once(chain_id):
+            calls.append(chain_id)
+            chain.unsubscribe(chain_id, once)
+
+        chain.subscribe("chain-1", once)
+        chain._notify("chain-1")
+        chain._notify("chain-1")
+
+        assert calls == ["chain-1"]
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ChromSploit Framework v2.0
+Tests for collaboration activity log paging
+"""
+
+import os
+import pytest
+from tests.test_base import TestBase
+
+from core.collaboration import CollaborationManager
+
+class TestActivityLogPaging(TestBase):
+    """Test limit/offset paging of the activity log"""
+
+    @pytest.fixture
+    def manager(self):
+        """Collaboration manager with one member and five logged actions"""
+        manager = CollaborationManager(db_path=os.path.join(self.temp_dir, "collab.db"))
+        member = manager.add_team_member("alice", "alice@example.com")
+        for i in range(5):
+            manager._log_activity(member.id, "finding_created", "finding", f"finding-{i}")
+        return manager
+
+    def test_newest_first(self, manager):
+        """Test entries come back newest first"""
+        activities = manager.get_activity_log(limit=10)
+
+        assert len(activities) == 6
+        assert activities[0]["resource_id"] == "finding-4"
+        assert activities[-1]["action"] == "user_created"
+
+    def test_offset_skips_entries(self, manager):
+        """Test offset continues where the previous page stopped"""
+        first = manager.get_activity_log(limit=2)
+        second = manager.get_activity_log(limit=2, offset=2)
+
+        assert [a["resource_id"] for a in first] == ["finding-4", "finding-3"]
+        assert [a["resource_id"] for a in second] == ["finding-2", "finding-1"]
+
+    def test_offset_past_end(self, manager):
+        """Test an offset beyond the log returns no entries"""
+        assert manager.get_activity_log(limit=2, offset=10) == []
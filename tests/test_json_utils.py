@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ChromSploit Framework v2.0
+Tests for shared JSON serialization
+"""
+
+import os
+import pytest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+from tests.test_base import TestBase
+
+from core import json_utils
+
+PAYLOAD = {
+    "when": datetime(2026, 1, 2, 3, 4, 5),
+    1: "int key",
+    "path": Path("reports/out.json"),
+    "text": "Größe"
+}
+
+EXPECTED = {
+    "when": "2026-01-02T03:04:05",
+    "1": "int key",
+    "path": "reports/out.json",
+    "text": "Größe"
+}
+
+class TestJsonUtils(TestBase):
+    """Test dumps/dump/loads with and without orjson"""
+
+    @pytest.fixture(params=[True, False], ids=["orjson", "json"])
+    def backend(self, request):
+        """Run a test once per backend available here"""
+        if request.param and not json_utils.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        with patch.object(json_utils, 'ORJSON_AVAILABLE', request.param):
+            yield request.param
+
+    def test_dumps_round_trip(self, backend):
+        """Test non-string keys, datetimes and paths serialize"""
+        assert json_utils.loads(json_utils.dumps(PAYLOAD)) == EXPECTED
+
+    def test_dumps_indent(self, backend):
+        """Test indent produces a two-space indented document"""
+        text = json_utils.dumps({"a": 1}, indent=True).decode('utf-8')
+
+        assert text == '{\n  "a": 1\n}'
+
+    def test_dump_writes_file(self, backend):
+        """Test dump writes the same document to disk"""
+        path = os.path.join(self.temp_dir, "out.json")
+        json_utils.dump(PAYLOAD, path, indent=True)
+
+        with open(path, 'rb') as f:
+            assert json_utils.loads(f.read()) == EXPECTED
+
+    def test_backends_agree(self):
+        """Test both backends write identical bytes"""
+        if not json_utils.ORJSON_AVAILABLE:
+            pytest.skip("orjson not installed")
+        fast = json_utils.dumps(PAYLOAD, indent=True)
+        with patch.object(json_utils, 'ORJSON_AVAILABLE', False):
+            fallback = json_utils.dumps(PAYLOAD, indent=True)
+
+        assert fast == fallback
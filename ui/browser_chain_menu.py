@@ -6,13 +6,23 @@ UI for managing and executing multi-CVE browser exploitation chains
 """
 
 import os
+import sys
 import time
-import json
-from typing import Dict, Any, Optional
+import queue
+import select
+import threading
+from contextlib import contextmanager
+from typing import Dict, Any, List, Optional
 from core.enhanced_menu import EnhancedMenu
 from core.colors import Colors
 from core.enhanced_logger import get_logger
+from core import json_utils
 from modules.browser_exploit_chain import BrowserExploitChain
+try:
+ import termios
+ import tty
+except ImportError: # Windows
+ termios = None
 try:
  from modules.browser_exploit_chain_enhanced import EnhancedBrowserExploitChain, execute_enhanced_browser_attack
  ENHANCED_CHAIN_AVAILABLE = True
@@ -21,131 +31,183 @@ except ImportError:
 
 logger = get_logger()
 
+CONFIG_FILE = 'config/browser_chain_config.json'
+
+DEFAULT_CONFIG = {
+ 'target_url': 'http://localhost:8080',
+ 'callback_ip': '127.0.0.1',
+ 'callback_port': 4444,
+ 'timeout': 300
+}
+
+# How long a get_all_chains() snapshot is reused across menu actions (seconds)
+CHAIN_CACHE_TTL = 0.5
+
+# Result display headers
+_EXECUTION_RESULTS_HEADER = f"\n{Colors.CYAN}Execution Results:{Colors.RESET}\n{'=' * 60}\n"
+_ENHANCED_RESULTS_HEADER = f"\n{Colors.CYAN}Enhanced Attack Results:{Colors.RESET}\n{'=' * 60}\n"
+
+# Display titles for enhanced-feature keys, filled in as keys are seen
+_FEATURE_TITLES: Dict[str, str] = {}
+
+# Every possible progress bar, indexed by the number of filled cells
+_BAR_LENGTH = 50
+_BARS = tuple('█' * i + '░' * (_BAR_LENGTH - i) for i in range(_BAR_LENGTH + 1))
+
+# Feature/sequence overview shown before the enhanced attack, formatted once
+_ENHANCED_BANNER = f"""
+{Colors.YELLOW}Enhanced features enabled:{Colors.RESET}
+ Full payload obfuscation (EXTREME level)
+ Control flow obfuscation
+ String encryption & encoding
+ Anti-debugging & Anti-VM
+ Polymorphic code generation
+ Auto-ngrok tunnel creation
+ Binary data obfuscation
+ Dead code injection
+
+{Colors.CYAN}Attack sequence:{Colors.RESET}
+1. Setup ngrok tunnels for callbacks
+2. Obfuscate all exploit payloads
+3. Execute CVE-2025-4664 (Recon)
+4. Execute CVE-2025-2857 (OAuth)
+5. Execute CVE-2025-30397 (WebAssembly)
+6. Execute CVE-2025-2783 (Sandbox Escape)
+"""
+
+# Legacy Windows consoles don't understand ANSI clear sequences
+_LEGACY_CONSOLE = os.name == 'nt' and not os.environ.get('WT_SESSION')
+
+@contextmanager
+def _cbreak_stdin():
+ """Let single keypresses through stdin without waiting for Enter"""
+ if termios is None or not sys.stdin.isatty():
+ yield
+ return
+ fd = sys.stdin.fileno()
+ saved = termios.tcgetattr(fd)
+ try:
+ tty.setcbreak(fd)
+ yield
+ finally:
+ termios.tcsetattr(fd, termios.TCSADRAIN, saved)
+
+def _kbhit(timeout: float = 0) -> bool:
+ """Wait up to timeout seconds for a keypress, consuming it if one arrives"""
+ if os.name == 'nt':
+ import msvcrt
+ deadline = time.monotonic() + timeout
+ while not msvcrt.kbhit():
+ if time.monotonic() >= deadline:
+ return False
+ time.sleep(0.05)
+ msvcrt.getwch()
+ return True
+ 
+ if not sys.stdin.isatty():
+ time.sleep(timeout)
+ return False
+ 
+ ready, _, _ = select.select([sys.stdin], [], [], timeout)
+ if ready:
+ os.read(sys.stdin.fileno(), 1)
+ return bool(ready)
+
 class BrowserChainMenu(EnhancedMenu):
  """Menu for browser exploit chain operations"""
  
- def __init__(self):
- super().__init__(title="Browser Multi-Exploit Chain")
- self.set_description("Automated browser CVE combination attacks")
- 
- self.browser_chain = BrowserExploitChain()
- self.active_chain_id: Optional[str] = None
- 
- # Define menu items
- self._add_menu_items()
- 
- def _add_menu_items(self):
- """Add browser chain menu items"""
- 
- # Quick launch options
- self.add_enhanced_item(
- ' Quick Full Browser Compromise',
- self.quick_full_compromise,
- color=Colors.BRIGHT_GREEN,
- description='Execute all 4 browser CVEs automatically',
- shortcut='f',
- key='1'
- )
- 
- if ENHANCED_CHAIN_AVAILABLE:
- self.add_enhanced_item(
- ' Enhanced Attack (Obfuscation + Ngrok)',
- self.enhanced_full_compromise,
- color=Colors.BRIGHT_RED,
- description='Full attack with obfuscation and auto-ngrok tunneling',
- shortcut='e',
- key='2'
- )
- 
- self.add_enhanced_item(
- ' Chrome-Focused Attack',
- self.chrome_focused_attack,
- color=Colors.BRIGHT_YELLOW,
- description='Target Chrome browser with 3 CVEs',
- shortcut='c',
- key='3'
- )
+ _STATUS_COLORS = {
+ 'success': Colors.GREEN,
+ 'failed': Colors.RED,
+ 'running': Colors.YELLOW,
+ 'pending': Colors.BLUE,
+ 'stopped': Colors.MAGENTA,
+ 'partial': Colors.CYAN
+ }
  
- self.add_enhanced_item(
- ' Rapid Parallel Exploitation',
- self.rapid_exploitation,
- color=Colors.BRIGHT_CYAN,
- description='Fast parallel execution of all exploits',
- shortcut='r',
- key='4'
+ # Fully colorized status labels, built once
+ _STATUS_DISPLAY = {s: f"{c}{s}{Colors.RESET}" for s, c in _STATUS_COLORS.items()}
+ 
+ # Render templates: the colored decoration is formatted once, only the
+ # value is interpolated per render
+ _FMT_CHAIN_ID = f"\nID: {Colors.BLUE}{{}}...{Colors.RESET}"
+ _FMT_SUCCESSFUL = f" Successful: {Colors.GREEN}{{}}{Colors.RESET}"
+ _FMT_FAILED = f" Failed: {Colors.RED}{{}}{Colors.RESET}"
+ _MONITOR_HEADER = (
+ "",
+ f"{Colors.CYAN}{'=' * 60}{Colors.RESET}",
+ f"{Colors.BRIGHT_WHITE} Chain Progress Monitor{Colors.RESET}",
+ f"{Colors.CYAN}{'=' * 60}{Colors.RESET}",
+ ""
  )
  
- self.add_enhanced_item(
- ' Stealth Browser Chain',
- self.stealth_exploitation,
- color=Colors.BRIGHT_MAGENTA,
- description='Low-profile exploitation chain',
- shortcut='s',
- key='5'
- )
+ # (label, method, color, description, shortcut, key, needs enhanced chain)
+ _MENU_SPEC = (
+ # Quick launch options
+ (' Quick Full Browser Compromise', 'quick_full_compromise', Colors.BRIGHT_GREEN,
+ 'Execute all 4 browser CVEs automatically', 'f', '1', False),
+ (' Enhanced Attack (Obfuscation + Ngrok)', 'enhanced_full_compromise', Colors.BRIGHT_RED,
+ 'Full attack with obfuscation and auto-ngrok tunneling', 'e', '2', True),
+ (' Chrome-Focused Attack', 'chrome_focused_attack', Colors.BRIGHT_YELLOW,
+ 'Target Chrome browser with 3 CVEs', 'c', '3', False),
+ (' Rapid Parallel Exploitation', 'rapid_exploitation', Colors.BRIGHT_CYAN,
+ 'Fast parallel execution of all exploits', 'r', '4', False),
+ (' Stealth Browser Chain', 'stealth_exploitation', Colors.BRIGHT_MAGENTA,
+ 'Low-profile exploitation chain', 's', '5', False),
  
  # Advanced options
- self.add_enhanced_item(
- '--- Advanced Operations ---',
- lambda: None, # No-op for separator
- color=Colors.DARK_GRAY,
- description=''
- )
+ ('--- Advanced Operations ---', None, Colors.DARK_GRAY, '', None, None, False),
+ (' Create Custom Chain', 'create_custom_chain', Colors.BLUE,
+ 'Build custom browser exploitation chain', None, '6', False),
+ (' View Active Chains', 'view_active_chains', Colors.WHITE,
+ 'Monitor running exploitation chains', None, '7', False),
+ (' Chain Status Details', 'view_chain_details', Colors.CYAN,
+ 'Detailed status of specific chain', None, '8', False),
+ ('⏹ Stop Active Chain', 'stop_chain', Colors.RED,
+ 'Stop a running exploitation chain', None, '9', False),
  
- self.add_enhanced_item(
- ' Create Custom Chain',
- self.create_custom_chain,
- color=Colors.BLUE,
- description='Build custom browser exploitation chain',
- key='6'
+ # Configuration
+ ('--- Configuration ---', None, Colors.DARK_GRAY, '', None, None, False),
+ (' Configure Targets', 'configure_targets', Colors.YELLOW,
+ 'Set target URLs and callback settings', None, '10', False),
+ (' Export Chain Results', 'export_results', Colors.GREEN,
+ 'Export exploitation results', None, '11', False),
  )
  
- self.add_enhanced_item(
- ' View Active Chains',
- self.view_active_chains,
- color=Colors.WHITE,
- description='Monitor running exploitation chains',
- key='7'
- )
+ def __init__(self):
+ super().__init__(title="Browser Multi-Exploit Chain")
+ self.set_description("Automated browser CVE combination attacks")
  
- self.add_enhanced_item(
- ' Chain Status Details',
- self.view_chain_details,
- color=Colors.CYAN,
- description='Detailed status of specific chain',
- key='8'
- )
+ self.browser_chain = BrowserExploitChain()
+ self.active_chain_id: Optional[str] = None
  
- self.add_enhanced_item(
- '⏹ Stop Active Chain',
- self.stop_chain,
- color=Colors.RED,
- description='Stop a running exploitation chain',
- key='9'
- )
+ # Parsed config file, reused until its mtime changes
+ self._config_cache: Optional[Dict[str, Any]] = None
+ self._config_mtime_ns = 0
  
- # Configuration
- self.add_enhanced_item(
- '--- Configuration ---',
- lambda: None, # No-op for separator
- color=Colors.DARK_GRAY,
- description=''
- )
+ # Short-lived chain list snapshot and its 8-char ID prefix index
+ self._chains_cache: List[Dict[str, Any]] = []
+ self._chains_fetched: Optional[float] = None
+ self._chain_index: Dict[str, str] = {}
  
- self.add_enhanced_item(
- ' Configure Targets',
- self.configure_targets,
- color=Colors.YELLOW,
- description='Set target URLs and callback settings',
- key='10'
- )
+ # Define menu items
+ self._add_menu_items()
  
+ def _add_menu_items(self):
+ """Add browser chain menu items"""
+ for label, method, color, description, shortcut, key, enhanced_only in self._MENU_SPEC:
+ if enhanced_only and not ENHANCED_CHAIN_AVAILABLE:
+ continue
+ 
+ # Separators have no handler
+ action = getattr(self, method) if method else (lambda: None)
  self.add_enhanced_item(
- ' Export Chain Results',
- self.export_results,
- color=Colors.GREEN,
- description='Export exploitation results',
- key='11'
+ label,
+ action,
+ color=color,
+ description=description,
+ shortcut=shortcut,
+ key=key
  )
  
  def quick_full_compromise(self):
@@ -167,7 +229,7 @@ class BrowserChainMenu(EnhancedMenu):
  
  # Create and execute chain
  self.display_progress("Creating exploitation chain...")
- chain_id = self.browser_chain.create_browser_chain('full_browser_compromise', config)
+ chain_id = self._create_chain('full_browser_compromise', config)
  
  if not chain_id:
  self.display_error("Failed to create exploitation chain")
@@ -192,23 +254,7 @@ class BrowserChainMenu(EnhancedMenu):
  self.clear_screen()
  self.display_header(" Enhanced Browser Compromise (Obfuscation + Ngrok)")
  
- print(f"\n{Colors.YELLOW}Enhanced features enabled:{Colors.RESET}")
- print(" Full payload obfuscation (EXTREME level)")
- print(" Control flow obfuscation")
- print(" String encryption & encoding")
- print(" Anti-debugging & Anti-VM")
- print(" Polymorphic code generation")
- print(" Auto-ngrok tunnel creation")
- print(" Binary data obfuscation")
- print(" Dead code injection")
- 
- print(f"\n{Colors.CYAN}Attack sequence:{Colors.RESET}")
- print("1. Setup ngrok tunnels for callbacks")
- print("2. Obfuscate all exploit payloads")
- print("3. Execute CVE-2025-4664 (Recon)")
- print("4. Execute CVE-2025-2857 (OAuth)")
- print("5. Execute CVE-2025-30397 (WebAssembly)")
- print("6. Execute CVE-2025-2783 (Sandbox Escape)")
+ sys.stdout.write(_ENHANCED_BANNER)
  
  if not self.confirm("\nProceed with enhanced attack?"):
  return
@@ -234,48 +280,56 @@ class BrowserChainMenu(EnhancedMenu):
  
  def _display_enhanced_results(self, result: Dict[str, Any]):
  """Display results from enhanced attack"""
- print(f"\n{Colors.CYAN}Enhanced Attack Results:{Colors.RESET}")
- print("=" * 60)
+ C, G, Y, B, RST = Colors.CYAN, Colors.GREEN, Colors.YELLOW, Colors.BLUE, Colors.RESET
+ sys.stdout.write(_ENHANCED_RESULTS_HEADER)
  
  if result.get('success'):
  self.display_success("Enhanced browser exploitation completed!")
  else:
  self.display_error("Enhanced exploitation failed")
  
+ # Collect the report and emit it with a single write
+ out = []
+ 
  # Show obfuscation report
  if 'obfuscation_report' in result:
  report = result['obfuscation_report']
- print(f"\n{Colors.YELLOW}Obfuscation Report:{Colors.RESET}")
- print(f" Payloads obfuscated: {report.get('total_payloads_obfuscated', 0)}")
- print(f" Obfuscation time: {report.get('obfuscation_time', 0):.2f}s")
- print(f" Average size increase: {report.get('average_size_increase', 0):.1%}")
+ out.append(f"\n{Y}Obfuscation Report:{RST}")
+ out.append(f" Payloads obfuscated: {report.get('total_payloads_obfuscated', 0)}")
+ out.append(f" Obfuscation time: {report.get('obfuscation_time', 0):.2f}s")
+ out.append(f" Average size increase: {report.get('average_size_increase', 0):.1%}")
  
- print(f"\n{Colors.CYAN}Techniques used:{Colors.RESET}")
- for technique in report.get('techniques_used', []):
- print(f" {technique}")
+ out.append(f"\n{C}Techniques used:{RST}")
+ out.extend(f" {technique}" for technique in report.get('techniques_used', []))
  
  # Show ngrok tunnels
  if 'ngrok_tunnels' in result:
  tunnels = result['ngrok_tunnels']
- print(f"\n{Colors.GREEN}Ngrok Tunnels Created:{Colors.RESET}")
- for name, url in tunnels.items():
- print(f" {name}: {url}")
+ out.append(f"\n{G}Ngrok Tunnels Created:{RST}")
+ out.extend(f" {name}: {url}" for name, url in tunnels.items())
  
  # Show enhanced features
  if 'enhanced_features' in result:
  features = result['enhanced_features']
- print(f"\n{Colors.BLUE}Enhanced Features:{Colors.RESET}")
+ out.append(f"\n{B}Enhanced Features:{RST}")
  for feature, enabled in features.items():
  status = "" if enabled else ""
- print(f" {status} {feature.replace('_', ' ').title()}")
+ title = _FEATURE_TITLES.get(feature)
+ if title is None:
+ title = _FEATURE_TITLES.setdefault(feature, feature.replace('_', ' ').title())
+ out.append(f" {status} {title}")
  
  # Standard chain results
  if 'chain_result' in result:
  chain_result = result['chain_result']
- print(f"\n{Colors.CYAN}Chain Execution:{Colors.RESET}")
- print(f" Status: {chain_result.status.value}")
- print(f" Steps: {chain_result.successful_steps}/{chain_result.total_steps} successful")
- print(f" Time: {chain_result.execution_time:.2f}s")
+ out.append(f"\n{C}Chain Execution:{RST}")
+ out.append(f" Status: {chain_result.status.value}")
+ out.append(f" Steps: {chain_result.successful_steps}/{chain_result.total_steps} successful")
+ out.append(f" Time: {chain_result.execution_time:.2f}s")
+ 
+ if out:
+ sys.stdout.write("\n".join(out) + "\n")
+ sys.stdout.flush()
  
  self.wait_for_key()
  
@@ -295,7 +349,7 @@ class BrowserChainMenu(EnhancedMenu):
  config = self._get_default_config()
  
  # Create and execute
- chain_id = self.browser_chain.create_browser_chain('chrome_focused_attack', config)
+ chain_id = self._create_chain('chrome_focused_attack', config)
  if chain_id:
  self.active_chain_id = chain_id
  result = self.browser_chain.execute_browser_chain(chain_id, async_mode=False)
@@ -320,7 +374,7 @@ class BrowserChainMenu(EnhancedMenu):
  config['fast_mode'] = True
  
  # Create and execute
- chain_id = self.browser_chain.create_browser_chain('rapid_exploitation', config)
+ chain_id = self._create_chain('rapid_exploitation', config)
  if chain_id:
  self.active_chain_id = chain_id
  
@@ -359,7 +413,7 @@ class BrowserChainMenu(EnhancedMenu):
  })
  
  # Create and execute
- chain_id = self.browser_chain.create_browser_chain('stealth_browser_chain', config)
+ chain_id = self._create_chain('stealth_browser_chain', config)
  if chain_id:
  self.active_chain_id = chain_id
  result = self.browser_chain.execute_browser_chain(chain_id, async_mode=False)
@@ -370,19 +424,24 @@ class BrowserChainMenu(EnhancedMenu):
  self.clear_screen()
  self.display_header(" Create Custom Browser Chain")
  
+ cve_ids = list(self.browser_chain.BROWSER_CVES)
+ 
  print("\nAvailable Browser CVEs:")
- for cve_id, info in self.browser_chain.BROWSER_CVES.items():
- print(f"\n{Colors.CYAN}{cve_id}{Colors.RESET} - {info['name']}")
+ for i, cve_id in enumerate(cve_ids, 1):
+ info = self.browser_chain.BROWSER_CVES[cve_id]
+ print(f"\n{i}. {Colors.CYAN}{cve_id}{Colors.RESET} - {info['name']}")
  print(f" Browser: {info['browser']}")
  print(f" Type: {info['type']}")
  print(f" Severity: {info['severity']}")
  
  print(f"\n{Colors.YELLOW}Select CVEs to include in chain:{Colors.RESET}")
- selected_cves = []
+ raw = self.get_input("CVEs (e.g. 1,3,4 or 'all')").strip().lower()
  
- for cve_id in self.browser_chain.BROWSER_CVES:
- if self.confirm(f"Include {cve_id}?"):
- selected_cves.append(cve_id)
+ if raw == 'all':
+ selected_cves = cve_ids
+ else:
+ picks = {int(x) - 1 for x in raw.split(',') if x.strip().isdigit()}
+ selected_cves = [cve_id for i, cve_id in enumerate(cve_ids) if i in picks]
  
  if not selected_cves:
  self.display_warning("No CVEs selected")
@@ -428,27 +487,25 @@ class BrowserChainMenu(EnhancedMenu):
  self.clear_screen()
  self.display_header(" Active Browser Exploitation Chains")
  
- chains = self.browser_chain.get_all_chains()
+ chains = self._get_chains()
  
  if not chains:
  self.display_warning("No active chains")
  return
  
- print(f"\n{Colors.CYAN}Active Chains:{Colors.RESET}")
- print("-" * 80)
+ lines = [f"\n{Colors.CYAN}Active Chains:{Colors.RESET}", "-" * 80]
  
  for chain in chains:
- status_color = Colors.GREEN if chain['status'] == 'success' else (
- Colors.RED if chain['status'] == 'failed' else Colors.YELLOW
- )
+ lines.append(self._FMT_CHAIN_ID.format(chain['id'][:8]))
+ lines.append(f"Name: {chain['name']}")
+ lines.append(f"Template: {chain['template']}")
+ lines.append(f"Status: {self._format_status(chain['status'])}")
+ lines.append(f"Steps: {chain['steps']}")
+ lines.append(f"Browsers: {', '.join(chain['browsers'])}")
+ lines.append(f"Created: {chain['created']}")
  
- print(f"\nID: {Colors.BLUE}{chain['id'][:8]}...{Colors.RESET}")
- print(f"Name: {chain['name']}")
- print(f"Template: {chain['template']}")
- print(f"Status: {status_color}{chain['status']}{Colors.RESET}")
- print(f"Steps: {chain['steps']}")
- print(f"Browsers: {', '.join(chain['browsers'])}")
- print(f"Created: {chain['created']}")
+ sys.stdout.write("\n".join(lines) + "\n")
+ sys.stdout.flush()
  
  self.wait_for_key()
  
@@ -463,11 +520,7 @@ class BrowserChainMenu(EnhancedMenu):
  chain_id = self.get_input("Chain ID (or first 8 chars)")
  
  # Find matching chain
- all_chains = self.browser_chain.get_all_chains()
- for chain in all_chains:
- if chain['id'].startswith(chain_id):
- chain_id = chain['id']
- break
+ chain_id = self._resolve_chain_id(chain_id)
  
  if not chain_id:
  self.display_error("Chain not found")
@@ -484,7 +537,7 @@ class BrowserChainMenu(EnhancedMenu):
  print(f"\n{Colors.CYAN}Chain Details:{Colors.RESET}")
  print(f"ID: {status['id']}")
  print(f"Name: {status['name']}")
- print(f"Status: {self._get_status_color(status['status'])}{status['status']}{Colors.RESET}")
+ print(f"Status: {self._format_status(status['status'])}")
  print(f"Progress: {status['progress']}")
  print(f"Execution Time: {status.get('execution_time', 0):.2f}s")
  
@@ -492,8 +545,8 @@ class BrowserChainMenu(EnhancedMenu):
  progress = status['exploitation_progress']
  print(f" Percentage: {progress['percentage']:.1f}%")
  print(f" Completed: {progress['completed_steps']}/{progress['total_steps']}")
- print(f" Successful: {Colors.GREEN}{progress['successful_steps']}{Colors.RESET}")
- print(f" Failed: {Colors.RED}{progress['failed_steps']}{Colors.RESET}")
+ print(self._FMT_SUCCESSFUL.format(progress['successful_steps']))
+ print(self._FMT_FAILED.format(progress['failed_steps']))
  
  print(f"\n{Colors.CYAN}Targeted Browsers:{Colors.RESET}")
  for browser in status['browsers_targeted']:
@@ -512,7 +565,7 @@ class BrowserChainMenu(EnhancedMenu):
  self.display_header("⏹ Stop Exploitation Chain")
  
  # Get active chains
- chains = self.browser_chain.get_all_chains()
+ chains = self._get_chains()
  running_chains = [c for c in chains if c['status'] == 'running']
  
  if not running_chains:
@@ -523,19 +576,20 @@ class BrowserChainMenu(EnhancedMenu):
  for i, chain in enumerate(running_chains, 1):
  print(f"{i}. {chain['name']} ({chain['id'][:8]}...)")
  
- choice = self.get_input("\nSelect chain to stop (number)")
+ choice = self.get_input("\nSelect chain to stop (number)").strip()
+ index = int(choice) - 1 if choice.isdigit() else -1
+ 
+ if not 0 <= index < len(running_chains):
+ self.display_error("Invalid selection")
+ return
  
- try:
- index = int(choice) - 1
- if 0 <= index < len(running_chains):
  chain_id = running_chains[index]['id']
  
  if self.browser_chain.stop_browser_chain(chain_id):
+ self._chains_fetched = None
  self.display_success(f"Chain {chain_id[:8]}... stopped")
  else:
  self.display_error("Failed to stop chain")
- except:
- self.display_error("Invalid selection")
  
  def configure_targets(self):
  """Configure target settings"""
@@ -578,177 +632,369 @@ class BrowserChainMenu(EnhancedMenu):
  self.display_warning("No results to export")
  return
  
+ # Only IDs are listed; the selected result is the only one we format
+ chain_ids = list(self.browser_chain.results.keys())
  print(f"\n{Colors.CYAN}Available Results:{Colors.RESET}")
- for i, (chain_id, result) in enumerate(self.browser_chain.results.items(), 1):
- timestamp = result['timestamp'].strftime("%Y-%m-%d %H:%M:%S")
- print(f"{i}. Chain {chain_id[:8]}... - {timestamp}")
+ for i, chain_id in enumerate(chain_ids, 1):
+ print(f"{i}. Chain {chain_id[:8]}...")
  
- choice = self.get_input("\nSelect result to export (number)")
+ choice = self.get_input("\nSelect result to export (number)").strip()
+ index = int(choice) - 1 if choice.isdigit() else -1
  
- try:
- index = int(choice) - 1
- chain_ids = list(self.browser_chain.results.keys())
- 
- if 0 <= index < len(chain_ids):
+ if not 0 <= index < len(chain_ids):
+ self.display_error("Invalid selection")
+ else:
  chain_id = chain_ids[index]
  result = self.browser_chain.results[chain_id]
  
  # Export to file
  filename = f"browser_chain_results_{chain_id[:8]}_{int(time.time())}.json"
  
- import json
- with open(filename, 'w') as f:
- json.dump(result, f, indent=2, default=str)
+ # Serialize the timestamp up front; default=str only covers the rest
+ export = dict(result)
+ timestamp = export.get('timestamp')
+ if hasattr(timestamp, 'isoformat'):
+ export['timestamp'] = timestamp.isoformat()
+ print(f"Chain {chain_id[:8]}... executed {timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+ 
+ # Result dumps can be large: write them compact and without
+ # holding a second, fully encoded copy in memory
+ try:
+ json_utils.dump(export, filename)
  
  self.display_success(f"Results exported to: {filename}")
- except:
- self.display_error("Invalid selection")
+ except (OSError, TypeError, ValueError) as e:
+ self.display_error(f"Export failed: {e}")
  
  self.wait_for_key()
  
+ def _get_chains(self) -> List[Dict[str, Any]]:
+ """Get all chains, reusing a snapshot younger than CHAIN_CACHE_TTL"""
+ now = time.monotonic()
+ if self._chains_fetched is None or now - self._chains_fetched > CHAIN_CACHE_TTL:
+ self._chains_cache = self.browser_chain.get_all_chains()
+ self._chain_index = {c['id'][:8]: c['id'] for c in self._chains_cache}
+ self._chains_fetched = now
+ return self._chains_cache
+ 
+ def _resolve_chain_id(self, chain_id: str) -> Optional[str]:
+ """Expand a full or abbreviated chain ID to the full ID"""
+ if not chain_id:
+ return None
+ 
+ # Chains created from this menu are indexed up front, so try that first
+ full_id = self._chain_index.get(chain_id[:8])
+ if full_id and full_id.startswith(chain_id):
+ return full_id
+ 
+ self._get_chains()
+ full_id = self._chain_index.get(chain_id[:8])
+ if full_id and full_id.startswith(chain_id):
+ return full_id
+ 
+ # Shorter than the indexed prefix - fall back to a scan
+ if len(chain_id) < 8:
+ for full_id in self._chain_index.values():
+ if full_id.startswith(chain_id):
+ return full_id
+ return None
+ 
+ def _create_chain(self, template_name: str, config: Dict[str, Any]) -> Optional[str]:
+ """Create a browser chain and index its ID prefix"""
+ chain_id = self.browser_chain.create_browser_chain(template_name, config)
+ if chain_id:
+ self._chain_index[chain_id[:8]] = chain_id
+ # The chain list snapshot no longer includes everything
+ self._chains_fetched = None
+ return chain_id
+ 
  def _get_default_config(self) -> Dict[str, Any]:
  """Get default configuration"""
- # Try to load saved config
+ # Try to load saved config (re-read only when the file changed)
  try:
- import json
- with open('config/browser_chain_config.json', 'r') as f:
- return json.load(f)
+ mtime_ns = os.stat(CONFIG_FILE).st_mtime_ns
+ if self._config_cache is None or mtime_ns != self._config_mtime_ns:
+ with open(CONFIG_FILE, 'rb') as f:
+ self._config_cache = json_utils.loads(f.read())
+ self._config_mtime_ns = mtime_ns
+ # Callers tweak the returned dict, so hand out a copy
+ return dict(self._config_cache)
  except:
  # Return defaults
- return {
- 'target_url': 'http://localhost:8080',
- 'callback_ip': '127.0.0.1',
- 'callback_port': 4444,
- 'timeout': 300
- }
+ return dict(DEFAULT_CONFIG)
  
  def _save_config(self, config: Dict[str, Any]):
  """Save configuration"""
  try:
- import json
  os.makedirs('config', exist_ok=True)
- with open('config/browser_chain_config.json', 'w') as f:
- json.dump(config, f, indent=2)
+ with open(CONFIG_FILE, 'wb') as f:
+ f.write(json_utils.dumps(config, indent=True))
+ self._config_cache = dict(config)
+ self._config_mtime_ns = os.stat(CONFIG_FILE).st_mtime_ns
  except Exception as e:
  logger.error(f"Failed to save config: {e}")
  
  def _display_execution_results(self, result: Dict[str, Any]):
  """Display chain execution results"""
- print(f"\n{Colors.CYAN}Execution Results:{Colors.RESET}")
- print("=" * 60)
+ C, G, R, Y, B, RST = Colors.CYAN, Colors.GREEN, Colors.RED, Colors.YELLOW, Colors.BLUE, Colors.RESET
+ sys.stdout.write(_EXECUTION_RESULTS_HEADER)
  
  if result.get('success'):
  self.display_success("Browser exploitation chain completed successfully!")
  else:
  self.display_error("Browser exploitation chain failed")
  
- print(f"\nStatus: {self._get_status_color(result.get('status', 'unknown'))}{result.get('status', 'unknown')}{Colors.RESET}")
+ # Collect the report and emit it with a single write
+ status = result.get('status', 'unknown')
+ out = [f"\nStatus: {self._format_status(status)}"]
  
  if 'statistics' in result:
  stats = result['statistics']
- print(f"\n{Colors.YELLOW}Statistics:{Colors.RESET}")
- print(f" Total Steps: {stats['total_steps']}")
- print(f" Successful: {Colors.GREEN}{stats['successful_steps']}{Colors.RESET}")
- print(f" Failed: {Colors.RED}{stats['failed_steps']}{Colors.RESET}")
- print(f" Skipped: {stats.get('skipped_steps', 0)}")
+ out.append(f"\n{Y}Statistics:{RST}")
+ out.append(f" Total Steps: {stats['total_steps']}")
+ out.append(self._FMT_SUCCESSFUL.format(stats['successful_steps']))
+ out.append(self._FMT_FAILED.format(stats['failed_steps']))
+ out.append(f" Skipped: {stats.get('skipped_steps', 0)}")
  
  if 'exploited_browsers' in result:
- print(f"\n{Colors.CYAN}Exploited Browsers:{Colors.RESET}")
- for browser in result['exploited_browsers']:
- print(f" {browser}")
+ out.append(f"\n{C}Exploited Browsers:{RST}")
+ out.extend(f" {browser}" for browser in result['exploited_browsers'])
  
  if 'successful_cves' in result:
- print(f"\n{Colors.GREEN}Successful CVEs:{Colors.RESET}")
- for cve in result['successful_cves']:
- print(f" {cve}")
+ out.append(f"\n{G}Successful CVEs:{RST}")
+ out.extend(f" {cve}" for cve in result['successful_cves'])
  
  if 'failed_cves' in result:
- print(f"\n{Colors.RED}Failed CVEs:{Colors.RESET}")
- for cve in result['failed_cves']:
- print(f" {cve}")
+ out.append(f"\n{R}Failed CVEs:{RST}")
+ out.extend(f" {cve}" for cve in result['failed_cves'])
  
  if 'recommendations' in result:
- print(f"\n{Colors.YELLOW}Recommendations:{Colors.RESET}")
- for rec in result['recommendations']:
- print(f" • {rec}")
+ out.append(f"\n{Y}Recommendations:{RST}")
+ out.extend(f" • {rec}" for rec in result['recommendations'])
  
  if 'execution_time' in result:
- print(f"\n{Colors.BLUE}Execution Time: {result['execution_time']:.2f} seconds{Colors.RESET}")
+ out.append(f"\n{B}Execution Time: {result['execution_time']:.2f} seconds{RST}")
+ 
+ sys.stdout.write("\n".join(out) + "\n")
+ sys.stdout.flush()
  
  self.wait_for_key()
  
  def _get_status_color(self, status: str) -> str:
  """Get color for status display"""
- status_colors = {
- 'success': Colors.GREEN,
- 'failed': Colors.RED,
- 'running': Colors.YELLOW,
- 'pending': Colors.BLUE,
- 'stopped': Colors.MAGENTA,
- 'partial': Colors.CYAN
- }
- return status_colors.get(status, Colors.WHITE)
+ return self._STATUS_COLORS.get(status, Colors.WHITE)
+ 
+ def _format_status(self, status: str) -> str:
+ """Get the colorized label for a status"""
+ display = self._STATUS_DISPLAY.get(status)
+ if display is None:
+ display = f"{Colors.WHITE}{status}{Colors.RESET}"
+ return display
  
  def _monitor_chain_briefly(self, chain_id: str, duration: int = 10):
  """Briefly monitor chain progress"""
- print(f"\n{Colors.CYAN}Monitoring chain progress for {duration} seconds...{Colors.RESET}")
+ print(f"\n{Colors.CYAN}Monitoring chain progress for {duration} seconds (press any key to stop)...{Colors.RESET}")
+ 
+ updates = queue.Queue()
+ # On POSIX terminals step events also write to a pipe, so a single
+ # select() can wait for either a keypress or chain progress
+ wakeup_r = wakeup_w = None
+ if os.name != 'nt' and sys.stdin.isatty():
+ wakeup_r, wakeup_w = os.pipe()
+ os.set_blocking(wakeup_r, False)
+ os.set_blocking(wakeup_w, False)
+ # _notify() may still run on_update after unsubscribe() returns, so the
+ # write end is only used under this lock and never once it is closed
+ wakeup_lock = threading.Lock()
+ wakeup_closed = False
+ 
+ def on_update(updated_chain_id):
+ updates.put(updated_chain_id)
+ if wakeup_w is not None:
+ with wakeup_lock:
+ if wakeup_closed:
+ return
+ try:
+ os.write(wakeup_w, b'\0')
+ except OSError:
+ pass # pipe full: the reader is already awake
+ 
+ self.browser_chain.subscribe(chain_id, on_update)
+ 
+ last_line = None
  
- start_time = time.time()
- while time.time() - start_time < duration:
+ try:
+ with _cbreak_stdin():
+ deadline = time.monotonic() + duration
+ while time.monotonic() < deadline:
  status = self.browser_chain.get_chain_status(chain_id)
  progress = status['exploitation_progress']
  
- print(f"\r Progress: {progress['percentage']:.1f}% "
+ line = (f"\r Progress: {progress['percentage']:.1f}% "
  f"({progress['completed_steps']}/{progress['total_steps']} steps) "
- f"Status: {self._get_status_color(status['status'])}{status['status']}{Colors.RESET}",
- end='', flush=True)
+ f"Status: {self._format_status(status['status'])}\033[K")
+ if line != last_line:
+ sys.stdout.write(line)
+ sys.stdout.flush()
+ last_line = line
  
  if status['status'] not in ['running', 'pending']:
  break
  
- time.sleep(1)
+ # Never sleep past the end of the monitoring window
+ if self._wait_for_update_or_key(updates, min(1.0, deadline - time.monotonic()), wakeup_r):
+ break
+ finally:
+ self.browser_chain.unsubscribe(chain_id, on_update)
+ if wakeup_r is not None:
+ with wakeup_lock:
+ wakeup_closed = True
+ os.close(wakeup_w)
+ os.close(wakeup_r)
  
  print("\n")
  
+ @staticmethod
+ def _drain_updates(updates: queue.Queue) -> bool:
+ """Empty the update queue, returning True if it held anything"""
+ drained = False
+ while True:
+ try:
+ updates.get_nowait()
+ except queue.Empty:
+ return drained
+ drained = True
+ 
+ @staticmethod
+ def _drain_pipe(fd: int):
+ """Discard all pending wakeup bytes from a non-blocking pipe"""
+ try:
+ while os.read(fd, 4096):
+ pass
+ except BlockingIOError:
+ pass
+ 
+ def _wait_for_update(self, updates: queue.Queue, timeout: float):
+ """Block until the chain reports progress or the timeout expires"""
+ try:
+ updates.get(timeout=timeout)
+ except queue.Empty:
+ return
+ # Collapse bursts of step events into a single redraw
+ self._drain_updates(updates)
+ 
+ def _wait_for_update_or_key(self, updates: queue.Queue, timeout: float,
+ wakeup_fd: Optional[int] = None) -> bool:
+ """
+ Wait for chain progress or a keypress, whichever comes first
+ 
+ Returns True if a key was pressed. The update queue is always left empty.
+ """
+ # Updates that arrived while the caller was redrawing count immediately;
+ # the pipe is emptied first so it never signals an update already consumed
+ if wakeup_fd is not None:
+ self._drain_pipe(wakeup_fd)
+ if self._drain_updates(updates):
+ return False
+ 
+ if wakeup_fd is not None:
+ ready, _, _ = select.select([sys.stdin, wakeup_fd], [], [], max(timeout, 0))
+ if sys.stdin in ready:
+ os.read(sys.stdin.fileno(), 1)
+ if wakeup_fd in ready:
+ self._drain_pipe(wakeup_fd)
+ self._drain_updates(updates)
+ return sys.stdin in ready
+ 
+ # No selectable wakeup (Windows or no terminal): poll the keyboard in short slices
+ deadline = time.monotonic() + timeout
+ while True:
+ if self._drain_updates(updates):
+ return False
+ remaining = deadline - time.monotonic()
+ if remaining <= 0:
+ return False
+ if _kbhit(min(remaining, 0.1)):
+ return True
+ 
  def _monitor_chain_progress(self, chain_id: str):
  """Monitor chain progress until completion"""
  print(f"\n{Colors.CYAN}Monitoring chain progress (Press Ctrl+C to stop)...{Colors.RESET}")
  
+ updates = queue.Queue()
+ self.browser_chain.subscribe(chain_id, updates.put)
+ frame: List[str] = []
+ last_state = None
+ 
  try:
  while True:
  status = self.browser_chain.get_chain_status(chain_id)
  progress = status['exploitation_progress']
  
- # Clear and redraw
- print("\033[2J\033[H") # Clear screen
- self.display_header(" Chain Progress Monitor")
- 
- print(f"\nChain: {status['name']}")
- print(f"Status: {self._get_status_color(status['status'])}{status['status']}{Colors.RESET}")
- print(f"Progress: {progress['percentage']:.1f}%")
- 
- # Progress bar
- bar_length = 50
- filled = int(bar_length * progress['percentage'] / 100)
- bar = '█' * filled + '░' * (bar_length - filled)
- print(f"\n[{bar}] {progress['completed_steps']}/{progress['total_steps']}")
- 
- print(f"\n Successful: {Colors.GREEN}{progress['successful_steps']}{Colors.RESET}")
- print(f" Failed: {Colors.RED}{progress['failed_steps']}{Colors.RESET}")
- print(f"Execution Time: {status.get('execution_time', 0):.2f}s")
+ # Skip building the frame entirely when nothing visible changed
+ state = (status['status'], progress['percentage'], progress['completed_steps'],
+ progress['successful_steps'], progress['failed_steps'],
+ round(status.get('execution_time', 0), 2))
+ if state != last_state:
+ last_state = state
+ # Only lines that differ from the previous frame are re-sent
+ new_frame = self._build_monitor_frame(status, progress)
+ self._draw_frame(new_frame, frame)
+ frame = new_frame
  
  if status['status'] not in ['running', 'pending']:
  print(f"\n{Colors.YELLOW}Chain completed!{Colors.RESET}")
  break
  
- time.sleep(1)
+ self._wait_for_update(updates, 1.0)
  
  except KeyboardInterrupt:
  print(f"\n{Colors.YELLOW}Monitoring stopped{Colors.RESET}")
+ finally:
+ self.browser_chain.unsubscribe(chain_id, updates.put)
+ 
+ def _build_monitor_frame(self, status: Dict[str, Any], progress: Dict[str, Any]) -> List[str]:
+ """Build the progress monitor screen, one entry per terminal row"""
+ # Progress bar
+ filled = int(_BAR_LENGTH * progress['percentage'] / 100)
+ bar = _BARS[max(0, min(filled, _BAR_LENGTH))]
+ 
+ return [
+ *self._MONITOR_HEADER,
+ f"Chain: {status['name']}",
+ f"Status: {self._format_status(status['status'])}",
+ f"Progress: {progress['percentage']:.1f}%",
+ "",
+ f"[{bar}] {progress['completed_steps']}/{progress['total_steps']}",
+ "",
+ self._FMT_SUCCESSFUL.format(progress['successful_steps']),
+ self._FMT_FAILED.format(progress['failed_steps']),
+ f"Execution Time: {status.get('execution_time', 0):.2f}s",
+ ]
+ 
+ def _draw_frame(self, frame: List[str], previous: List[str]):
+ """Paint a frame, rewriting only the rows that changed since the last one"""
+ if not previous:
+ # First paint: clear once and draw everything
+ out = ["\033[2J\033[H", "\n".join(frame)]
+ else:
+ out = [f"\033[{row};1H{line}\033[K"
+ for row, (line, old) in enumerate(zip(frame, previous), 1)
+ if line != old]
+ if not out:
+ return
+ # Park the cursor below the frame for any trailing output
+ out.append(f"\033[{len(frame) + 1};1H")
+ sys.stdout.write(''.join(out))
+ sys.stdout.flush()
  
  def clear_screen(self):
  """Clear the terminal screen"""
- os.system('clear' if os.name == 'posix' else 'cls')
+ if _LEGACY_CONSOLE:
+ os.system('cls')
+ return
+ sys.stdout.write("\033[2J\033[H")
+ sys.stdout.flush()
  
  def display_header(self, title: str):
  """Display a header with title"""
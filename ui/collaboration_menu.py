@@ -7,7 +7,9 @@ Team collaboration features for bug bounty and pentesting
 
 import os
 import sys
-from typing import List, Dict, Optional
+import functools
+import threading
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 
 # Add parent directory to path
@@ -16,18 +18,109 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.menu import Menu
 from core.utils import Colors, print_banner, clear_screen, safe_execute
 from core.enhanced_logger import get_logger
+from core import json_utils
 from core.collaboration import CollaborationManager, TeamMember, Project, SharedFinding, TaskAssignment
 
+PROMPT_CONTINUE = f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}"
+PROMPT_CHOICE = f"\n{Colors.WARNING}Choice: {Colors.ENDC}"
+
+_SEVERITY_COLORS = {
+    "critical": Colors.FAIL,
+    "high": Colors.WARNING,
+    "medium": Colors.OKBLUE,
+    "low": Colors.OKGREEN,
+    "info": Colors.ENDC
+}
+
+_STATUS_COLORS = {
+    "open": Colors.FAIL,
+    "in_progress": Colors.WARNING,
+    "resolved": Colors.OKGREEN,
+    "completed": Colors.OKGREEN,
+    "blocked": Colors.FAIL,
+    "pending": Colors.OKBLUE
+}
+
+_PRIORITY_COLORS = {
+    "high": Colors.FAIL,
+    "medium": Colors.WARNING,
+    "low": Colors.OKGREEN
+}
+
+# Checked in order against the action name
+_ACTION_COLORS = (
+    ("created", Colors.OKGREEN),
+    ("updated", Colors.WARNING),
+    ("deleted", Colors.FAIL)
+)
+_ACTION_VERB_COLORS = dict(_ACTION_COLORS)
+
+
+@functools.lru_cache(maxsize=64)
+def _humanize_action(action: str) -> str:
+    """Turn a logged action name like "finding_created" into display text"""
+    return action.replace('_', ' ')
+
+
+def _read_line(prompt: str) -> str:
+    """Prompt and read one line straight from stdin, for menu choices and continue prompts
+    
+    Free-text form fields keep input() so they get readline editing and history.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        # Match input() so callers still see end of input
+        raise EOFError
+    return line.rstrip('\n')
+
+
+def _severity_color(severity: str) -> str:
+    """Get color for severity level"""
+    return _SEVERITY_COLORS.get(severity, Colors.ENDC)
+
+
+def _status_color(status: str) -> str:
+    """Get color for status"""
+    return _STATUS_COLORS.get(status, Colors.ENDC)
+
+
+def _priority_color(priority: str) -> str:
+    """Get color for priority"""
+    return _PRIORITY_COLORS.get(priority, Colors.ENDC)
+
+
+def _action_color(action: str) -> str:
+    """Get color for action type"""
+    # Logged actions are "<resource>_<verb>", so the verb decides
+    color = _ACTION_VERB_COLORS.get(action.rpartition('_')[2])
+    if color is not None:
+        return color
+    for keyword, color in _ACTION_COLORS:
+        if keyword in action:
+            return color
+    return Colors.OKBLUE
+
 
 class CollaborationMenu(Menu):
     """Menu for team collaboration features"""
     
+    # Activity entries fetched and rendered per dashboard page
+    ACTIVITY_PAGE_SIZE = 20
+    
+    # Directory exported reports are written to, created on first export
+    REPORTS_DIR = "reports"
+    _reports_dir_ensured = False
+    
     def __init__(self):
         super().__init__()
         self.logger = get_logger()
         self.collab_manager = CollaborationManager()
         self.current_user = None
         self.current_project = None
+        # (writer thread, file path, outcome) of the last background report write
+        self._report_write: Optional[Tuple[threading.Thread, str, Dict]] = None
         
         # Add menu items
         self.add_item("1", "Team Management", self.team_management)
@@ -54,6 +147,7 @@ class CollaborationMenu(Menu):
         else:
             print(f"{Colors.WARNING}[!] No project selected.{Colors.ENDC}")
             
+        self._report_write_status()
         print()
         super().display()
     
@@ -68,7 +162,7 @@ class CollaborationMenu(Menu):
             print("3. Select Current User")
             print("0. Back")
             
-            choice = input(f"\n{Colors.WARNING}Choice: {Colors.ENDC}")
+            choice = _read_line(PROMPT_CHOICE)
             
             if choice == "1":
                 self._view_team_members()
@@ -90,7 +184,7 @@ class CollaborationMenu(Menu):
             print("3. Select Current Project")
             print("0. Back")
             
-            choice = input(f"\n{Colors.WARNING}Choice: {Colors.ENDC}")
+            choice = _read_line(PROMPT_CHOICE)
             
             if choice == "1":
                 self._view_projects()
@@ -105,7 +199,7 @@ class CollaborationMenu(Menu):
         """Manage security findings"""
         if not self.current_project:
             print(f"{Colors.FAIL}[!] Please select a project first{Colors.ENDC}")
-            input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+            _read_line(PROMPT_CONTINUE)
             return
             
         while True:
@@ -118,7 +212,7 @@ class CollaborationMenu(Menu):
             print("4. Add Comment to Finding")
             print("0. Back")
             
-            choice = input(f"\n{Colors.WARNING}Choice: {Colors.ENDC}")
+            choice = _read_line(PROMPT_CHOICE)
             
             if choice == "1":
                 self._view_findings()
@@ -135,7 +229,7 @@ class CollaborationMenu(Menu):
         """Manage task assignments"""
         if not self.current_user:
             print(f"{Colors.FAIL}[!] Please select a user first{Colors.ENDC}")
-            input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+            _read_line(PROMPT_CONTINUE)
             return
             
         while True:
@@ -147,7 +241,7 @@ class CollaborationMenu(Menu):
             print("3. Update Task Status")
             print("0. Back")
             
-            choice = input(f"\n{Colors.WARNING}Choice: {Colors.ENDC}")
+            choice = _read_line(PROMPT_CHOICE)
             
             if choice == "1":
                 self._view_my_tasks()
@@ -159,41 +253,51 @@ class CollaborationMenu(Menu):
                 break
     
     def activity_dashboard(self):
-        """View activity dashboard"""
-        clear_screen()
-        print(f"\n{Colors.HEADER}=== Activity Dashboard ==={Colors.ENDC}\n")
+        """View activity dashboard, one page at a time"""
+        offset = 0
         
-        try:
-            activities = self.collab_manager.get_activity_log(limit=20)
+        while True:
+            clear_screen()
+            print(f"\n{Colors.HEADER}=== Activity Dashboard ==={Colors.ENDC}\n")
+            has_more = False
             
-            if not activities:
-                print(f"{Colors.WARNING}[!] No recent activity{Colors.ENDC}")
-            else:
-                print(f"Recent Activity ({len(activities)} items):\n")
+            try:
+                # Ask for one extra row to learn whether another page exists
+                activities = self.collab_manager.get_activity_log(
+                    limit=self.ACTIVITY_PAGE_SIZE + 1, offset=offset
+                )
+                has_more = len(activities) > self.ACTIVITY_PAGE_SIZE
+                activities = activities[:self.ACTIVITY_PAGE_SIZE]
                 
-                for activity in activities:
-                    timestamp = datetime.fromisoformat(activity['timestamp'])
-                    time_ago = self._format_time_ago(timestamp)
+                if not activities:
+                    print(f"{Colors.WARNING}[!] No recent activity{Colors.ENDC}")
+                else:
+                    print(f"Recent Activity (items {offset + 1}-{offset + len(activities)}):\n")
                     
-                    action_color = self._get_action_color(activity['action'])
-                    print(f"{action_color}[{time_ago}]{Colors.ENDC} {activity['username']} {activity['action'].replace('_', ' ')}")
+                    now = datetime.now()
+                    sys.stdout.write(
+                        "\n".join(self._format_activity(a, now) for a in activities) + "\n"
+                    )
                     
-                    if activity['details']:
-                        for key, value in activity['details'].items():
-                            print(f"    {key}: {value}")
-                    print()
-                    
-        except Exception as e:
-            self.logger.error(f"Error viewing activity: {e}")
-            print(f"{Colors.FAIL}[!] Error viewing activity: {e}{Colors.ENDC}")
+            except Exception as e:
+                self.logger.error(f"Error viewing activity: {e}")
+                print(f"{Colors.FAIL}[!] Error viewing activity: {e}{Colors.ENDC}")
             
-        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+            if not has_more:
+                break
+            
+            choice = _read_line(f"\n{Colors.WARNING}[n] Next page, Enter to return: {Colors.ENDC}")
+            if choice.strip().lower() != "n":
+                return
+            offset += self.ACTIVITY_PAGE_SIZE
+            
+        _read_line(PROMPT_CONTINUE)
     
     def export_reports(self):
         """Export project reports"""
         if not self.current_project:
             print(f"{Colors.FAIL}[!] Please select a project first{Colors.ENDC}")
-            input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+            _read_line(PROMPT_CONTINUE)
             return
             
         clear_screen()
@@ -216,14 +320,22 @@ class CollaborationMenu(Menu):
                 
                 # Save report
                 filename = f"report_{self.current_project.name.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                filepath = os.path.join("reports", filename)
-                os.makedirs("reports", exist_ok=True)
-                
-                import json
-                with open(filepath, 'w') as f:
-                    json.dump(report, f, indent=2)
+                filepath = os.path.join(self.REPORTS_DIR, filename)
+                if not CollaborationMenu._reports_dir_ensured:
+                    os.makedirs(self.REPORTS_DIR, exist_ok=True)
+                    CollaborationMenu._reports_dir_ensured = True
+                # Write in the background so large reports don't stall the menu;
+                # the outcome is shown from the menu thread (see _report_write_status)
+                self._report_write_status(wait=True)
+                outcome = {}
+                writer = threading.Thread(
+                    target=self._write_report_async,
+                    args=(filepath, report, outcome)
+                )
+                writer.start()
+                self._report_write = (writer, filepath, outcome)
                     
-                print(f"\n{Colors.OKGREEN}[+] Report exported to: {filepath}{Colors.ENDC}")
+                print(f"\n{Colors.OKBLUE}[*] Writing report to: {filepath}{Colors.ENDC}")
             else:
                 print(f"{Colors.FAIL}[!] Failed to generate report{Colors.ENDC}")
                 
@@ -231,7 +343,35 @@ class CollaborationMenu(Menu):
             self.logger.error(f"Error exporting report: {e}")
             print(f"{Colors.FAIL}[!] Error exporting report: {e}{Colors.ENDC}")
             
-        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+        _read_line(PROMPT_CONTINUE)
+    
+    def _write_report(self, filepath: str, report: Dict):
+        """Serialize a report straight to disk"""
+        json_utils.dump(report, filepath, indent=True)
+    
+    def _write_report_async(self, filepath: str, report: Dict, outcome: Dict):
+        """Background worker for export_reports; records any error in outcome"""
+        try:
+            self._write_report(filepath, report)
+        except Exception as e:
+            self.logger.error(f"Error writing report: {e}")
+            outcome['error'] = e
+    
+    def _report_write_status(self, wait: bool = False):
+        """Print the outcome of the last background report write once it has finished"""
+        if self._report_write is None:
+            return
+        writer, filepath, outcome = self._report_write
+        if wait:
+            writer.join()
+        if writer.is_alive():
+            print(f"{Colors.OKBLUE}[*] Still writing report to: {filepath}{Colors.ENDC}")
+            return
+        self._report_write = None
+        if 'error' in outcome:
+            print(f"{Colors.FAIL}[!] Error writing report {filepath}: {outcome['error']}{Colors.ENDC}")
+        else:
+            print(f"{Colors.OKGREEN}[+] Report exported to: {filepath}{Colors.ENDC}")
     
     def _view_team_members(self):
         """View all team members"""
@@ -240,7 +380,7 @@ class CollaborationMenu(Menu):
         
         # In a real implementation, this would query the database
         print(f"{Colors.WARNING}[!] Team member viewing not fully implemented{Colors.ENDC}")
-        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+        _read_line(PROMPT_CONTINUE)
     
     def _add_team_member(self):
         """Add a new team member"""
@@ -255,7 +395,7 @@ class CollaborationMenu(Menu):
         print("2. Pentester")
         print("3. Viewer")
         
-        role_choice = input(f"\n{Colors.WARNING}Choice: {Colors.ENDC}")
+        role_choice = _read_line(PROMPT_CHOICE)
         role_map = {"1": "admin", "2": "pentester", "3": "viewer"}
         role = role_map.get(role_choice, "pentester")
         
@@ -270,18 +410,20 @@ class CollaborationMenu(Menu):
             self.logger.error(f"Error adding team member: {e}")
             print(f"{Colors.FAIL}[!] Error adding team member: {e}{Colors.ENDC}")
             
-        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+        _read_line(PROMPT_CONTINUE)
     
     def _select_current_user(self):
         """Select current user (simplified for demo)"""
         clear_screen()
         print(f"\n{Colors.HEADER}=== Select Current User ==={Colors.ENDC}\n")
         
-        # For demo purposes, create a default user
+        # For demo purposes, reuse or create a default user
         try:
-            self.current_user = self.collab_manager.add_team_member(
-                "demo_user", "demo@chromsploit.com", "pentester"
-            )
+            self.current_user = self.collab_manager.get_team_member_by_email("demo@chromsploit.com")
+            if not self.current_user:
+                self.current_user = self.collab_manager.add_team_member(
+                    "demo_user", "demo@chromsploit.com", "pentester"
+                )
             print(f"{Colors.OKGREEN}[+] Logged in as: {self.current_user.username}{Colors.ENDC}")
         except:
             # User might already exist
@@ -295,7 +437,7 @@ class CollaborationMenu(Menu):
             )
             print(f"{Colors.OKGREEN}[+] Using demo user: {self.current_user.username}{Colors.ENDC}")
             
-        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+        _read_line(PROMPT_CONTINUE)
     
     def _view_projects(self):
         """View all projects"""
@@ -304,13 +446,13 @@ class CollaborationMenu(Menu):
         
         # In a real implementation, this would query the database
         print(f"{Colors.WARNING}[!] Project viewing not fully implemented{Colors.ENDC}")
-        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+        _read_line(PROMPT_CONTINUE)
     
     def _create_project(self):
         """Create a new project"""
         if not self.current_user:
             print(f"{Colors.FAIL}[!] Please select a user first{Colors.ENDC}")
-            input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+            _read_line(PROMPT_CONTINUE)
             return
             
         clear_screen()
@@ -342,14 +484,14 @@ class CollaborationMenu(Menu):
             self.logger.error(f"Error creating project: {e}")
             print(f"{Colors.FAIL}[!] Error creating project: {e}{Colors.ENDC}")
             
-        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+        _read_line(PROMPT_CONTINUE)
     
     def _select_current_project(self):
         """Select current project (simplified)"""
         # For demo, use the created project or create a default one
         if not self.current_user:
             print(f"{Colors.FAIL}[!] Please select a user first{Colors.ENDC}")
-            input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+            _read_line(PROMPT_CONTINUE)
             return
             
         if not self.current_project:
@@ -369,7 +511,7 @@ class CollaborationMenu(Menu):
         else:
             print(f"{Colors.OKGREEN}[+] Current project: {self.current_project.name}{Colors.ENDC}")
             
-        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+        _read_line(PROMPT_CONTINUE)
     
     def _view_findings(self):
         """View project findings"""
@@ -382,32 +524,35 @@ class CollaborationMenu(Menu):
             if not findings:
                 print(f"{Colors.WARNING}[!] No findings yet{Colors.ENDC}")
             else:
+                lines = []
                 for i, finding in enumerate(findings, 1):
-                    severity_color = self._get_severity_color(finding.severity)
-                    status_color = self._get_status_color(finding.status)
+                    severity_color = _severity_color(finding.severity)
+                    status_color = _status_color(finding.status)
                     
-                    print(f"{Colors.OKBLUE}[{i}]{Colors.ENDC} {finding.title}")
-                    print(f"    Severity: {severity_color}{finding.severity.upper()}{Colors.ENDC}")
-                    print(f"    Status: {status_color}{finding.status}{Colors.ENDC}")
+                    lines.append(f"{Colors.OKBLUE}[{i}]{Colors.ENDC} {finding.title}")
+                    lines.append(f"    Severity: {severity_color}{finding.severity.upper()}{Colors.ENDC}")
+                    lines.append(f"    Status: {status_color}{finding.status}{Colors.ENDC}")
                     if finding.cve_id:
-                        print(f"    CVE: {Colors.WARNING}{finding.cve_id}{Colors.ENDC}")
-                    print(f"    Created: {finding.created_at.strftime('%Y-%m-%d %H:%M')}")
-                    print(f"    Description: {finding.description[:100]}...")
+                        lines.append(f"    CVE: {Colors.WARNING}{finding.cve_id}{Colors.ENDC}")
+                    lines.append(f"    Created: {finding.created_at.strftime('%Y-%m-%d %H:%M')}")
+                    lines.append(f"    Description: {self._shorten(finding.description)}")
                     if finding.comments:
-                        print(f"    Comments: {len(finding.comments)}")
-                    print()
+                        lines.append(f"    Comments: {len(finding.comments)}")
+                    lines.append("")
                     
+                sys.stdout.write("\n".join(lines) + "\n")
+                
         except Exception as e:
             self.logger.error(f"Error viewing findings: {e}")
             print(f"{Colors.FAIL}[!] Error viewing findings: {e}{Colors.ENDC}")
             
-        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+        _read_line(PROMPT_CONTINUE)
     
     def _add_finding(self):
         """Add a new finding"""
         if not self.current_user:
             print(f"{Colors.FAIL}[!] Please select a user first{Colors.ENDC}")
-            input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+            _read_line(PROMPT_CONTINUE)
             return
             
         clear_screen()
@@ -423,7 +568,7 @@ class CollaborationMenu(Menu):
         print("4. Low")
         print("5. Info")
         
-        severity_choice = input(f"\n{Colors.WARNING}Choice: {Colors.ENDC}")
+        severity_choice = _read_line(PROMPT_CHOICE)
         severity_map = {
             "1": "critical",
             "2": "high",
@@ -454,19 +599,19 @@ class CollaborationMenu(Menu):
             self.logger.error(f"Error adding finding: {e}")
             print(f"{Colors.FAIL}[!] Error adding finding: {e}{Colors.ENDC}")
             
-        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+        _read_line(PROMPT_CONTINUE)
     
     def _update_finding_status(self):
         """Update finding status"""
         # Simplified implementation
         print(f"{Colors.WARNING}[!] Finding status update not fully implemented{Colors.ENDC}")
-        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+        _read_line(PROMPT_CONTINUE)
     
     def _add_comment(self):
         """Add comment to finding"""
         # Simplified implementation
         print(f"{Colors.WARNING}[!] Comment functionality not fully implemented{Colors.ENDC}")
-        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+        _read_line(PROMPT_CONTINUE)
     
     def _view_my_tasks(self):
         """View user's tasks"""
@@ -479,29 +624,32 @@ class CollaborationMenu(Menu):
             if not tasks:
                 print(f"{Colors.WARNING}[!] No tasks assigned{Colors.ENDC}")
             else:
+                lines = []
                 for i, task in enumerate(tasks, 1):
-                    priority_color = self._get_priority_color(task.priority)
-                    status_color = self._get_status_color(task.status)
+                    priority_color = _priority_color(task.priority)
+                    status_color = _status_color(task.status)
                     
-                    print(f"{Colors.OKBLUE}[{i}]{Colors.ENDC} {task.title}")
-                    print(f"    Priority: {priority_color}{task.priority.upper()}{Colors.ENDC}")
-                    print(f"    Status: {status_color}{task.status}{Colors.ENDC}")
+                    lines.append(f"{Colors.OKBLUE}[{i}]{Colors.ENDC} {task.title}")
+                    lines.append(f"    Priority: {priority_color}{task.priority.upper()}{Colors.ENDC}")
+                    lines.append(f"    Status: {status_color}{task.status}{Colors.ENDC}")
                     if task.due_date:
-                        print(f"    Due: {task.due_date.strftime('%Y-%m-%d')}")
-                    print(f"    Description: {task.description[:100]}...")
-                    print()
+                        lines.append(f"    Due: {task.due_date.strftime('%Y-%m-%d')}")
+                    lines.append(f"    Description: {self._shorten(task.description)}")
+                    lines.append("")
                     
+                sys.stdout.write("\n".join(lines) + "\n")
+                
         except Exception as e:
             self.logger.error(f"Error viewing tasks: {e}")
             print(f"{Colors.FAIL}[!] Error viewing tasks: {e}{Colors.ENDC}")
             
-        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+        _read_line(PROMPT_CONTINUE)
     
     def _assign_task(self):
         """Assign a new task"""
         if not self.current_user or not self.current_project:
             print(f"{Colors.FAIL}[!] Please select a user and project first{Colors.ENDC}")
-            input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+            _read_line(PROMPT_CONTINUE)
             return
             
         clear_screen()
@@ -518,7 +666,7 @@ class CollaborationMenu(Menu):
         print("2. Medium")
         print("3. Low")
         
-        priority_choice = input(f"\n{Colors.WARNING}Choice: {Colors.ENDC}")
+        priority_choice = _read_line(PROMPT_CHOICE)
         priority_map = {"1": "high", "2": "medium", "3": "low"}
         priority = priority_map.get(priority_choice, "medium")
         
@@ -541,60 +689,35 @@ class CollaborationMenu(Menu):
             self.logger.error(f"Error assigning task: {e}")
             print(f"{Colors.FAIL}[!] Error assigning task: {e}{Colors.ENDC}")
             
-        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+        _read_line(PROMPT_CONTINUE)
     
     def _update_task_status(self):
         """Update task status"""
         # Simplified implementation
         print(f"{Colors.WARNING}[!] Task status update not fully implemented{Colors.ENDC}")
-        input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+        _read_line(PROMPT_CONTINUE)
     
-    def _get_severity_color(self, severity: str) -> str:
-        """Get color for severity level"""
-        colors = {
-            "critical": Colors.FAIL,
-            "high": Colors.WARNING,
-            "medium": Colors.OKBLUE,
-            "low": Colors.OKGREEN,
-            "info": Colors.ENDC
-        }
-        return colors.get(severity, Colors.ENDC)
-    
-    def _get_status_color(self, status: str) -> str:
-        """Get color for status"""
-        colors = {
-            "open": Colors.FAIL,
-            "in_progress": Colors.WARNING,
-            "resolved": Colors.OKGREEN,
-            "completed": Colors.OKGREEN,
-            "blocked": Colors.FAIL,
-            "pending": Colors.OKBLUE
-        }
-        return colors.get(status, Colors.ENDC)
-    
-    def _get_priority_color(self, priority: str) -> str:
-        """Get color for priority"""
-        colors = {
-            "high": Colors.FAIL,
-            "medium": Colors.WARNING,
-            "low": Colors.OKGREEN
-        }
-        return colors.get(priority, Colors.ENDC)
+    def _format_activity(self, activity: Dict, now: datetime) -> str:
+        """Render one activity entry, details included, followed by a blank line"""
+        time_ago = self._format_time_ago(activity['timestamp'], now)
+        action_color = _action_color(activity['action'])
+        block = f"{action_color}[{time_ago}]{Colors.ENDC} {activity['username']} {_humanize_action(activity['action'])}\n"
+        
+        if activity['details']:
+            block += "".join(f"    {key}: {value}\n" for key, value in activity['details'].items())
+        return block
     
-    def _get_action_color(self, action: str) -> str:
-        """Get color for action type"""
-        if "created" in action:
-            return Colors.OKGREEN
-        elif "updated" in action:
-            return Colors.WARNING
-        elif "deleted" in action:
-            return Colors.FAIL
-        else:
-            return Colors.OKBLUE
+    @staticmethod
+    def _shorten(text: str, width: int = 100) -> str:
+        """Truncate text to width, only copying it when it is too long"""
+        if len(text) <= width:
+            return text
+        return text[:width] + "..."
     
-    def _format_time_ago(self, dt: datetime) -> str:
-        """Format datetime as time ago"""
-        now = datetime.now()
+    def _format_time_ago(self, dt: datetime, now: Optional[datetime] = None) -> str:
+        """Format datetime as time ago, relative to `now` (defaults to the current time)"""
+        if now is None:
+            now = datetime.now()
         diff = now - dt
         
         if diff.days > 0:
